@@ -0,0 +1,114 @@
+"""
+Event-loop lag under concurrent repository load.
+
+A ticker coroutine sleeps in short intervals and records how late it wakes up, while simulated
+users load and save their conversations concurrently. "inline" calls Chroma directly on the event
+loop (the old behaviour); "adapter" goes through ChromaRepositoryAdapter. Lag should stay flat
+for the adapter as --users grows, while inline lag grows with the load.
+
+    uv run python -m benchmarks.repository_event_loop_lag --users 32 --turns 10 --history 200
+"""
+
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+
+from src.a_domain.model.conversation import Conversation
+from src.a_domain.model.message import Message, MessageRole
+from src.c_infrastructure.config.loader import load_settings
+from src.c_infrastructure.persistence.chroma import chroma_repository
+from src.c_infrastructure.persistence.chroma.chroma_repository import ChromaRepositoryAdapter
+from src.c_infrastructure.services.logger_service import LoggerService
+
+TICK_SECONDS = 0.005
+
+Load = Callable[[str], Awaitable[Conversation | None]]
+Save = Callable[[Conversation], Awaitable[object]]
+
+
+def seed_conversation(user_id: str, history: int) -> Conversation:
+    messages = tuple(
+        Message(role=MessageRole.USER if i % 2 == 0 else MessageRole.ASSISTANT, content=f"message {i} " * 20)
+        for i in range(history)
+    )
+    return Conversation(user_id=user_id, messages=messages)
+
+
+async def measure_lag(stop: asyncio.Event, lags: list[float]) -> None:
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(TICK_SECONDS)
+        lags.append(time.perf_counter() - started - TICK_SECONDS)
+
+
+async def simulate_user(load: Load, save: Save, user_id: str, turns: int) -> None:
+    for turn in range(turns):
+        conversation = await load(user_id)
+        assert conversation is not None
+        await save(conversation.add_message(Message(role=MessageRole.USER, content=f"turn {turn}")))
+
+
+async def run(mode: str, load: Load, save: Save, users: int, turns: int, history: int) -> None:
+    for i in range(users):
+        await save(seed_conversation(f"user-{i}", history))
+
+    stop = asyncio.Event()
+    lags: list[float] = []
+    ticker = asyncio.create_task(measure_lag(stop, lags))
+    started = time.perf_counter()
+    await asyncio.gather(*(simulate_user(load, save, f"user-{i}", turns) for i in range(users)))
+    elapsed = time.perf_counter() - started
+    stop.set()
+    await ticker
+
+    lags_ms = sorted(lag * 1000 for lag in lags) or [0.0]
+    p99 = lags_ms[min(len(lags_ms) - 1, int(len(lags_ms) * 0.99))]
+    print(
+        f"{mode:>8} | {users * turns / elapsed:8.1f} turns/s | loop lag p50 {statistics.median(lags_ms):8.2f} ms"
+        f" | p99 {p99:8.2f} ms | max {lags_ms[-1]:8.2f} ms"
+    )
+
+
+async def run_inline(path: Path, users: int, turns: int, history: int) -> None:
+    # The worker-process functions, called in this process on the event loop.
+    chroma_repository._open_collection(str(path))
+    limit = load_settings().conversation_history_limit
+
+    async def load(user_id: str) -> Conversation | None:
+        return chroma_repository._get(user_id, limit)
+
+    async def save(conversation: Conversation) -> None:
+        chroma_repository._upsert(conversation)
+
+    await run("inline", load, save, users, turns, history)
+
+
+async def run_adapter(path: Path, users: int, turns: int, history: int) -> None:
+    config = load_settings().model_copy(update={"chroma_persist_path": str(path)})
+    repository = ChromaRepositoryAdapter(config=config, logger=LoggerService(level="WARNING"))
+    await repository.warm_up()
+    await run("adapter", repository.get_conversation_by_user_id, repository.save, users, turns, history)
+    for operation in repository.stats().operations:
+        print(f"         | {operation}")
+    await repository.aclose()
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=32)
+    parser.add_argument("--turns", type=int, default=10)
+    parser.add_argument("--history", type=int, default=200, help="messages already stored per user")
+    args = parser.parse_args()
+
+    print(f"{args.users} users x {args.turns} turns, {args.history} stored messages each")
+    with tempfile.TemporaryDirectory() as root:
+        await run_inline(Path(root) / "inline", args.users, args.turns, args.history)
+        await run_adapter(Path(root) / "adapter", args.users, args.turns, args.history)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,128 @@
+"""
+Several worker processes writing to the same users through RedisRepositoryAdapter.
+
+Each process stands in for one uvicorn worker (or node): it loads a user's conversation, appends a
+turn and saves it, for every user, --turns times, all processes at once. At the end every turn must
+be stored exactly once; optimistic concurrency retries the saves that raced instead of losing them.
+
+Without --url a local stand-in server (fakeredis, a dev dependency) is started in this process.
+--serve only runs the stand-in, e.g. for `database_provider: redis` against a local app.
+
+    uv run python -m benchmarks.shared_repository_writers --workers 4 --users 16 --turns 10
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import threading
+import time
+from collections import Counter
+
+from redis.asyncio import Redis
+
+from src.a_domain.model.conversation import Conversation
+from src.a_domain.model.message import Message, MessageRole
+from src.c_infrastructure.config.loader import load_settings
+from src.c_infrastructure.persistence.redis.redis_repository import RedisRepositoryAdapter
+from src.c_infrastructure.services.logger_service import LoggerService
+
+KEY_PREFIX = "bench_shared_repository"
+
+
+def create_repository(url: str, history_limit: int) -> RedisRepositoryAdapter:
+    config = load_settings().model_copy(
+        update={"redis_url": url, "redis_key_prefix": KEY_PREFIX, "conversation_history_limit": history_limit}
+    )
+    return RedisRepositoryAdapter(config=config, logger=LoggerService(level="WARNING"))
+
+
+def start_standin(host: str, port: int) -> None:
+    from fakeredis import TcpFakeServer
+
+    server = TcpFakeServer((host, port))
+    threading.Thread(target=server.serve_forever, daemon=True, name="redis-standin").start()
+
+
+async def reset(url: str) -> None:
+    client = Redis.from_url(url)
+    keys = [key async for key in client.scan_iter(match=f"{KEY_PREFIX}:*")]
+    if keys:
+        await client.delete(*keys)
+    await client.aclose()
+
+
+async def write_turns(url: str, worker: int, users: int, turns: int) -> tuple[int, int]:
+    repository = create_repository(url, history_limit=20)
+    failed = 0
+    for turn in range(turns):
+        for user in range(users):
+            user_id = f"user-{user}"
+            conversation = await repository.get_conversation_by_user_id(user_id) or Conversation(user_id=user_id)
+            message = Message(role=MessageRole.USER, content=f"worker {worker} turn {turn}")
+            failed += not await repository.save(conversation.add_message(message))
+    conflicts = repository._conflicts
+    await repository.aclose()
+    return conflicts, failed
+
+
+def run_worker(url: str, worker: int, users: int, turns: int, results: "multiprocessing.Queue") -> None:
+    results.put(asyncio.run(write_turns(url, worker, users, turns)))
+
+
+async def verify(url: str, workers: int, users: int, turns: int) -> int:
+    repository = create_repository(url, history_limit=0)
+    missing = 0
+    for user in range(users):
+        conversation = await repository.get_conversation_by_user_id(f"user-{user}")
+        stored = Counter(message.content for message in conversation.messages) if conversation else Counter()
+        expected = {f"worker {worker} turn {turn}" for worker in range(workers) for turn in range(turns)}
+        missing += sum(1 for content in expected if stored[content] != 1) + (sum(stored.values()) - len(expected))
+    await repository.aclose()
+    return missing
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", help="Redis-protocol server; a local stand-in is started when omitted")
+    parser.add_argument("--port", type=int, default=6390, help="port of the local stand-in")
+    parser.add_argument("--serve", action="store_true", help="only run the local stand-in server")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--users", type=int, default=16)
+    parser.add_argument("--turns", type=int, default=10)
+    args = parser.parse_args()
+
+    url = args.url
+    if url is None:
+        start_standin("127.0.0.1", args.port)
+        url = f"redis://127.0.0.1:{args.port}/0"
+    if args.serve:
+        print(f"Redis stand-in listening on {url}. Ctrl+C to stop.")
+        threading.Event().wait()
+
+    asyncio.run(reset(url))
+    context = multiprocessing.get_context("spawn")
+    results = context.Queue()
+    processes = [
+        context.Process(target=run_worker, args=(url, worker, args.users, args.turns, results))
+        for worker in range(args.workers)
+    ]
+    started = time.perf_counter()
+    for process in processes:
+        process.start()
+    outcomes = [results.get() for _ in processes]
+    for process in processes:
+        process.join()
+    elapsed = time.perf_counter() - started
+
+    conflicts = sum(conflict for conflict, _ in outcomes)
+    failed = sum(fail for _, fail in outcomes)
+    wrong = asyncio.run(verify(url, args.workers, args.users, args.turns))
+    total = args.workers * args.users * args.turns
+    print(
+        f"{args.workers} workers x {args.users} users x {args.turns} turns | {total / elapsed:8.1f} saves/s"
+        f" | conflicts retried {conflicts} | failed saves {failed} | lost or duplicated turns {wrong}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,9 @@
 from dataclasses import dataclass, field, replace
-from datetime import datetime, timezone
+from datetime import UTC, datetime
 from uuid import UUID, uuid4
 
 from src.a_domain.model.message import Message
+from src.a_domain.types.enums import MessageRole
 
 
 @dataclass(frozen=True)
@@ -11,21 +12,55 @@ class Conversation:
     id: UUID = field(default_factory=uuid4)
     selected_model_name: str | None = None
     messages: tuple[Message, ...] = field(default_factory=tuple)
-    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
-    updated_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    summary: str | None = None
+    summary_through: UUID | None = None  # id of the newest message already folded into summary
+    created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    updated_at: datetime = field(default_factory=lambda: datetime.now(UTC))
 
     def add_message(self, message: Message):
         """ """
         new_messages = self.messages + (message,)
-        return replace(self, messages=new_messages, updated_at=datetime.now(timezone.utc))
+        return replace(self, messages=new_messages, updated_at=datetime.now(UTC))
 
     def add_messages(self, messages: list[Message] | tuple[Message, ...]):
         """ """
         new_messages = self.messages + tuple(messages)
-        return replace(self, messages=new_messages, updated_at=datetime.now(timezone.utc))
+        return replace(self, messages=new_messages, updated_at=datetime.now(UTC))
 
     def clear_history(self):
         """
         clean message history, but keep user's conversation stage.
         """
-        return replace(self, messages=tuple(), updated_at=datetime.now(timezone.utc))
+        return replace(self, messages=tuple(), summary=None, summary_through=None, updated_at=datetime.now(UTC))
+
+    def unsummarized_messages(self) -> tuple[Message, ...]:
+        """
+        Messages newer than summary_through; all messages when there is no summary yet.
+        """
+        if self.summary_through is None:
+            return self.messages
+        for index, message in enumerate(self.messages):
+            if message.id == self.summary_through:
+                return self.messages[index + 1 :]
+        return self.messages
+
+    def with_summary(self, summary: str, through: UUID):
+        """
+        Records a running summary covering every message up to and including `through`.
+        """
+        return replace(self, summary=summary, summary_through=through)
+
+    def recent(self, limit: int):
+        """
+        Keeps the newest `limit` messages plus every older system message and the summary boundary,
+        the same view the repositories load. A limit of 0 keeps everything.
+        """
+        if limit <= 0 or len(self.messages) <= limit:
+            return self
+        start = len(self.messages) - limit
+        for index, message in enumerate(self.messages[:start]):
+            if message.id == self.summary_through:
+                start = index
+                break
+        older_system = tuple(m for m in self.messages[:start] if m.role == MessageRole.SYSTEM)
+        return replace(self, messages=older_system + self.messages[start:])
@@ -0,0 +1,10 @@
+from dataclasses import dataclass
+
+from src.a_domain.model.ai_provider import AIModel
+
+
+@dataclass(frozen=True)
+class ProviderHealth:
+    model: AIModel
+    available: bool
+    avg_time_to_first_token: float | None = None  # None until the model has answered at least once
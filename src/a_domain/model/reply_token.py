@@ -0,0 +1,16 @@
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+
+
+@dataclass(frozen=True)
+class ReplyToken:
+    """
+    Single-use token that lets the platform answer an inbound event directly.
+    """
+
+    value: str
+    issued_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+
+    def is_valid(self, ttl_seconds: float, now: datetime | None = None) -> bool:
+        now = now or datetime.now(UTC)
+        return (now - self.issued_at).total_seconds() < ttl_seconds
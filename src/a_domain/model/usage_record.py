@@ -0,0 +1,27 @@
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+
+from src.a_domain.types.enums import AiProvider
+
+
+@dataclass(frozen=True)
+class TokenUsage:
+    prompt_tokens: int
+    completion_tokens: int
+
+
+@dataclass(frozen=True, kw_only=True)
+class UsageRecord:
+    """Tokens, latency and cost of one model call."""
+
+    user_id: str | None
+    provider: AiProvider
+    model_name: str
+    prompt_tokens: int
+    completion_tokens: int
+    estimated: bool  # True when the provider reported no usage and tokens were estimated
+    aborted: bool  # True when the stream was closed or failed before it completed
+    time_to_first_token: float
+    total_seconds: float
+    cost_usd: float | None  # None when no price is configured for the model
+    at: datetime = field(default_factory=lambda: datetime.now(UTC))
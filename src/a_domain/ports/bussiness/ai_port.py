@@ -1,3 +1,4 @@
+from collections.abc import AsyncIterator
 from typing import Protocol
 
 from src.a_domain.model.message import Message
@@ -5,3 +6,9 @@ from src.a_domain.model.message import Message
 
 class AiPort(Protocol):
     async def generate_reply(self, messages: tuple[Message, ...]) -> Message: ...
+
+    def stream_reply(self, messages: tuple[Message, ...]) -> AsyncIterator[str]:
+        """
+        Yields the assistant reply as text deltas while the model is still generating.
+        """
+        ...
@@ -0,0 +1,15 @@
+from typing import Protocol
+
+from src.a_domain.model.ai_provider import AIModel
+from src.a_domain.model.provider_health import ProviderHealth
+from src.a_domain.ports.bussiness.ai_port import AiPort
+
+
+class AiRegistryPort(Protocol):
+    def adapter_for(self, model: AIModel) -> AiPort:
+        """
+        Returns the (cached) adapter that answers with the given model first.
+        """
+        ...
+
+    def health(self, model: AIModel) -> ProviderHealth: ...
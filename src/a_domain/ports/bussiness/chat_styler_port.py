@@ -1,3 +1,4 @@
+from collections.abc import AsyncIterator
 from typing import Protocol
 
 from src.a_domain.model.message import Message
@@ -13,3 +14,9 @@ class IChatStylerPort(Protocol):
         Takes a single assistant message and returns one or more formatted messages.
         """
         ...
+
+    def format_stream(self, deltas: AsyncIterator[str]) -> AsyncIterator[Message]:
+        """
+        Consumes streamed text deltas and yields each formatted message as soon as it is complete.
+        """
+        ...
@@ -0,0 +1,15 @@
+from typing import Protocol
+
+
+class EventDeduplicationPort(Protocol):
+    async def mark_seen(self, event_id: str) -> bool:
+        """
+        Records an inbound event id. Returns True the first time it is seen, False for a duplicate.
+        """
+        ...
+
+    async def forget(self, event_id: str) -> None:
+        """
+        Removes a recorded event id, so a redelivery of an event that could not be accepted is processed.
+        """
+        ...
@@ -4,4 +4,24 @@ from src.a_domain.model.message import Message
 
 
 class PlatformPort(Protocol):
+    @property
+    def max_messages_per_request(self) -> int: ...
+
     async def send_message(self, user_id: str, message: Message) -> bool: ...
+
+    async def send_messages(self, user_id: str, messages: tuple[Message, ...]) -> tuple[bool, ...]:
+        """
+        Pushes messages in order, packing up to max_messages_per_request into each request.
+        Returns one success flag per request (batch).
+        """
+        ...
+
+    async def reply_messages(self, reply_token: str, messages: tuple[Message, ...]) -> bool:
+        """
+        Answers an inbound event with up to max_messages_per_request messages. Returns False if the token was rejected.
+        """
+        ...
+
+    async def warm_up(self) -> None:
+        """Opens the platform connection ahead of the first delivery. Raises if the platform rejects the credentials."""
+        ...
@@ -7,3 +7,11 @@ class RepositoryPort(Protocol):
     async def get_conversation_by_user_id(self, user_id: str) -> Conversation | None: ...
 
     async def save(self, conversation: Conversation) -> bool: ...
+
+    async def warm_up(self) -> None:
+        """Opens the backing store ahead of the first request."""
+        ...
+
+    async def aclose(self) -> None:
+        """Releases connections and threads. Called once at shutdown."""
+        ...
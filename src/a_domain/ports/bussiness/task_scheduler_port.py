@@ -0,0 +1,11 @@
+from collections.abc import Awaitable, Callable
+from typing import Protocol
+
+
+class TaskSchedulerPort(Protocol):
+    def submit(self, job: Callable[[], Awaitable[None]], name: str = "job", key: str | None = None) -> bool:
+        """
+        Runs the job in the background. Jobs sharing a key run one at a time, in order.
+        Returns False when the job was rejected.
+        """
+        ...
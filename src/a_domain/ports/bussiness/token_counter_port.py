@@ -0,0 +1,19 @@
+from collections.abc import Iterable
+from typing import Protocol
+
+from src.a_domain.model.ai_provider import AIModel
+from src.a_domain.model.message import Message
+
+
+class TokenCounterPort(Protocol):
+    def count_message(self, message: Message, model: AIModel) -> int:
+        """
+        Returns the number of prompt tokens the message costs for the given model, including per-message overhead.
+        """
+        ...
+
+    def count_messages(self, messages: Iterable[Message], model: AIModel) -> int:
+        """
+        Returns the number of prompt tokens the messages cost together for the given model.
+        """
+        ...
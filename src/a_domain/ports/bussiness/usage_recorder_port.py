@@ -0,0 +1,7 @@
+from typing import Protocol
+
+from src.a_domain.model.usage_record import UsageRecord
+
+
+class UsageRecorderPort(Protocol):
+    def record(self, record: UsageRecord) -> None: ...
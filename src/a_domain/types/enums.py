@@ -1,4 +1,4 @@
-from enum import StrEnum
+from enum import IntEnum, StrEnum
 
 
 class MessageRole(StrEnum):
@@ -7,6 +7,11 @@ class MessageRole(StrEnum):
     SYSTEM = "system"
 
 
+class DeliveryPath(StrEnum):
+    REPLY = "reply"
+    PUSH = "push"
+
+
 class AiProvider(StrEnum):
     OPENAI = "openai"
     GROK = "grok"
@@ -17,3 +22,23 @@ class AiProvider(StrEnum):
 class DatabaseProvider(StrEnum):
     MEMORY = "memory"
     CHROMA = "chroma"
+    SQLITE = "sqlite"
+    REDIS = "redis"
+
+
+class EventDedupProvider(StrEnum):
+    MEMORY = "memory"
+    SQLITE = "sqlite"
+
+
+class CircuitState(StrEnum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class RequestPriority(IntEnum):
+    """Lower values are admitted first when a provider is saturated."""
+
+    INTERACTIVE = 0
+    BACKGROUND = 1
@@ -4,7 +4,7 @@ from pathlib import Path
 
 from pydantic import computed_field, Field, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from src.a_domain.types.enums import AiProvider, DatabaseProvider
+from src.a_domain.types.enums import AiProvider, DatabaseProvider, EventDedupProvider
 
 
 class AppConfig(BaseSettings):
@@ -42,6 +42,60 @@ class AppConfig(BaseSettings):
     ai_model_connection_timeout: int = Field(
         default=60, description="Timeout in seconds for AI model connections."
     )
+    ai_failover_enabled: bool = Field(
+        default=True,
+        description="Fall back to the other providers in available_models (in order) when the active one fails.",
+    )
+    ai_first_token_timeout_seconds: float = Field(
+        default=20.0, gt=0, description="Seconds to wait for a provider's first token before failing over."
+    )
+    ai_hedge_after_seconds: float = Field(
+        default=0.0,
+        ge=0,
+        description="Start the next provider in parallel when the first token takes longer than this (0 disables).",
+    )
+    ai_breaker_enabled: bool = Field(
+        default=True, description="Wrap each provider in a circuit breaker that fails fast while it is unhealthy."
+    )
+    ai_breaker_window: int = Field(default=20, ge=1, description="Recent calls considered by each circuit breaker.")
+    ai_breaker_min_calls: int = Field(
+        default=5, ge=1, description="Calls needed in the window before a circuit breaker may trip."
+    )
+    ai_breaker_failure_rate: float = Field(
+        default=0.5, gt=0, le=1, description="Share of failed calls that opens the circuit."
+    )
+    ai_breaker_slow_call_seconds: float = Field(
+        default=15.0, gt=0, description="Time to first token above which a call counts as slow."
+    )
+    ai_breaker_slow_call_rate: float = Field(
+        default=0.8, gt=0, le=1, description="Share of slow calls that opens the circuit."
+    )
+    ai_breaker_open_seconds: float = Field(
+        default=30.0, gt=0, description="How long an open circuit fails fast before a background probe is sent."
+    )
+    model_catalog_ttl_seconds: int = Field(
+        default=21600, ge=60, description="How long a provider's model list is trusted before it is refreshed."
+    )
+    model_catalog_path: str = Field(
+        default="catalog_data/models.json", description="File the model catalog is persisted to between restarts."
+    )
+    ai_max_concurrency_per_provider: int = Field(
+        default=8, ge=1, description="Default cap on concurrent completions sent to one provider."
+    )
+    ai_provider_max_concurrency: dict[AiProvider, int] = Field(
+        default_factory=dict, description="Per-provider concurrency overrides."
+    )
+    ai_provider_tokens_per_minute: dict[AiProvider, int] = Field(
+        default_factory=dict,
+        description="Per-provider token budget per rolling minute. Providers' own x-ratelimit headers tighten it further.",
+    )
+    ai_completion_tokens_estimate: int = Field(
+        default=400, ge=0, description="Completion tokens assumed per call when charging the token budget."
+    )
+    ai_model_prices_per_million: dict[str, tuple[float, float]] = Field(
+        default_factory=dict,
+        description="USD per million (prompt, completion) tokens, keyed by model id. Used for cost accounting.",
+    )
     ai_system_prompt: str | None = Field(
         default=None, description="The system prompt defining the AI personality."
     )
@@ -49,6 +103,72 @@ class AppConfig(BaseSettings):
         default=None,
         description="System prompt template for injecting web search context (supports {search_results}).",
     )
+    context_max_tokens: int = Field(
+        default=8000,
+        ge=1,
+        description="Prompt token budget: system messages plus as many of the newest turns as fit.",
+    )
+    summary_trigger_messages: int = Field(
+        default=40,
+        ge=0,
+        description="Unsummarized turns that trigger folding old history into the running summary (0 disables).",
+    )
+    summary_keep_recent_messages: int = Field(
+        default=12, ge=1, description="Newest turns always kept verbatim when the history is summarized."
+    )
+    summary_worker_count: int = Field(
+        default=1, ge=1, description="Workers making summarization model calls, separate from the webhook workers."
+    )
+    summary_queue_max_size: int = Field(
+        default=100, ge=1, description="Max pending summarization jobs; further summaries wait for a later turn."
+    )
+    summary_model_provider: AiProvider | None = Field(
+        default=None, description="Provider used for summarization. Defaults to the active model's provider."
+    )
+    summary_model_name: str | None = Field(
+        default=None, description="Cheaper model id used for summarization. Defaults to the provider's configured model."
+    )
+    summary_prompt: str = Field(
+        default=(
+            "You maintain a running summary of a chat between a user and an assistant. "
+            "Merge the previous summary with the new messages into one concise summary. "
+            "Keep facts about the user, their preferences, open questions and commitments. "
+            "Write in the language of the conversation and reply with the summary only."
+        ),
+        description="System prompt for the history summarizer.",
+    )
+    router_fast_provider: AiProvider | None = Field(
+        default=None,
+        description="Provider for short chit-chat turns (e.g. groq). Unset routes every turn to active_model.",
+    )
+    router_fast_model_name: str | None = Field(
+        default=None, description="Model id for the fast route. Defaults to the provider's entry in available_models."
+    )
+    router_fast_max_characters: int = Field(
+        default=120, ge=0, description="Longest user message that may take the fast route."
+    )
+    router_fast_max_prompt_tokens: int = Field(
+        default=3000, ge=0, description="Largest estimated prompt that may take the fast route."
+    )
+    router_fast_max_first_token_seconds: float = Field(
+        default=3.0, gt=0, description="Skip the fast route while its average time to first token is above this."
+    )
+    response_cache_enabled: bool = Field(
+        default=False, description="Answer repeated prompts (greetings, FAQs) from a cache instead of the model."
+    )
+    response_cache_ttl_seconds: int = Field(default=3600, ge=1, description="How long a cached reply stays valid.")
+    response_cache_max_entries: int = Field(
+        default=1000, ge=1, description="Max cached replies; least recently used entries are evicted first."
+    )
+    response_cache_context_messages: int = Field(
+        default=2,
+        ge=0,
+        description="Turns before the latest user message that are part of the cache key.",
+    )
+    enable_streaming_delivery: bool = Field(
+        default=False,
+        description="Send each finished paragraph to the user while the model is still generating.",
+    )
 
 
     # --------------------- Messaging Platform Configuration --------------------- #
@@ -62,6 +182,74 @@ class AppConfig(BaseSettings):
     line_channel_access_token: str | None = Field(
         default=None, description="Access token for the LINE Messaging API."
     )
+    reply_token_ttl_seconds: float = Field(
+        default=50.0,
+        ge=0,
+        description="How long an inbound reply token is trusted before falling back to push (LINE allows ~1 minute).",
+    )
+
+    # ---------------------------- Webhook Processing ---------------------------- #
+
+    webhook_worker_count: int = Field(
+        default=4, ge=1, description="Number of background workers running webhook jobs."
+    )
+    webhook_queue_max_size: int = Field(
+        default=1000, ge=1, description="Max pending webhook jobs before new events are rejected."
+    )
+    webhook_shutdown_timeout: float = Field(
+        default=30.0, ge=0, description="Seconds to wait for pending webhook jobs to drain on shutdown."
+    )
+    message_coalesce_window_seconds: float = Field(
+        default=0.0,
+        ge=0,
+        description="Quiet period that merges rapid consecutive texts from one user into a single turn (0 disables).",
+    )
+    message_coalesce_max_wait_seconds: float = Field(
+        default=5.0, ge=0, description="Upper bound on how long a burst of messages may be held back."
+    )
+    event_dedup_provider: EventDedupProvider = Field(
+        default=EventDedupProvider.MEMORY,
+        description="Seen-event cache backend. Use a shared backend when running several workers.",
+    )
+    event_dedup_ttl_seconds: int = Field(
+        default=3600, ge=1, description="How long a webhook event id is remembered for redelivery checks."
+    )
+    event_dedup_max_entries: int = Field(
+        default=10000, ge=1, description="Max event ids kept by the in-memory dedup cache."
+    )
+    event_dedup_sqlite_path: str = Field(
+        default="dedup_data/seen_events.sqlite3", description="SQLite file shared by workers for event dedup."
+    )
+
+    # ------------------------------- Outbound HTTP ------------------------------ #
+
+    http_max_connections_per_host: int = Field(
+        default=20, ge=1, description="Default connection limit for each upstream host."
+    )
+    http_host_max_connections: dict[str, int] = Field(
+        default_factory=dict, description="Per-host connection limit overrides, keyed by hostname."
+    )
+    http_max_keepalive_connections: int = Field(
+        default=10, ge=0, description="Idle keep-alive connections kept open per host."
+    )
+    http_keepalive_expiry_seconds: float = Field(
+        default=60.0, ge=0, description="Seconds an idle keep-alive connection is kept before closing."
+    )
+    http2_enabled: bool = Field(
+        default=False, description="Negotiate HTTP/2 with upstreams (requires the 'h2' package)."
+    )
+
+    # ------------------------------ Usage Accounting ---------------------------- #
+
+    usage_retention_seconds: int = Field(
+        default=86400, ge=60, description="How long per-call usage records are kept in memory for the admin API."
+    )
+    usage_max_records: int = Field(
+        default=100_000, ge=1, description="Upper bound on usage records kept in memory."
+    )
+    admin_api_token: str | None = Field(
+        default=None, description="Token required in the X-Admin-Token header for /v1/admin endpoints. Unset disables them."
+    )
 
     # --------------------------- Application Behavior --------------------------- #
 
@@ -69,6 +257,9 @@ class AppConfig(BaseSettings):
         default="INFO",
         description="Logging level for the application (e.g., 'DEBUG', 10).",
     )
+    startup_warmup_timeout_seconds: float = Field(
+        default=15.0, gt=0, description="Upper bound on each warm-up step run before the service reports ready."
+    )
     enable_web_search: bool = Field(
         default=False, description="Enable native web search for supported models."
     )
@@ -81,6 +272,10 @@ class AppConfig(BaseSettings):
     web_search_max_results: int = Field(
         default=2, ge=1, le=5, description="Max sources to retrieve per search."
     )
+    web_search_trigger_keywords: set[str] = Field(
+        default={"latest", "recent", "news", "current", "today", "stock", "weather", "時事", "今天", "最新", "新聞", "查詢"},
+        description="Keywords marking a message as time-sensitive: it triggers web search and bypasses the response cache.",
+    )
     web_search_allowed_domains: set[str] | None = Field(default=None)
     web_search_excluded_domains: set[str] | None = Field(default=None)
     x_search_allowed_handles: set[str] | None = Field(default=None)
@@ -95,6 +290,48 @@ class AppConfig(BaseSettings):
     chroma_persist_path: str = Field(
         default="chroma_db", description="Path to store ChromaDB data locally."
     )
+    sqlite_repository_path: str = Field(
+        default="conversation_data/conversations.sqlite3",
+        description="SQLite file for the sqlite provider, relative to the project root.",
+    )
+    sqlite_repository_workers: int = Field(
+        default=4, ge=1, description="Threads (each with its own connection) running SQLite repository I/O."
+    )
+    redis_url: str = Field(
+        default="redis://localhost:6379/0",
+        description="Redis-protocol server shared by every worker and node when database_provider is redis.",
+    )
+    redis_key_prefix: str = Field(
+        default="chat_friend", description="Prefix of every conversation key, so several deployments can share a server."
+    )
+    redis_max_connections: int = Field(
+        default=50, ge=1, description="Connections each worker process may open to the Redis server."
+    )
+    redis_socket_timeout_seconds: float = Field(
+        default=5.0, gt=0, description="Connect and read timeout for Redis commands."
+    )
+    redis_max_write_retries: int = Field(
+        default=5, ge=1, description="Attempts to save a conversation that other workers keep changing concurrently."
+    )
+    conversation_cache_enabled: bool = Field(
+        default=False,
+        description="Keep hot conversations in memory and write them back in batches. Single worker only; "
+        "up to one flush interval of turns is lost if the process is killed.",
+    )
+    conversation_cache_max_entries: int = Field(
+        default=1000, ge=1, description="Conversations kept in memory; least recently used clean ones are evicted."
+    )
+    conversation_cache_flush_interval_seconds: float = Field(
+        default=2.0, gt=0, description="How often dirty conversations are written to the repository."
+    )
+    conversation_cache_flush_max_dirty: int = Field(
+        default=50, ge=1, description="Dirty conversations that trigger a flush before the interval elapses."
+    )
+    conversation_history_limit: int = Field(
+        default=200,
+        ge=0,
+        description="Newest messages loaded per conversation; system messages and the summary boundary are always kept (0 loads all).",
+    )
 
     reset_commands: set[str] = Field(
         default={"clear"},
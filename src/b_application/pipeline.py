@@ -1,41 +1,124 @@
+from dataclasses import replace
+
+from src.a_domain.model.ai_provider import AIModel
+from src.a_domain.model.conversation import Conversation
 from src.a_domain.model.message import Message, MessageRole
+from src.a_domain.model.reply_token import ReplyToken
+from src.a_domain.ports.notification.logging_port import ILoggingPort
 from src.b_application.configuration.schemas import AppConfig
+from src.b_application.request_context import request_scope
 from src.b_application.use_cases.collect.context_loader import ContextLoader
-from src.b_application.use_cases.process.ai_processor import AiProcessor
+from src.b_application.use_cases.collect.context_window import ContextWindowBuilder
+from src.b_application.use_cases.process.ai_processor import AiProcessor, StreamInterruptedError
+from src.b_application.use_cases.process.model_router import ModelRouter
 from src.b_application.use_cases.ship.dispatcher import Dispatcher
 from src.b_application.use_cases.ship.state_manager import StateManager
+from src.b_application.use_cases.ship.summarizer import ConversationSummarizer
 
 
 class Pipeline:
+    # Appended to a streamed reply saved after the stream broke off, so neither the history nor the
+    # model later mistakes the partial text for a complete answer.
+    _TRUNCATED_MARKER = " [reply interrupted]"
+
     def __init__(
         self,
         loader: ContextLoader,
+        window: ContextWindowBuilder,
+        router: ModelRouter,
         processor: AiProcessor,
         manager: StateManager,
         dispatcher: Dispatcher,
+        summarizer: ConversationSummarizer,
         config: AppConfig,
+        logger: ILoggingPort,
     ):
         self._loader = loader
+        self._window = window
+        self._router = router
         self._processor = processor
         self._manager = manager
         self._dispatcher = dispatcher
+        self._summarizer = summarizer
         self._config = config
+        self._logger = logger
+
+    def is_reset_command(self, incoming_content: str) -> bool:
+        return incoming_content.strip() in self._config.reset_commands
 
-    async def execute(self, user_id: str, incoming_content: str) -> None:
+    async def execute(self, user_id: str, incoming_content: str, reply_token: ReplyToken | None = None) -> None:
+        with request_scope(user_id):
+            await self._execute(user_id, incoming_content, reply_token)
+
+    async def _execute(self, user_id: str, incoming_content: str, reply_token: ReplyToken | None) -> None:
         conversation = await self._loader.execute(user_id)
 
-        if incoming_content.strip() in self._config.reset_commands:
+        if self.is_reset_command(incoming_content):
             await self._manager.reset_conversation(conversation)
             system_reply = Message(role=MessageRole.ASSISTANT, content="✨ 記憶已清除！我們重新開始吧。")
-            await self._dispatcher.execute(user_id, (system_reply,))
+            await self._dispatcher.execute(user_id, (system_reply,), reply_token)
             return
 
         user_message = Message(role=MessageRole.USER, content=incoming_content)
         conversation = self._manager.update_state(conversation, [user_message])
 
-        reply_messages = await self._processor.execute(conversation)
+        default_model = self._router.default_model()
+        prompt = self._window.execute(conversation, default_model)
+        model = self._router.execute(prompt)
+        if model != default_model:
+            # The router needs a prompt to decide; once it has, size the window with the chosen model's tokenizer.
+            prompt = self._window.execute(conversation, model)
+        conversation = replace(conversation, selected_model_name=model.name)
+
+        if self._config.enable_streaming_delivery:
+            reply_messages = await self._stream_replies(user_id, prompt, model, reply_token)
+            final_conversation = self._manager.update_state(conversation, list(reply_messages))
+            await self._manager.save(final_conversation)
+            self._summarizer.schedule(final_conversation)
+            return
+
+        reply_messages = await self._processor.execute(prompt, model)
 
         final_conversation = self._manager.update_state(conversation, list(reply_messages))
         await self._manager.save(final_conversation)
 
-        await self._dispatcher.execute(user_id, reply_messages)
+        await self._dispatcher.execute(user_id, reply_messages, reply_token)
+        self._summarizer.schedule(final_conversation)
+
+    async def _stream_replies(
+        self, user_id: str, prompt: Conversation, model: AIModel, reply_token: ReplyToken | None
+    ) -> tuple[Message, ...]:
+        """
+        Sends the first styled chunk as soon as it is ready, while the model is still generating. Later
+        chunks are pushed in full batches, so streaming costs no more requests than a buffered reply.
+
+        If the stream breaks off, the chunks received so far are still delivered, and the returned reply
+        ends with the truncation marker.
+        """
+        delivered: list[Message] = []
+        pending: list[Message] = []
+        try:
+            async for message in self._processor.execute_stream(prompt, model):
+                delivered.append(message)
+                pending.append(message)
+                if len(delivered) == 1 or len(pending) == self._dispatcher.max_messages_per_request:
+                    await self._dispatcher.execute(user_id, tuple(pending), reply_token)
+                    # A reply token is single-use; later chunks are pushed.
+                    reply_token = None
+                    pending.clear()
+        except StreamInterruptedError:
+            if pending:
+                await self._dispatcher.execute(user_id, tuple(pending), reply_token)
+            if not delivered:
+                self._logger.warning(f"Streamed reply for user_id: {user_id} failed before any text; nothing saved.")
+                return ()
+            self._logger.warning(
+                f"Streamed reply for user_id: {user_id} was cut off after {len(delivered)} messages; "
+                "saving it marked as truncated."
+            )
+            last = delivered[-1]
+            delivered[-1] = replace(last, content=last.content + self._TRUNCATED_MARKER)
+            return tuple(delivered)
+        if pending:
+            await self._dispatcher.execute(user_id, tuple(pending), reply_token)
+        return tuple(delivered)
@@ -0,0 +1,22 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from src.a_domain.types.enums import RequestPriority
+
+# Who the current AI call is for. Set by the use cases, read by infrastructure (rate limiting, accounting)
+# without threading the values through every AiPort call.
+current_user_id: ContextVar[str | None] = ContextVar("current_user_id", default=None)
+current_priority: ContextVar[RequestPriority] = ContextVar("current_priority", default=RequestPriority.INTERACTIVE)
+
+
+@contextmanager
+def request_scope(user_id: str, priority: RequestPriority = RequestPriority.INTERACTIVE) -> Iterator[None]:
+    # Job queue workers are long-lived tasks, so the values must be reset after each job.
+    user_token = current_user_id.set(user_id)
+    priority_token = current_priority.set(priority)
+    try:
+        yield
+    finally:
+        current_priority.reset(priority_token)
+        current_user_id.reset(user_token)
@@ -0,0 +1,61 @@
+from dataclasses import replace
+from uuid import uuid4, uuid5
+
+from src.a_domain.model.ai_provider import AIModel
+from src.a_domain.model.conversation import Conversation
+from src.a_domain.model.message import Message, MessageRole
+from src.a_domain.ports.bussiness.token_counter_port import TokenCounterPort
+from src.a_domain.ports.notification.logging_port import ILoggingPort
+from src.b_application.configuration.schemas import AppConfig
+
+
+class ContextWindowBuilder:
+    """
+    Assembles the prompt sent to the model: every system message, the running summary (if any)
+    and the newest turns that fit the token budget.
+    """
+
+    def __init__(self, token_counter: TokenCounterPort, config: AppConfig, logger: ILoggingPort):
+        self._token_counter = token_counter
+        self._config = config
+        self._logger = logger
+
+    def execute(self, conversation: Conversation, model: AIModel | None = None) -> Conversation:
+        model = model or AIModel(provider=self._config.active_model, name=self._config.active_model_name)
+        budget = self._config.context_max_tokens
+
+        system_messages = [m for m in conversation.messages if m.role == MessageRole.SYSTEM]
+        if conversation.summary:
+            # Older turns are represented by the running summary instead of their raw text.
+            system_messages.append(
+                Message(
+                    # Stable per summary version, so its token count is cached like any other message.
+                    id=uuid5(conversation.summary_through, "summary") if conversation.summary_through else uuid4(),
+                    role=MessageRole.SYSTEM,
+                    content=f"Summary of the earlier conversation:\n{conversation.summary}",
+                )
+            )
+        turns = [m for m in conversation.unsummarized_messages() if m.role != MessageRole.SYSTEM]
+
+        used = sum(self._token_counter.count_message(m, model) for m in system_messages)
+        kept: list[Message] = []
+        for message in reversed(turns):
+            cost = self._token_counter.count_message(message, model)
+            # The newest turn is always sent, even if it alone exceeds the budget.
+            if kept and used + cost > budget:
+                break
+            kept.append(message)
+            used += cost
+        kept.reverse()
+
+        # Do not open the window in the middle of an exchange with an assistant reply.
+        while len(kept) > 1 and kept[0].role == MessageRole.ASSISTANT:
+            used -= self._token_counter.count_message(kept.pop(0), model)
+
+        dropped = len(turns) - len(kept)
+        if dropped:
+            self._logger.debug(
+                f"Context window for user_id: {conversation.user_id} dropped {dropped} old messages "
+                f"({used}/{budget} tokens for {model.name})."
+            )
+        return replace(conversation, messages=tuple(system_messages + kept))
@@ -1,22 +1,40 @@
+from collections.abc import AsyncIterator
+
+from src.a_domain.model.ai_provider import AIModel
 from src.a_domain.model.conversation import Conversation
 from src.a_domain.model.message import Message
-from src.a_domain.ports.bussiness.ai_port import AiPort
+from src.a_domain.ports.bussiness.ai_registry_port import AiRegistryPort
 from src.a_domain.ports.bussiness.chat_styler_port import IChatStylerPort
 from src.a_domain.ports.notification.logging_port import ILoggingPort
 
 
+class StreamInterruptedError(RuntimeError):
+    """The model's streamed reply failed after it had started; chunks already yielded are all there is."""
+
+
 class AiProcessor:
-    def __init__(self, ai_port: AiPort, styler_port: IChatStylerPort, logger: ILoggingPort):
-        self._ai_port = ai_port
+    def __init__(self, registry: AiRegistryPort, styler_port: IChatStylerPort, logger: ILoggingPort):
+        self._registry = registry
         self._styler_port = styler_port
         self._logger = logger
 
-    async def execute(self, conversation: Conversation) -> tuple[Message, ...]:
-        self._logger.debug("Generating AI reply...")
+    async def execute(self, conversation: Conversation, model: AIModel) -> tuple[Message, ...]:
+        self._logger.debug(f"Generating AI reply with {model.name}...")
         try:
-            raw_response = await self._ai_port.generate_reply(messages=conversation.messages)
+            raw_response = await self._registry.adapter_for(model).generate_reply(messages=conversation.messages)
             styled_messages = self._styler_port.format_response(raw_response)
             return styled_messages
-        except Exception as e:
-            self._logger.error(f"Error during AI processing: {e}")
+        except Exception:
+            self._logger.exception("Error during AI processing")
             return ()
+
+    async def execute_stream(self, conversation: Conversation, model: AIModel) -> AsyncIterator[Message]:
+        """Yields styled messages as the reply streams in. Raises StreamInterruptedError if the stream fails."""
+        self._logger.debug(f"Streaming AI reply with {model.name}...")
+        try:
+            deltas = self._registry.adapter_for(model).stream_reply(messages=conversation.messages)
+            async for styled_message in self._styler_port.format_stream(deltas):
+                yield styled_message
+        except Exception as e:
+            self._logger.exception("Error during AI streaming")
+            raise StreamInterruptedError(str(e)) from e
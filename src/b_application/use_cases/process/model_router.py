@@ -0,0 +1,77 @@
+from src.a_domain.model.ai_provider import AIModel
+from src.a_domain.model.conversation import Conversation
+from src.a_domain.ports.bussiness.ai_registry_port import AiRegistryPort
+from src.a_domain.ports.bussiness.token_counter_port import TokenCounterPort
+from src.a_domain.ports.notification.logging_port import ILoggingPort
+from src.b_application.configuration.schemas import AppConfig
+from src.b_application.use_cases.process.search_policy import is_time_sensitive, latest_user_text
+
+
+class ModelRouter:
+    """
+    Picks the model for one turn.
+
+    Short, self-contained chit-chat goes to the fast model (router_fast_provider); long messages,
+    large prompts and turns that need web search stay on the active model. The fast model is
+    also skipped while it is unhealthy or its live time to first token is above the limit.
+    """
+
+    def __init__(
+        self, registry: AiRegistryPort, token_counter: TokenCounterPort, config: AppConfig, logger: ILoggingPort
+    ):
+        self._registry = registry
+        self._token_counter = token_counter
+        self._config = config
+        self._logger = logger
+
+    def execute(self, prompt: Conversation) -> AIModel:
+        default = self.default_model()
+        fast = self._fast_model()
+        if fast is None or fast == default:
+            return default
+
+        reason = self._reason_to_skip_fast(prompt, fast)
+        if reason:
+            self._logger.debug(f"Routing user_id: {prompt.user_id} to {default.name} ({reason}).")
+            return default
+
+        self._logger.debug(f"Routing user_id: {prompt.user_id} to fast model {fast.name}.")
+        return fast
+
+    def default_model(self) -> AIModel:
+        return AIModel(provider=self._config.active_model, name=self._config.active_model_name)
+
+    def candidates(self) -> tuple[AIModel, ...]:
+        """Every model a turn may be routed to: the active model, then the fast one if configured."""
+        default = self.default_model()
+        fast = self._fast_model()
+        return (default,) if fast is None or fast == default else (default, fast)
+
+    def _fast_model(self) -> AIModel | None:
+        provider = self._config.router_fast_provider
+        if provider is None:
+            return None
+        name = self._config.router_fast_model_name or self._config.available_models.get(provider)
+        return AIModel(provider=provider, name=name) if name else None
+
+    def _reason_to_skip_fast(self, prompt: Conversation, fast: AIModel) -> str | None:
+        text = latest_user_text(prompt.messages) or ""
+        if len(text) > self._config.router_fast_max_characters:
+            return f"message has {len(text)} characters"
+
+        if is_time_sensitive(prompt.messages, self._config):
+            return "needs web search"
+
+        prompt_tokens = self._token_counter.count_messages(prompt.messages, fast)
+        if prompt_tokens > self._config.router_fast_max_prompt_tokens:
+            return f"prompt has ~{prompt_tokens} tokens"
+
+        health = self._registry.health(fast)
+        if not health.available:
+            return f"{fast.provider.value} is unavailable"
+        if (
+            health.avg_time_to_first_token is not None
+            and health.avg_time_to_first_token > self._config.router_fast_max_first_token_seconds
+        ):
+            return f"{fast.provider.value} is slow ({health.avg_time_to_first_token:.1f}s to first token)"
+        return None
@@ -0,0 +1,21 @@
+from src.a_domain.model.message import Message, MessageRole
+from src.b_application.configuration.schemas import AppConfig
+
+
+def latest_user_text(messages: tuple[Message, ...]) -> str | None:
+    for message in reversed(messages):
+        if message.role == MessageRole.USER:
+            return message.content
+    return None
+
+
+def is_time_sensitive(messages: tuple[Message, ...], config: AppConfig) -> bool:
+    """
+    True when the latest user message asks for fresh information (news, weather, "today", ...).
+    Such turns trigger web search and must never be answered from a cache.
+    """
+    text = latest_user_text(messages)
+    if not text:
+        return False
+    content = text.lower()
+    return any(trigger in content for trigger in config.web_search_trigger_keywords)
@@ -1,22 +1,52 @@
 from src.a_domain.model.message import Message
+from src.a_domain.model.reply_token import ReplyToken
 from src.a_domain.ports.bussiness.platform_port import PlatformPort
 from src.a_domain.ports.notification.logging_port import ILoggingPort
+from src.a_domain.types.enums import DeliveryPath
+from src.b_application.configuration.schemas import AppConfig
 
 
 class Dispatcher:
-    def __init__(self, platform: PlatformPort, logger: ILoggingPort):
+    def __init__(self, platform: PlatformPort, config: AppConfig, logger: ILoggingPort):
         self._platform = platform
+        self._config = config
         self._logger = logger
 
-    async def execute(self, user_id: str, messages: tuple[Message, ...]) -> None:
+    @property
+    def max_messages_per_request(self) -> int:
+        return self._platform.max_messages_per_request
+
+    async def execute(
+        self, user_id: str, messages: tuple[Message, ...], reply_token: ReplyToken | None = None
+    ) -> tuple[DeliveryPath | None, ...]:
+        """
+        Sends messages to the user, answering through the reply token while it is still valid and
+        pushing the rest. Returns the path used for each message (None if it could not be delivered).
+        """
         if not messages:
             self._logger.warning("No messages to dispatch.")
-            return
+            return ()
+
+        paths: list[DeliveryPath | None] = []
+        remaining = messages
+
+        if reply_token and reply_token.is_valid(self._config.reply_token_ttl_seconds):
+            batch = messages[: self._platform.max_messages_per_request]
+            if await self._platform.reply_messages(reply_token.value, batch):
+                paths.extend(DeliveryPath.REPLY for _ in batch)
+                remaining = messages[len(batch) :]
+            else:
+                self._logger.warning(f"Reply token rejected for user_id: {user_id}. Falling back to push.")
+        elif reply_token:
+            self._logger.debug(f"Reply token expired for user_id: {user_id}. Using push.")
 
-        count = 0
-        for msg in messages:
-            success = await self._platform.send_message(user_id, msg)
-            if success:
-                count += 1
+        if remaining:
+            batch_size = self._platform.max_messages_per_request
+            batch_results = await self._platform.send_messages(user_id, remaining)
+            for index, _ in enumerate(remaining):
+                paths.append(DeliveryPath.PUSH if batch_results[index // batch_size] else None)
 
-        self._logger.success(f"Dispatched {count}/{len(messages)} messages to user_id: {user_id}")
+        count = sum(1 for path in paths if path)
+        summary = ", ".join(str(path or "failed") for path in paths)
+        self._logger.success(f"Dispatched {count}/{len(messages)} messages to user_id: {user_id} [{summary}]")
+        return tuple(paths)
@@ -0,0 +1,120 @@
+from functools import partial
+from typing import ClassVar
+from uuid import UUID
+
+from src.a_domain.model.conversation import Conversation
+from src.a_domain.model.message import Message, MessageRole
+from src.a_domain.ports.bussiness.ai_port import AiPort
+from src.a_domain.ports.bussiness.repository_port import RepositoryPort
+from src.a_domain.ports.bussiness.task_scheduler_port import TaskSchedulerPort
+from src.a_domain.ports.notification.logging_port import ILoggingPort
+from src.a_domain.types.enums import RequestPriority
+from src.b_application.configuration.schemas import AppConfig
+from src.b_application.request_context import request_scope
+
+
+class ConversationSummarizer:
+    """
+    Folds old turns into the conversation's running summary in the background.
+
+    Scheduled after the turn has been saved, so the reply never waits on it. The newest
+    summary_keep_recent_messages turns stay verbatim; everything older is merged into the summary.
+
+    The model call runs on its own small scheduler, so slow summaries never hold a webhook worker or
+    fill the queue live turns are admitted to. Only the short write is queued on the turn scheduler,
+    under the user's key: it then runs between turns and cannot overwrite one saved concurrently.
+    """
+
+    _SPEAKERS: ClassVar[dict[MessageRole, str]] = {MessageRole.USER: "User", MessageRole.ASSISTANT: "Assistant"}
+
+    def __init__(
+        self,
+        repository: RepositoryPort,
+        ai_port: AiPort,
+        scheduler: TaskSchedulerPort,
+        summary_scheduler: TaskSchedulerPort,
+        config: AppConfig,
+        logger: ILoggingPort,
+    ):
+        self._repository = repository
+        self._ai_port = ai_port
+        self._scheduler = scheduler
+        self._summary_scheduler = summary_scheduler
+        self._config = config
+        self._logger = logger
+        self._in_flight: set[str] = set()
+
+    def schedule(self, conversation: Conversation) -> None:
+        if not self._needs_summary(conversation) or conversation.user_id in self._in_flight:
+            return
+
+        user_id = conversation.user_id
+        self._in_flight.add(user_id)
+        if not self._summary_scheduler.submit(lambda: self.execute(user_id), name=f"summary:{user_id}", key=user_id):
+            self._in_flight.discard(user_id)
+
+    async def execute(self, user_id: str) -> None:
+        handed_off = False
+        try:
+            conversation = await self._repository.get_conversation_by_user_id(user_id)
+            if conversation is None or not self._needs_summary(conversation):
+                return
+
+            turns = self._turns(conversation)
+            folded = turns[: -self._config.summary_keep_recent_messages]
+            try:
+                # Stream rather than generate_reply, whose canned apology must never become a summary.
+                request = self._build_request(conversation.summary, folded)
+                with request_scope(user_id, RequestPriority.BACKGROUND):
+                    summary = "".join([delta async for delta in self._ai_port.stream_reply(request)]).strip()
+            except Exception:
+                self._logger.exception(f"Summarization failed for user_id: {user_id}")
+                return
+            if not summary:
+                self._logger.warning(f"Summarizer returned an empty summary for user_id: {user_id}")
+                return
+
+            through = folded[-1].id
+            handed_off = self._scheduler.submit(
+                partial(self._store, conversation, summary, through, len(folded)),
+                name=f"summary-store:{user_id}",
+                key=user_id,
+            )
+            if not handed_off:
+                self._logger.warning(f"Summary for user_id: {user_id} discarded: the job queue is full.")
+        finally:
+            # Once handed off, _store clears the flag, so no second summary starts before this one lands.
+            if not handed_off:
+                self._in_flight.discard(user_id)
+
+    async def _store(self, summarized: Conversation, summary: str, through: UUID, folded_count: int) -> None:
+        # Runs on the user's turn key, so no turn is being saved meanwhile. Turns saved while the model
+        # was summarizing are already in the latest state; the summary is applied on top of them.
+        user_id = summarized.user_id
+        try:
+            latest = await self._repository.get_conversation_by_user_id(user_id)
+            if latest is None or latest.id != summarized.id or all(m.id != through for m in latest.messages):
+                self._logger.debug(f"Conversation for user_id: {user_id} changed; summary discarded.")
+                return
+            if await self._repository.save(latest.with_summary(summary, through)):
+                self._logger.info(f"Folded {folded_count} messages into the summary for user_id: {user_id}")
+        finally:
+            self._in_flight.discard(user_id)
+
+    def _needs_summary(self, conversation: Conversation) -> bool:
+        trigger = self._config.summary_trigger_messages
+        if trigger <= 0:
+            return False
+        turns = self._turns(conversation)
+        return len(turns) > max(trigger, self._config.summary_keep_recent_messages)
+
+    def _turns(self, conversation: Conversation) -> tuple[Message, ...]:
+        return tuple(m for m in conversation.unsummarized_messages() if m.role != MessageRole.SYSTEM)
+
+    def _build_request(self, previous_summary: str | None, folded: tuple[Message, ...]) -> tuple[Message, ...]:
+        transcript = "\n".join(f"{self._SPEAKERS[m.role]}: {m.content}" for m in folded)
+        content = f"Previous summary:\n{previous_summary or '(none)'}\n\nNew messages:\n{transcript}"
+        return (
+            Message(role=MessageRole.SYSTEM, content=self._config.summary_prompt),
+            Message(role=MessageRole.USER, content=content),
+        )
@@ -1,20 +1,32 @@
 from __future__ import annotations
 import asyncio
-from functools import cached_property
+from collections.abc import AsyncIterator
 from typing import Any
 import google.generativeai as genai  # type: ignore[import-untyped]
 from google.api_core.client_options import ClientOptions
 from src.a_domain.model.message import Message, MessageRole
+from src.a_domain.model.usage_record import TokenUsage
+from src.a_domain.ports.bussiness.token_counter_port import TokenCounterPort
+from src.a_domain.ports.bussiness.usage_recorder_port import UsageRecorderPort
 from src.a_domain.ports.notification.logging_port import ILoggingPort
+from src.a_domain.types.enums import AiProvider
 from src.b_application.configuration.schemas import AppConfig
 from src.c_infrastructure.ai_models.base import BaseAIAdapter
 
 
 class GeminiAIAdapter(BaseAIAdapter):
+    _MAX_CACHED_MODELS = 16
+    provider = AiProvider.GEMINI
+
     def __init__(
-        self, config: AppConfig, logger: ILoggingPort, model_name: str
+        self,
+        config: AppConfig,
+        logger: ILoggingPort,
+        model_name: str,
+        usage_recorder: UsageRecorderPort | None = None,
+        token_counter: TokenCounterPort | None = None,
     ) -> None:
-        super().__init__(config, logger, model_name)
+        super().__init__(config, logger, model_name, usage_recorder=usage_recorder, token_counter=token_counter)
         if not self._config.gemini_api_key:
             raise ValueError("Missing gemini_api_key in configuration.")
         genai.configure(api_key=self._config.gemini_api_key)  # type: ignore[attr-defined]
@@ -29,76 +41,82 @@ class GeminiAIAdapter(BaseAIAdapter):
                     self._logger.debug(
                         "[GeminiAIAdapter] genai.configure with custom endpoint not supported by installed library version"
                     )
+        self._models: dict[str | None, Any] = {}
+
+    def _model_for(self, system_instruction: str | None) -> Any:
+        # The system instruction is bound to the GenerativeModel, so keep one model per distinct prompt,
+        # evicting the least recently used.
+        model = self._models.pop(system_instruction, None)
+        if model is None:
+            self._logger.debug(f"[{self.__class__.__name__}] Creating GenerativeModel for: {self._model_name}")
+            model = genai.GenerativeModel(  # type: ignore[attr-defined]
+                self._model_name,
+                system_instruction=system_instruction,
+                generation_config={"temperature": 0.7},
+            )
+            if len(self._models) >= self._MAX_CACHED_MODELS:
+                self._models.pop(next(iter(self._models)))
+        self._models[system_instruction] = model
+        return model
 
-    @cached_property
-    def _client(self) -> Any:
-        self._logger.debug(
-            f"[{self.__class__.__name__}] Creating GenerativeModel for: {self._model_name}"
-        )
-        return genai.GenerativeModel(self._model_name)  # type: ignore[attr-defined]
+    async def warm_up(self) -> None:
+        # The SDK call is blocking; it validates the key and model id and opens the SDK's connection.
+        await asyncio.to_thread(genai.get_model, f"models/{self._model_name}")  # type: ignore[attr-defined]
 
-    async def _call_api(self, messages: tuple[Message, ...]) -> str:
-        prompt = self._convert_to_prompt(messages)
-        self._logger.debug(
-            f"[{self.__class__.__name__}] Calling Gemini, prompt length={len(prompt)}"
-        )
+    async def _stream_api(self, messages: tuple[Message, ...]) -> AsyncIterator[str | TokenUsage]:
+        system_instruction, contents = self._convert_to_contents(messages)
+        self._logger.debug(f"[{self.__class__.__name__}] Calling Gemini with {len(contents)} turns")
         try:
-            response = await asyncio.to_thread(
-                lambda: self._client.generate_content(
-                    prompt, generation_config={"temperature": 0.7}
-                )
+            response = await self._model_for(system_instruction).generate_content_async(
+                contents,
+                stream=True,
+                request_options={"timeout": self._config.ai_model_connection_timeout},
             )
+            usage_metadata = None
+            async for chunk in response:
+                yield self._extract_chunk_text(chunk)
+                usage_metadata = getattr(chunk, "usage_metadata", None) or usage_metadata
+            # Every chunk carries running totals; the last one covers the whole reply.
+            if usage_metadata is not None:
+                yield TokenUsage(
+                    prompt_tokens=getattr(usage_metadata, "prompt_token_count", 0) or 0,
+                    completion_tokens=getattr(usage_metadata, "candidates_token_count", 0) or 0,
+                )
         except Exception as e:
-            self._logger.error(
-                f"[{self.__class__.__name__}] Gemini API call failed: {e}"
-            )
+            self._logger.error(f"[{self.__class__.__name__}] Gemini API call failed: {e}")
             raise
-        text = self._extract_text_from_response(response)
-        return text
 
-    def _convert_to_prompt(self, messages: tuple[Message, ...]) -> str:
-        lines: list[str] = []
-        for m in messages:
-            if m.role == MessageRole.SYSTEM:
-                prefix = "[system]"
-            elif m.role == MessageRole.USER:
-                prefix = "[user]"
+    def _convert_to_contents(self, messages: tuple[Message, ...]) -> tuple[str | None, list[dict[str, Any]]]:
+        """
+        Maps the conversation to Gemini's role-structured contents. The leading system messages (the
+        persona prompt) become the system instruction; assistant turns use Gemini's "model" role.
+
+        Later system messages stay where they are, as user turns: lifting them as well would give the
+        instruction, and with it the cached model, a new value on nearly every request.
+        """
+        leading = 0
+        while leading < len(messages) and messages[leading].role == MessageRole.SYSTEM:
+            leading += 1
+        system_instruction = "\n\n".join(m.content for m in messages[:leading]) or None
+
+        contents: list[dict[str, Any]] = []
+        for m in messages[leading:]:
+            role = "model" if m.role == MessageRole.ASSISTANT else "user"
+            if contents and contents[-1]["role"] == role:
+                # Consecutive turns of one role are sent as one turn with several parts.
+                contents[-1]["parts"].append(m.content)
             else:
-                prefix = "[assistant]"
-            lines.append(f"{prefix} {m.content}")
-        return "\n".join(lines)
+                contents.append({"role": role, "parts": [m.content]})
 
-    def _extract_text_from_response(self, resp: Any) -> str:
-        try:
-            text = getattr(resp, "text", None)
-            if isinstance(text, str) and text.strip():
-                return text
-            candidates = getattr(resp, "candidates", None)
-            if candidates:
-                first = candidates[0]
-                content = getattr(first, "content", None) or getattr(
-                    first, "output", None
-                )
-                if content is not None:
-                    parts = getattr(content, "parts", None)
-                    if parts:
-                        texts: list[str] = []
-                        for part in parts:
-                            part_text = getattr(part, "text", None)
-                            if isinstance(part_text, str) and part_text.strip():
-                                texts.append(part_text)
-                        if texts:
-                            return "\n".join(texts)
-            if isinstance(resp, dict):
-                t = resp.get("text")
-                if isinstance(t, str) and t.strip():
-                    return t
-                out = resp.get("output")
-                if isinstance(out, str) and out.strip():
-                    return out
-            return str(resp)
-        except Exception as e:
-            self._logger.error(
-                f"[{self.__class__.__name__}] Failed to parse Gemini response, falling back to str(resp): {e}"
-            )
-            return str(resp)
+        if not contents:
+            raise ValueError("Gemini needs at least one user or model turn; the request only has system messages.")
+        return system_instruction, contents
+
+    def _extract_chunk_text(self, chunk: Any) -> str:
+        # chunk.text raises when a chunk carries no text part (e.g. a final safety/usage chunk).
+        candidates = getattr(chunk, "candidates", None) or []
+        if not candidates:
+            return ""
+        content = getattr(candidates[0], "content", None)
+        parts = getattr(content, "parts", None) or []
+        return "".join(text for part in parts if isinstance(text := getattr(part, "text", None), str))
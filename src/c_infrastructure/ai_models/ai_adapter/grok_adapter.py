@@ -1,16 +1,33 @@
+from collections.abc import AsyncIterator
 from functools import cached_property
 from typing import Any
 import httpx
 from openai import AsyncOpenAI, OpenAIError
 from src.a_domain.model.message import Message, MessageRole
+from src.a_domain.model.usage_record import TokenUsage
+from src.a_domain.ports.bussiness.token_counter_port import TokenCounterPort
+from src.a_domain.ports.bussiness.usage_recorder_port import UsageRecorderPort
 from src.a_domain.ports.notification.logging_port import ILoggingPort
+from src.a_domain.types.enums import AiProvider
 from src.b_application.configuration.schemas import AppConfig
 from src.c_infrastructure.ai_models.base import BaseAIAdapter
+from src.c_infrastructure.services.http_client_pool_service import HttpClientPoolService
 
 
 class GrokAdapter(BaseAIAdapter):
-    def __init__(self, config: AppConfig, logger: ILoggingPort, model_name: str):
-        super().__init__(config, logger, model_name)
+    grok_base_url = "https://api.x.ai/v1"
+    provider = AiProvider.GROK
+
+    def __init__(
+        self,
+        config: AppConfig,
+        logger: ILoggingPort,
+        model_name: str,
+        http_pool: HttpClientPoolService | None = None,
+        usage_recorder: UsageRecorderPort | None = None,
+        token_counter: TokenCounterPort | None = None,
+    ):
+        super().__init__(config, logger, model_name, http_pool, usage_recorder, token_counter)
         if not self._config.grok_api_key:
             raise ValueError("Missing grok_api_key in configuration.")
 
@@ -19,11 +36,16 @@ class GrokAdapter(BaseAIAdapter):
         self._logger.debug("Initializing Grok client (xAI)...")
         return AsyncOpenAI(
             api_key=self._config.grok_api_key,
-            base_url="https://api.x.ai/v1",
+            base_url=self.grok_base_url,
             timeout=httpx.Timeout(self._config.ai_model_connection_timeout),
+            http_client=self._http_client(self.grok_base_url),
         )
 
-    async def _call_api(self, messages: tuple[Message, ...]) -> str:
+    async def warm_up(self) -> None:
+        # A cheap authenticated GET: leaves a TLS connection in the pool and checks the key and model id.
+        await self._client.models.retrieve(self._model_name)
+
+    async def _stream_api(self, messages: tuple[Message, ...]) -> AsyncIterator[str | TokenUsage]:
         api_messages = self._convert_to_api_format(messages)
         tools: list[dict[str, Any]] = []
 
@@ -77,6 +99,7 @@ class GrokAdapter(BaseAIAdapter):
                 "messages": api_messages,
                 "temperature": 0.7,
                 "stream": True,
+                "stream_options": {"include_usage": True},
             }
 
             if extra_body:
@@ -84,19 +107,15 @@ class GrokAdapter(BaseAIAdapter):
 
             stream = await self._client.chat.completions.create(**params)
 
-            full_content = ""
             async for chunk in stream:
-                content_delta = chunk.choices[0].delta.content or ""
-                full_content += content_delta
-
-            return full_content
+                if chunk.choices:
+                    yield chunk.choices[0].delta.content or ""
+                if usage := self._openai_compatible_usage(chunk):
+                    yield usage
 
         except OpenAIError as e:
             self._logger.error(f"Grok API error for model {self._model_name}: {e}")
-            return f"I'm sorry, I encountered an error connecting to Grok: {e}"
-        except Exception as e:
-            self._logger.critical(f"Unexpected error in Grok adapter: {e}")
-            return "An unexpected error occurred."
+            raise
 
     def _convert_to_api_format(self, messages: tuple[Message, ...]):
         api_messages = []
@@ -5,6 +5,7 @@ Infrastructure layer adapter that calls GroqCloud via OpenAI-compatible API.
 """
 from __future__ import annotations
 import asyncio
+from collections.abc import AsyncIterator
 from functools import cached_property
 import httpx
 
@@ -16,10 +17,16 @@ from openai.types.chat import (
 )
 
 from src.a_domain.model.message import Message, MessageRole
+from src.a_domain.model.usage_record import TokenUsage
+from src.a_domain.ports.bussiness.token_counter_port import TokenCounterPort
+from src.a_domain.ports.bussiness.usage_recorder_port import UsageRecorderPort
 from src.a_domain.ports.bussiness.web_search_port import WebSearchPort
 from src.a_domain.ports.notification.logging_port import ILoggingPort
+from src.a_domain.types.enums import AiProvider
 from src.c_infrastructure.ai_models.base import BaseAIAdapter
 from src.b_application.configuration.schemas import AppConfig
+from src.b_application.use_cases.process.search_policy import is_time_sensitive, latest_user_text
+from src.c_infrastructure.services.http_client_pool_service import HttpClientPoolService
 
 
 
@@ -29,6 +36,7 @@ class GroqAIAdapter(BaseAIAdapter):
     """
 
     groq_base_url = "https://api.groq.com/openai/v1"
+    provider = AiProvider.GROQ
 
     def __init__(
         self,
@@ -36,8 +44,11 @@ class GroqAIAdapter(BaseAIAdapter):
         logger: ILoggingPort,
         model_name: str = "openai/gpt-oss-20b",
         web_search: WebSearchPort | None = None,
+        http_pool: HttpClientPoolService | None = None,
+        usage_recorder: UsageRecorderPort | None = None,
+        token_counter: TokenCounterPort | None = None,
     ):
-        super().__init__(config, logger, model_name)
+        super().__init__(config, logger, model_name, http_pool, usage_recorder, token_counter)
 
         if not self._config.groq_api_key:
             raise ValueError("Missing groq_api_key in configuration. ")
@@ -51,15 +62,19 @@ class GroqAIAdapter(BaseAIAdapter):
             api_key=self._config.groq_api_key,
             base_url=self.groq_base_url,
             timeout=httpx.Timeout(self._config.ai_model_connection_timeout),
+            http_client=self._http_client(self.groq_base_url),
         )
 
-    async def _call_api(self, messages: tuple[Message, ...]) -> str:
+    async def warm_up(self) -> None:
+        # A cheap authenticated GET: leaves a TLS connection in the pool and checks the key and model id.
+        await self._client.models.retrieve(self._model_name)
+
+    async def _stream_api(self, messages: tuple[Message, ...]) -> AsyncIterator[str | TokenUsage]:
         """
-        Calls Groq Chat Completions and returns assistant text.
+        Calls Groq Chat Completions and yields assistant text deltas.
         """
+        api_messages = self._convert_to_api_format(messages)
         try:
-            api_messages = self._convert_to_api_format(messages)
-
             # 先進行搜尋
             if self._should_search(messages):
                 search_results = await self._enrich_with_search(messages)
@@ -80,8 +95,8 @@ class GroqAIAdapter(BaseAIAdapter):
                         api_messages.append(rag_instruction)
             self._logger.info("執行查詢流程結束")
         except Exception as e:
+            # Search only enriches the prompt; answer without it rather than failing the turn.
             self._logger.error(f"Unexpected error calling tailivy : {e}")
-            return "I'm sorry, something went wrong. Please try again."
 
         try:
             stream = await self._client.chat.completions.create(
@@ -89,22 +104,19 @@ class GroqAIAdapter(BaseAIAdapter):
                 messages=api_messages,
                 temperature=0.7,
                 stream=True,
+                stream_options={"include_usage": True},
             )
 
-            full_content = ""
             async for chunk in stream:
-                content_delta = chunk.choices[0].delta.content or ""
-                full_content += content_delta
-            
-            return full_content
+                if chunk.choices:
+                    yield chunk.choices[0].delta.content or ""
+                if usage := self._openai_compatible_usage(chunk):
+                    yield usage
         except asyncio.CancelledError:
             raise
         except (OpenAIError, httpx.HTTPError) as e:
             self._logger.error(f"GROQ API error for model {self._model_name}: {e}")
-            return f"GROQ API error for model {self._model_name}: {e}" + "I'm sorry, I'm having trouble connecting to GROQ right now. Please try again in a moment."
-        except Exception as e:
-            self._logger.error(f"Unexpected error calling GROQ ({self._model_name}): {e}")
-            return "I'm sorry, something went wrong. Please try again."
+            raise
 
     async def _enrich_with_search(self, messages: tuple[Message, ...]) -> str:
         """Execute web search and format results."""
@@ -148,21 +160,10 @@ class GroqAIAdapter(BaseAIAdapter):
         """Determine if web search should be triggered."""
         if not getattr(self._config, "enable_web_search", False) or not self._web_search:
             return False
-        
-        # Get the latest user message
-        for msg in reversed(messages):
-            if msg.role == MessageRole.USER:
-                content = msg.content.lower()
-                # Keywords that trigger search
-                search_triggers = {
-                    "latest", "recent", "news", "current", "today",
-                    "stock", "weather", "時事", "今天", "最新", "新聞" ,"查詢"
-                }
-                hit = any(t in content for t in search_triggers)
-                self._logger.debug(f"search trigger hit={hit}, content={content}")
-                return hit
-        
-        return False
+
+        hit = is_time_sensitive(messages, self._config)
+        self._logger.debug(f"search trigger hit={hit}, content={latest_user_text(messages)}")
+        return hit
 
     def _convert_to_api_format(
         self, messages: tuple[Message, ...]
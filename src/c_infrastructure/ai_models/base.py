@@ -1,9 +1,54 @@
+import time
 from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from typing import Any
 
+import httpx
+
+from src.a_domain.model.ai_provider import AIModel
 from src.a_domain.model.message import Message, MessageRole
+from src.a_domain.model.usage_record import TokenUsage, UsageRecord
 from src.a_domain.ports.bussiness.ai_port import AiPort
+from src.a_domain.ports.bussiness.token_counter_port import TokenCounterPort
+from src.a_domain.ports.bussiness.usage_recorder_port import UsageRecorderPort
 from src.a_domain.ports.notification.logging_port import ILoggingPort
+from src.a_domain.types.enums import AiProvider
 from src.b_application.configuration.schemas import AppConfig
+from src.b_application.request_context import current_user_id
+from src.c_infrastructure.services.http_client_pool_service import HttpClientPoolService
+from src.c_infrastructure.services.token_counter_service import TokenCounterService
+
+ERROR_REPLY = "I've encountered an unexpected error. The technical team has been notified."
+
+
+@dataclass(frozen=True)
+class StreamTiming:
+    """
+    Timing of one streamed completion. Stream chunks are counted as tokens, which matches
+    the one-token-per-chunk streams of OpenAI-compatible providers closely enough for monitoring.
+    """
+
+    model_name: str
+    time_to_first_token: float
+    total_seconds: float
+    chunks: int
+    characters: int
+
+    @property
+    def tokens_per_second(self) -> float:
+        generating = self.total_seconds - self.time_to_first_token
+        return self.chunks / generating if generating > 0 else 0.0
+
+
+@dataclass(frozen=True)
+class LatencyStats:
+    model_name: str
+    samples: int
+    avg_time_to_first_token: float
+    avg_total_seconds: float
+    avg_tokens_per_second: float
 
 
 class BaseAIAdapter(AiPort, ABC):
@@ -11,28 +56,174 @@ class BaseAIAdapter(AiPort, ABC):
     An abstract base class for AI model adapters.
     """
 
-    def __init__(self, config: AppConfig, logger: ILoggingPort, model_name: str):
+    _TIMING_WINDOW = 50
+    provider: AiProvider
+
+    def __init__(
+        self,
+        config: AppConfig,
+        logger: ILoggingPort,
+        model_name: str,
+        http_pool: HttpClientPoolService | None = None,
+        usage_recorder: UsageRecorderPort | None = None,
+        token_counter: TokenCounterPort | None = None,
+    ):
         self._config = config
         self._logger = logger
         self._model_name = model_name
+        self._http_pool = http_pool
+        self._usage_recorder = usage_recorder
+        self._token_counter = token_counter or TokenCounterService(logger)
+        self._timings: deque[StreamTiming] = deque(maxlen=self._TIMING_WINDOW)
+
+    @property
+    def model_name(self) -> str:
+        return self._model_name
+
+    def _http_client(self, base_url: str) -> httpx.AsyncClient | None:
+        """Shared pooled client for the provider host, or None to let the SDK build its own."""
+        return self._http_pool.client_for(base_url) if self._http_pool else None
 
     @abstractmethod
-    async def _call_api(self, messages: tuple[Message, ...]) -> str: ...
+    def _stream_api(self, messages: tuple[Message, ...]) -> AsyncIterator[str | TokenUsage]:
+        """Yields raw text deltas from the provider, plus a TokenUsage when the provider reports one."""
+        ...
+
+    @staticmethod
+    def _openai_compatible_usage(chunk: Any) -> TokenUsage | None:
+        # Sent in a final chunk with empty choices when stream_options.include_usage is set.
+        usage = getattr(chunk, "usage", None)
+        if usage is None:
+            # Groq has also reported it under x_groq.usage.
+            x_groq = getattr(chunk, "x_groq", None)
+            usage = x_groq.get("usage") if isinstance(x_groq, dict) else getattr(x_groq, "usage", None)
+        if usage is None:
+            return None
+        if isinstance(usage, dict):
+            return TokenUsage(usage.get("prompt_tokens") or 0, usage.get("completion_tokens") or 0)
+        return TokenUsage(usage.prompt_tokens or 0, usage.completion_tokens or 0)
+
+    async def warm_up(self) -> None:
+        """Builds the SDK client and opens a connection ahead of the first request. No-op by default."""
+
+    async def stream_reply(self, messages: tuple[Message, ...]) -> AsyncIterator[str]:
+        """
+        Streams the reply. Time to first token and throughput are recorded once the stream completes;
+        usage is recorded however it ends, so hedge losers closed early and streams that fail partway
+        are still accounted for, flagged as aborted.
+        """
+        self._logger.debug(f"[{self.__class__.__name__}] Streaming reply with model: {self._model_name}")
+        self._logger.trace(f"[{self.__class__.__name__}] Sending {len(messages)} messages to model.")
+
+        started = time.perf_counter()
+        first_token_at: float | None = None
+        chunks = 0
+        characters = 0
+        parts: list[str] = []
+        usage: TokenUsage | None = None
+        completed = False
+        try:
+            async for delta in self._stream_api(messages):
+                if isinstance(delta, TokenUsage):
+                    usage = delta
+                    continue
+                if not delta:
+                    continue
+                if first_token_at is None:
+                    first_token_at = time.perf_counter()
+                chunks += 1
+                characters += len(delta)
+                parts.append(delta)
+                yield delta
+            completed = True
+        finally:
+            finished = time.perf_counter()
+            timing = StreamTiming(
+                model_name=self._model_name,
+                time_to_first_token=(first_token_at or finished) - started,
+                total_seconds=finished - started,
+                chunks=chunks,
+                characters=characters,
+            )
+            if completed:
+                self._record_timing(timing)
+            self._record_usage(messages, "".join(parts), timing, usage, aborted=not completed)
 
     async def generate_reply(self, messages: tuple[Message, ...]) -> Message:
         """Orchestrates the reply generation process (Template Method)."""
         self._logger.debug(f"[{self.__class__.__name__}] Generating reply with model: {self._model_name}")
-        self._logger.trace(f"[{self.__class__.__name__}] Sending {len(messages)} messages to model.")
 
         try:
-            reply_content = await self._call_api(messages)
+            # Collect deltas in a list and join once; repeated string concatenation is quadratic.
+            parts: list[str] = []
+            async for delta in self.stream_reply(messages):
+                parts.append(delta)
             self._logger.success(
                 f"[{self.__class__.__name__}] Successfully received reply from model: {self._model_name}"
             )
-            return Message(role=MessageRole.ASSISTANT, content=reply_content)
+            return Message(role=MessageRole.ASSISTANT, content="".join(parts))
         except Exception as e:
             self._logger.critical(f"[{self.__class__.__name__}] An unexpected critical error occurred: {e}")
-            return Message(
-                role=MessageRole.ASSISTANT,
-                content="I've encountered an unexpected error. The technical team has been notified.",
+            return Message(role=MessageRole.ASSISTANT, content=ERROR_REPLY)
+
+    def latency_stats(self) -> LatencyStats:
+        timings = list(self._timings)
+        samples = len(timings)
+        if not samples:
+            return LatencyStats(self._model_name, 0, 0.0, 0.0, 0.0)
+        return LatencyStats(
+            model_name=self._model_name,
+            samples=samples,
+            avg_time_to_first_token=round(sum(t.time_to_first_token for t in timings) / samples, 3),
+            avg_total_seconds=round(sum(t.total_seconds for t in timings) / samples, 3),
+            avg_tokens_per_second=round(sum(t.tokens_per_second for t in timings) / samples, 1),
+        )
+
+    def _record_timing(self, timing: StreamTiming) -> None:
+        self._timings.append(timing)
+        self._logger.debug(
+            f"[{self.__class__.__name__}] {self._model_name}: ttft={timing.time_to_first_token:.3f}s, "
+            f"total={timing.total_seconds:.3f}s, chunks={timing.chunks}, {timing.tokens_per_second:.1f} tok/s"
+        )
+
+    def _record_usage(
+        self,
+        messages: tuple[Message, ...],
+        reply: str,
+        timing: StreamTiming,
+        usage: TokenUsage | None,
+        aborted: bool,
+    ) -> None:
+        if self._usage_recorder is None:
+            return
+        estimated = usage is None
+        if usage is None:
+            # The provider reported nothing (or the stream ended before its usage chunk): count it ourselves.
+            model = AIModel(provider=self.provider, name=self._model_name)
+            usage = TokenUsage(
+                prompt_tokens=self._token_counter.count_messages(messages, model),
+                completion_tokens=self._token_counter.count_messages(
+                    (Message(role=MessageRole.ASSISTANT, content=reply),), model
+                ),
+            )
+        self._usage_recorder.record(
+            UsageRecord(
+                user_id=current_user_id.get(),
+                provider=self.provider,
+                model_name=self._model_name,
+                prompt_tokens=usage.prompt_tokens,
+                completion_tokens=usage.completion_tokens,
+                estimated=estimated,
+                aborted=aborted,
+                time_to_first_token=timing.time_to_first_token,
+                total_seconds=timing.total_seconds,
+                cost_usd=self._cost(usage),
             )
+        )
+
+    def _cost(self, usage: TokenUsage) -> float | None:
+        price = self._config.ai_model_prices_per_million.get(self._model_name)
+        if price is None:
+            return None
+        input_price, output_price = price
+        return (usage.prompt_tokens * input_price + usage.completion_tokens * output_price) / 1_000_000
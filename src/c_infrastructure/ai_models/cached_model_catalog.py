@@ -0,0 +1,149 @@
+import asyncio
+import json
+import os
+import time
+from contextlib import suppress
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from src.a_domain.model.ai_provider import AIModel
+from src.a_domain.ports.bussiness.model_catalog_port import ModelCatalogPort
+from src.a_domain.ports.notification.logging_port import ILoggingPort
+from src.a_domain.types.enums import AiProvider
+from src.c_infrastructure.ai_models.model_catalog import ModelsCatalog
+
+
+@dataclass(frozen=True)
+class CatalogProviderStats:
+    provider: AiProvider
+    models: int
+    age_seconds: float | None
+    last_error: str | None
+
+
+@dataclass
+class _ProviderEntry:
+    models: tuple[AIModel, ...] = field(default_factory=tuple)
+    fetched_at: float | None = None  # wall clock, so it survives restarts through the file
+    attempted_at: float | None = None
+    last_error: str | None = None
+
+
+class CachedModelCatalog(ModelCatalogPort):
+    """
+    Model catalog served from memory, persisted to a JSON file and refreshed in the background.
+
+    On startup the last saved catalog is loaded from disk, so nothing waits on the network.
+    Each provider is refreshed independently once its list is older than the TTL; when a
+    provider is unreachable its last known good list is kept.
+    """
+
+    _RETRY_SECONDS = 300.0
+
+    def __init__(self, source: ModelsCatalog, logger: ILoggingPort, path: str, ttl_seconds: float):
+        self._source = source
+        self._logger = logger
+        self._path = Path(path)
+        self._ttl = ttl_seconds
+        self._entries: dict[AiProvider, _ProviderEntry] = {provider: _ProviderEntry() for provider in AiProvider}
+        self._refresh_lock = asyncio.Lock()
+        self._refresher: asyncio.Task | None = None
+        self._load()
+
+    async def start(self) -> None:
+        if self._refresher is None:
+            self._refresher = asyncio.create_task(self._refresh_loop(), name="model-catalog-refresh")
+
+    async def stop(self) -> None:
+        if self._refresher is not None:
+            self._refresher.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._refresher
+            self._refresher = None
+
+    async def list_chat_models(self) -> tuple[AIModel, ...]:
+        if not any(entry.models for entry in self._entries.values()):
+            # Nothing cached or saved yet (first boot): this one call has to wait for the network.
+            await self.refresh()
+        models = (model for entry in self._entries.values() for model in entry.models)
+        return tuple(sorted(models, key=lambda m: (m.provider.value, m.name)))
+
+    async def refresh(self, force: bool = False) -> None:
+        async with self._refresh_lock:
+            providers = [p for p in self._source.configured_providers() if force or self._is_stale(p)]
+            if not providers:
+                return
+            results = await asyncio.gather(*(self._source.fetch_models(p) for p in providers), return_exceptions=True)
+            for provider, result in zip(providers, results):
+                entry = self._entries[provider]
+                entry.attempted_at = time.time()
+                if isinstance(result, Exception):
+                    entry.last_error = repr(result)
+                    self._logger.warning(
+                        f"Model catalog refresh for {provider.value} failed; "
+                        f"keeping {len(entry.models)} known models: {result}"
+                    )
+                    continue
+                entry.models, entry.fetched_at, entry.last_error = tuple(result), time.time(), None
+            await asyncio.to_thread(self._save)
+
+    def stats(self) -> tuple[CatalogProviderStats, ...]:
+        now = time.time()
+        return tuple(
+            CatalogProviderStats(
+                provider=provider,
+                models=len(entry.models),
+                age_seconds=round(now - entry.fetched_at, 1) if entry.fetched_at else None,
+                last_error=entry.last_error,
+            )
+            for provider, entry in self._entries.items()
+        )
+
+    def _is_stale(self, provider: AiProvider) -> bool:
+        return self._due_at(provider) <= time.time()
+
+    def _due_at(self, provider: AiProvider) -> float:
+        entry = self._entries[provider]
+        expires_at = entry.fetched_at + self._ttl if entry.fetched_at else 0.0
+        # After a failed attempt, back off instead of hammering an unreachable provider.
+        retry_at = entry.attempted_at + self._RETRY_SECONDS if entry.attempted_at and entry.last_error else 0.0
+        return max(expires_at, retry_at)
+
+    async def _refresh_loop(self) -> None:
+        while True:
+            try:
+                await self.refresh()
+            except Exception:
+                self._logger.exception("Model catalog refresh failed")
+            await asyncio.sleep(self._next_refresh_in())
+
+    def _next_refresh_in(self) -> float:
+        due = [self._due_at(provider) for provider in self._source.configured_providers()]
+        return max(1.0, min(due, default=time.time() + self._ttl) - time.time())
+
+    def _load(self) -> None:
+        if not self._path.exists():
+            return
+        try:
+            data = json.loads(self._path.read_text(encoding="utf-8"))
+            for provider_value, saved in data.items():
+                provider = AiProvider(provider_value)
+                self._entries[provider] = _ProviderEntry(
+                    models=tuple(AIModel(provider=provider, name=name) for name in saved["models"]),
+                    fetched_at=saved.get("fetched_at"),
+                )
+            self._logger.info(f"Loaded model catalog from {self._path}")
+        except (OSError, ValueError, KeyError) as e:
+            self._logger.warning(f"Ignoring unreadable model catalog file {self._path}: {e}")
+
+    def _save(self) -> None:
+        data = {
+            provider.value: {"fetched_at": entry.fetched_at, "models": [m.name for m in entry.models]}
+            for provider, entry in self._entries.items()
+            if entry.fetched_at is not None
+        }
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self._path.with_suffix(self._path.suffix + ".tmp")
+        tmp_path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+        # Replace atomically so a crash mid-write never leaves a truncated catalog behind.
+        os.replace(tmp_path, self._path)
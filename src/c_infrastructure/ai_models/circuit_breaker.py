@@ -0,0 +1,218 @@
+import asyncio
+import time
+from collections import deque
+from collections.abc import AsyncIterator
+from contextlib import suppress
+from dataclasses import dataclass
+
+import httpx
+import openai
+from google.api_core.exceptions import GoogleAPICallError
+
+from src.a_domain.model.ai_provider import AIModel
+from src.a_domain.model.message import Message, MessageRole
+from src.a_domain.ports.bussiness.ai_port import AiPort
+from src.a_domain.ports.notification.logging_port import ILoggingPort
+from src.a_domain.types.enums import CircuitState
+from src.b_application.configuration.schemas import AppConfig
+from src.c_infrastructure.ai_models.base import ERROR_REPLY
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling a provider whose circuit is open."""
+
+
+def is_provider_failure(error: BaseException) -> bool:
+    """
+    True when the error says the provider itself is unhealthy: a transport error, a timeout, a rate
+    limit (429) or a server error (5xx). Anything else, such as a rejected prompt, a bad request or a
+    bug on our side, is specific to the call and must not open the circuit.
+    """
+    if isinstance(error, (TimeoutError, ConnectionError, httpx.TransportError, openai.APIConnectionError)):
+        return True
+    status = _status_code(error)
+    return status is not None and (status == 429 or status >= 500)
+
+
+def _status_code(error: BaseException) -> int | None:
+    if isinstance(error, openai.APIStatusError):
+        return error.status_code
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code
+    if isinstance(error, GoogleAPICallError):
+        # google.api_core maps gRPC statuses to their HTTP equivalents (e.g. UNAVAILABLE -> 503).
+        return error.code if isinstance(error.code, int) else None
+    return None
+
+
+@dataclass(frozen=True)
+class BreakerStats:
+    provider: str
+    model_name: str
+    state: CircuitState
+    samples: int
+    failure_rate: float
+    slow_call_rate: float
+    times_opened: int
+    short_circuited: int
+    retry_in_seconds: float
+
+
+@dataclass(frozen=True)
+class _Outcome:
+    failed: bool
+    slow: bool
+
+
+class CircuitBreakerAIAdapter(AiPort):
+    """
+    Wraps one provider with a closed / open / half-open circuit breaker.
+
+    Outcomes of recent calls are kept in a rolling window. The circuit opens when the share of
+    failed calls (see is_provider_failure) or slow calls (no first token within
+    ai_breaker_slow_call_seconds) crosses its threshold; while open, calls fail fast with
+    CircuitOpenError so the failover chain can reroute. After ai_breaker_open_seconds a tiny probe
+    request runs in the background (half-open): success closes the circuit, failure keeps it open
+    for another period.
+    """
+
+    _PROBE_MESSAGES = (
+        Message(role=MessageRole.SYSTEM, content="Reply with a single word."),
+        Message(role=MessageRole.USER, content="ping"),
+    )
+
+    def __init__(self, inner: AiPort, model: AIModel, config: AppConfig, logger: ILoggingPort):
+        self._inner = inner
+        self._model = model
+        self._config = config
+        self._logger = logger
+        self._label = f"{model.provider.value}/{model.name}"
+        self._outcomes: deque[_Outcome] = deque(maxlen=config.ai_breaker_window)
+        self._state = CircuitState.CLOSED
+        self._opened_at = 0.0
+        self._times_opened = 0
+        self._short_circuited = 0
+        self._probe_timer: asyncio.TimerHandle | None = None
+        self._probe_task: asyncio.Task | None = None
+
+    @property
+    def state(self) -> CircuitState:
+        return self._state
+
+    async def stream_reply(self, messages: tuple[Message, ...]) -> AsyncIterator[str]:
+        if self._state != CircuitState.CLOSED:
+            self._short_circuited += 1
+            raise CircuitOpenError(f"Circuit for {self._label} is {self._state.value}")
+
+        started = time.perf_counter()
+        first_token: float | None = None
+        try:
+            async for delta in self._inner.stream_reply(messages):
+                if first_token is None:
+                    first_token = time.perf_counter() - started
+                yield delta
+        except (asyncio.CancelledError, GeneratorExit):
+            # Cancelled by a hedge or a first-token timeout before answering: only a long wait is telling.
+            latency = first_token if first_token is not None else time.perf_counter() - started
+            if first_token is not None or latency >= self._config.ai_breaker_slow_call_seconds:
+                self._record(failed=False, latency=latency)
+            raise
+        except Exception as e:
+            self._record(failed=is_provider_failure(e), latency=time.perf_counter() - started)
+            raise
+        else:
+            self._record(
+                failed=False, latency=first_token if first_token is not None else time.perf_counter() - started
+            )
+
+    async def generate_reply(self, messages: tuple[Message, ...]) -> Message:
+        try:
+            parts = [delta async for delta in self.stream_reply(messages)]
+            return Message(role=MessageRole.ASSISTANT, content="".join(parts))
+        except Exception:
+            self._logger.exception(f"[{self.__class__.__name__}] {self._label} failed")
+            return Message(role=MessageRole.ASSISTANT, content=ERROR_REPLY)
+
+    def stats(self) -> BreakerStats:
+        samples = len(self._outcomes)
+        retry_in = 0.0
+        if self._state == CircuitState.OPEN:
+            retry_in = max(0.0, self._opened_at + self._config.ai_breaker_open_seconds - time.monotonic())
+        return BreakerStats(
+            provider=self._model.provider.value,
+            model_name=self._model.name,
+            state=self._state,
+            samples=samples,
+            failure_rate=round(self._failure_rate(), 3),
+            slow_call_rate=round(self._slow_call_rate(), 3),
+            times_opened=self._times_opened,
+            short_circuited=self._short_circuited,
+            retry_in_seconds=round(retry_in, 1),
+        )
+
+    def _record(self, failed: bool, latency: float) -> None:
+        if self._state != CircuitState.CLOSED:
+            return
+        self._outcomes.append(_Outcome(failed=failed, slow=latency >= self._config.ai_breaker_slow_call_seconds))
+        if len(self._outcomes) < self._config.ai_breaker_min_calls:
+            return
+        failure_rate = self._failure_rate()
+        slow_call_rate = self._slow_call_rate()
+        if (
+            failure_rate >= self._config.ai_breaker_failure_rate
+            or slow_call_rate >= self._config.ai_breaker_slow_call_rate
+        ):
+            self._open(f"failure rate {failure_rate:.0%}, slow call rate {slow_call_rate:.0%}")
+
+    def _failure_rate(self) -> float:
+        return sum(o.failed for o in self._outcomes) / len(self._outcomes) if self._outcomes else 0.0
+
+    def _slow_call_rate(self) -> float:
+        return sum(o.slow for o in self._outcomes) / len(self._outcomes) if self._outcomes else 0.0
+
+    def _open(self, reason: str) -> None:
+        self._state = CircuitState.OPEN
+        self._opened_at = time.monotonic()
+        self._times_opened += 1
+        self._logger.warning(
+            f"Circuit OPEN for {self._label} ({reason}). Probing again in {self._config.ai_breaker_open_seconds}s."
+        )
+        self._probe_timer = asyncio.get_running_loop().call_later(
+            self._config.ai_breaker_open_seconds, self._start_probe
+        )
+
+    def _close(self) -> None:
+        self._state = CircuitState.CLOSED
+        self._outcomes.clear()
+        self._logger.info(f"Circuit CLOSED for {self._label}. Provider recovered.")
+
+    def _start_probe(self) -> None:
+        self._state = CircuitState.HALF_OPEN
+        self._logger.info(f"Circuit HALF-OPEN for {self._label}. Sending probe request.")
+        self._probe_task = asyncio.create_task(self._probe(), name=f"breaker-probe:{self._label}")
+
+    async def _probe(self) -> None:
+        stream = aiter(self._inner.stream_reply(self._PROBE_MESSAGES))
+        try:
+            await asyncio.wait_for(anext(stream), timeout=self._config.ai_breaker_slow_call_seconds)
+        except StopAsyncIteration:
+            self._close()
+        except Exception as e:  # noqa: BLE001 - classified below; any answer at all proves the provider is up.
+            if is_provider_failure(e):
+                self._open(f"probe failed: {e!r}")
+            else:
+                # The provider answered, if only to reject the probe.
+                self._close()
+        else:
+            self._close()
+        finally:
+            with suppress(Exception):
+                await stream.aclose()
+
+    async def aclose(self) -> None:
+        if self._probe_timer:
+            self._probe_timer.cancel()
+        if self._probe_task and not self._probe_task.done():
+            self._probe_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._probe_task
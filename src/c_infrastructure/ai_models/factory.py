@@ -1,4 +1,7 @@
+from src.a_domain.model.ai_provider import AIModel
 from src.a_domain.ports.bussiness.ai_port import AiPort
+from src.a_domain.ports.bussiness.token_counter_port import TokenCounterPort
+from src.a_domain.ports.bussiness.usage_recorder_port import UsageRecorderPort
 from src.a_domain.ports.bussiness.web_search_port import WebSearchPort
 from src.a_domain.ports.notification.logging_port import ILoggingPort
 from src.a_domain.types.enums import AiProvider
@@ -7,6 +10,12 @@ from src.c_infrastructure.ai_models.ai_adapter.grok_adapter import GrokAdapter
 from src.c_infrastructure.ai_models.ai_adapter.openai_adapter import OpenAIAdapter
 from src.c_infrastructure.ai_models.ai_adapter.gemini_adapter import GeminiAIAdapter
 from src.c_infrastructure.ai_models.ai_adapter.groq_adapter import GroqAIAdapter
+from src.c_infrastructure.ai_models.base import BaseAIAdapter, LatencyStats
+from src.c_infrastructure.ai_models.circuit_breaker import CircuitBreakerAIAdapter
+from src.c_infrastructure.ai_models.failover import FailoverAIAdapter
+from src.c_infrastructure.ai_models.rate_limiter import ProviderRateLimiter, RateLimitedAIAdapter
+from src.c_infrastructure.services.http_client_pool_service import HttpClientPoolService
+from src.c_infrastructure.services.token_counter_service import TokenCounterService
 
 
 class AiAdapterFactory:
@@ -14,10 +23,26 @@ class AiAdapterFactory:
     Factory class responsible for creating AI model adapter instances based on configuration.
     """
 
-    def __init__(self, config: AppConfig, logger: ILoggingPort, web_search: WebSearchPort | None = None):
+    def __init__(
+        self,
+        config: AppConfig,
+        logger: ILoggingPort,
+        web_search: WebSearchPort | None = None,
+        http_pool: HttpClientPoolService | None = None,
+        rate_limiter: ProviderRateLimiter | None = None,
+        usage_recorder: UsageRecorderPort | None = None,
+        token_counter: TokenCounterPort | None = None,
+    ):
         self._config = config
         self._logger = logger
         self._web_search = web_search
+        self._http_pool = http_pool
+        self._rate_limiter = rate_limiter
+        self._usage_recorder = usage_recorder
+        self._token_counter = token_counter or TokenCounterService(logger)
+        self._base_adapters: dict[AIModel, AiPort] = {}
+        self._breakers: dict[AIModel, CircuitBreakerAIAdapter] = {}
+        self._provider_adapters: dict[AIModel, AiPort] = {}
         self._logger.trace(f"AI Adapter Factory initialised. Active model provider: {self._config.active_model.value}")
 
     def create_adapter(
@@ -39,6 +64,9 @@ class AiAdapterFactory:
                 config=self._config,
                 logger=self._logger,
                 model_name=model_name,
+                http_pool=self._http_pool,
+                usage_recorder=self._usage_recorder,
+                token_counter=self._token_counter,
             )
 
         if provider == AiProvider.GROK:
@@ -46,20 +74,102 @@ class AiAdapterFactory:
                 config=self._config,
                 logger=self._logger,
                 model_name=model_name,
+                http_pool=self._http_pool,
+                usage_recorder=self._usage_recorder,
+                token_counter=self._token_counter,
             )
 
         if provider == AiProvider.GEMINI:
+            # The Gemini SDK manages its own transport and cannot share the httpx pool.
             return GeminiAIAdapter(
                 config=self._config,
                 logger=self._logger,
                 model_name=model_name,
+                usage_recorder=self._usage_recorder,
+                token_counter=self._token_counter,
             )
-        
+
         if provider == AiProvider.GROQ:
             return GroqAIAdapter(
                 config=self._config,
                 logger=self._logger,
                 model_name=model_name,
                 web_search=self._web_search,
+                http_pool=self._http_pool,
+                usage_recorder=self._usage_recorder,
+                token_counter=self._token_counter,
             )
         raise ValueError(f"Unsupported provider: {provider!s}")
+
+    def provider_adapter(self, model: AIModel) -> AiPort:
+        """
+        Returns the shared adapter for a model, built once: the provider adapter, wrapped in a circuit
+        breaker, behind the provider's admission queue. Every chain that includes the model reuses it,
+        so breaker state, rate limits and latency stats are shared too.
+        """
+        adapter = self._provider_adapters.get(model)
+        if adapter is None:
+            base = self.create_adapter(override_provider=model.provider, override_model_name=model.name)
+            self._base_adapters[model] = base
+            adapter = base
+            if self._config.ai_breaker_enabled:
+                adapter = self._breakers[model] = CircuitBreakerAIAdapter(
+                    inner=base, model=model, config=self._config, logger=self._logger
+                )
+            if self._rate_limiter is not None:
+                # Outermost, so queue waits count against failover timeouts but never trip the breaker.
+                adapter = RateLimitedAIAdapter(
+                    inner=adapter,
+                    model=model,
+                    limiter=self._rate_limiter,
+                    token_counter=self._token_counter,
+                    completion_tokens=self._config.ai_completion_tokens_estimate,
+                )
+            self._provider_adapters[model] = adapter
+        return adapter
+
+    def breaker(self, model: AIModel) -> CircuitBreakerAIAdapter | None:
+        return self._breakers.get(model)
+
+    def breakers(self) -> tuple[CircuitBreakerAIAdapter, ...]:
+        return tuple(self._breakers.values())
+
+    def latency_stats(self, model: AIModel) -> LatencyStats | None:
+        base = self._base_adapters.get(model)
+        return base.latency_stats() if isinstance(base, BaseAIAdapter) else None
+
+    async def warm_up(self, model: AIModel) -> None:
+        base = self._base_adapters.get(model)
+        if isinstance(base, BaseAIAdapter):
+            await base.warm_up()
+
+    def create_chain(self, primary: AIModel | None = None) -> FailoverAIAdapter:
+        """
+        Builds a failover chain: the primary model (the active one by default) first, then the rest of
+        available_models in order. Providers that cannot be built (e.g. missing API key) are left out.
+        """
+        primary = primary or AIModel(provider=self._config.active_model, name=self._config.active_model_name)
+        models = [primary]
+        if self._config.ai_failover_enabled:
+            models += [
+                AIModel(provider=provider, name=name)
+                for provider, name in self._config.available_models.items()
+                if provider != primary.provider
+            ]
+
+        chain: list[tuple[AIModel, AiPort]] = []
+        for model in models:
+            try:
+                chain.append((model, self.provider_adapter(model)))
+            except ValueError as e:
+                if model == primary:
+                    raise
+                self._logger.warning(f"Skipping {model.provider.value} in AI failover chain: {e}")
+
+        self._logger.info(f"AI provider chain: {' -> '.join(f'{m.provider.value}/{m.name}' for m, _ in chain)}")
+        return FailoverAIAdapter(
+            chain=chain,
+            logger=self._logger,
+            first_token_timeout=self._config.ai_first_token_timeout_seconds,
+            hedge_after_seconds=self._config.ai_hedge_after_seconds,
+        )
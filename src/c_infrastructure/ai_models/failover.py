@@ -0,0 +1,204 @@
+import asyncio
+import time
+from collections.abc import AsyncIterator, Callable
+from contextlib import suppress
+from dataclasses import dataclass
+
+from src.a_domain.model.ai_provider import AIModel
+from src.a_domain.model.message import Message, MessageRole
+from src.a_domain.ports.bussiness.ai_port import AiPort
+from src.a_domain.ports.notification.logging_port import ILoggingPort
+from src.c_infrastructure.ai_models.base import ERROR_REPLY
+from src.c_infrastructure.ai_models.circuit_breaker import CircuitOpenError
+
+
+@dataclass(frozen=True)
+class ProviderStats:
+    provider: str
+    model_name: str
+    attempts: int
+    wins: int
+    failures: int
+    timeouts: int
+    skipped: int
+    hedged_starts: int
+    avg_time_to_first_token: float
+
+
+@dataclass
+class _ProviderCounters:
+    attempts: int = 0
+    wins: int = 0
+    failures: int = 0
+    timeouts: int = 0
+    skipped: int = 0
+    hedged_starts: int = 0
+    first_token_total: float = 0.0
+
+
+@dataclass
+class _Attempt:
+    model: AIModel
+    stream: AsyncIterator[str]
+    started_at: float
+
+
+class FailoverAIAdapter(AiPort):
+    """
+    Tries an ordered chain of providers until one starts answering.
+
+    A provider fails over when it raises (including an open circuit breaker) or produces no first
+    token within first_token_timeout.
+    With hedge_after_seconds > 0 the next provider is started alongside a slow one; the first to
+    produce a token wins and the other is cancelled. Once text has been streamed the provider is
+    committed, since switching mid-answer would repeat or garble the reply.
+    """
+
+    def __init__(
+        self,
+        chain: list[tuple[AIModel, AiPort]],
+        logger: ILoggingPort,
+        first_token_timeout: float,
+        hedge_after_seconds: float = 0.0,
+    ):
+        if not chain:
+            raise ValueError("FailoverAIAdapter needs at least one provider.")
+        self._chain = chain
+        self._logger = logger
+        self._first_token_timeout = first_token_timeout
+        self._hedge_after = hedge_after_seconds
+        self._counters = {model: _ProviderCounters() for model, _ in chain}
+
+    async def stream_reply(
+        self, messages: tuple[Message, ...], on_answer: Callable[[AIModel], None] | None = None
+    ) -> AsyncIterator[str]:
+        """Streams the reply of the first provider to answer; on_answer is told which one that is."""
+        winner = await self._first_responder(messages)
+        if winner is None:
+            self._logger.critical("All AI providers failed. Sending the fallback reply.")
+            yield ERROR_REPLY
+            return
+
+        attempt, first_delta = winner
+        if on_answer is not None:
+            on_answer(attempt.model)
+        try:
+            if first_delta:
+                yield first_delta
+            async for delta in attempt.stream:
+                yield delta
+        finally:
+            await self._close(attempt)
+
+    async def generate_reply(self, messages: tuple[Message, ...]) -> Message:
+        try:
+            parts = [delta async for delta in self.stream_reply(messages)]
+            return Message(role=MessageRole.ASSISTANT, content="".join(parts))
+        except Exception:
+            self._logger.exception(f"[{self.__class__.__name__}] Reply failed after the provider started answering")
+            return Message(role=MessageRole.ASSISTANT, content=ERROR_REPLY)
+
+    def models(self) -> tuple[AIModel, ...]:
+        return tuple(model for model, _ in self._chain)
+
+    def providers(self) -> tuple[AiPort, ...]:
+        return tuple(adapter for _, adapter in self._chain)
+
+    async def aclose(self) -> None:
+        for adapter in self.providers():
+            aclose = getattr(adapter, "aclose", None)
+            if aclose:
+                await aclose()
+
+    def stats(self) -> tuple[ProviderStats, ...]:
+        return tuple(
+            ProviderStats(
+                provider=model.provider.value,
+                model_name=model.name,
+                attempts=counters.attempts,
+                wins=counters.wins,
+                failures=counters.failures,
+                timeouts=counters.timeouts,
+                skipped=counters.skipped,
+                hedged_starts=counters.hedged_starts,
+                avg_time_to_first_token=round(counters.first_token_total / counters.wins, 3) if counters.wins else 0.0,
+            )
+            for model, counters in self._counters.items()
+        )
+
+    async def _first_responder(self, messages: tuple[Message, ...]) -> tuple[_Attempt, str] | None:
+        candidates = iter(self._chain)
+        running: dict[asyncio.Task[str], _Attempt] = {}
+
+        def start_next(hedged: bool = False) -> bool:
+            for model, adapter in candidates:
+                attempt = _Attempt(
+                    model=model, stream=aiter(adapter.stream_reply(messages)), started_at=time.perf_counter()
+                )
+                running[asyncio.create_task(self._first_delta(attempt))] = attempt
+                counters = self._counters[model]
+                counters.attempts += 1
+                if hedged:
+                    counters.hedged_starts += 1
+                    self._logger.info(f"Hedging slow AI request with {model.provider.value}/{model.name}")
+                return True
+            return False
+
+        start_next()
+        try:
+            while running:
+                hedge = self._hedge_after if self._hedge_after > 0 and len(running) == 1 else None
+                done, _ = await asyncio.wait(running, timeout=hedge, return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    start_next(hedged=True)
+                    continue
+
+                for task in done:
+                    attempt = running.pop(task)
+                    error = task.exception()
+                    if error is None:
+                        self._record_win(attempt)
+                        return attempt, task.result()
+                    self._record_failure(attempt, error)
+                    await self._close(attempt)
+
+                if not running:
+                    start_next()
+            return None
+        finally:
+            for task, attempt in running.items():
+                task.cancel()
+                with suppress(asyncio.CancelledError, Exception):
+                    await task
+                await self._close(attempt)
+
+    async def _first_delta(self, attempt: _Attempt) -> str:
+        try:
+            return await asyncio.wait_for(anext(attempt.stream), timeout=self._first_token_timeout)
+        except StopAsyncIteration:
+            # An empty reply is still an answer; let the styler deal with it.
+            return ""
+
+    def _record_win(self, attempt: _Attempt) -> None:
+        counters = self._counters[attempt.model]
+        counters.wins += 1
+        counters.first_token_total += time.perf_counter() - attempt.started_at
+
+    def _record_failure(self, attempt: _Attempt, error: BaseException) -> None:
+        counters = self._counters[attempt.model]
+        label = f"{attempt.model.provider.value}/{attempt.model.name}"
+        if isinstance(error, CircuitOpenError):
+            counters.skipped += 1
+            self._logger.debug(f"{label} skipped: circuit is open.")
+        elif isinstance(error, TimeoutError):
+            counters.timeouts += 1
+            self._logger.warning(f"{label} produced no token within {self._first_token_timeout}s. Failing over.")
+        else:
+            counters.failures += 1
+            self._logger.warning(f"{label} failed: {error!r}. Failing over.")
+
+    async def _close(self, attempt: _Attempt) -> None:
+        aclose = getattr(attempt.stream, "aclose", None)
+        if aclose:
+            with suppress(Exception):
+                await aclose()
@@ -1,114 +1,146 @@
 import asyncio
 import httpx
 import google.generativeai as genai  # type: ignore[import-untyped]
-from openai import AsyncOpenAI, OpenAIError
+from openai import AsyncOpenAI
 from src.a_domain.model.ai_provider import AIModel
 from src.a_domain.ports.bussiness.model_catalog_port import ModelCatalogPort
 from src.a_domain.ports.notification.logging_port import ILoggingPort
 from src.a_domain.types.enums import AiProvider
 from src.b_application.configuration.schemas import AppConfig
+from src.c_infrastructure.ai_models.ai_adapter.grok_adapter import GrokAdapter
+from src.c_infrastructure.ai_models.ai_adapter.groq_adapter import GroqAIAdapter
+from src.c_infrastructure.ai_models.ai_adapter.openai_adapter import OpenAIAdapter
+from src.c_infrastructure.services.http_client_pool_service import HttpClientPoolService
 
 
 class ModelsCatalog(ModelCatalogPort):
-    def __init__(self, config: AppConfig, logger: ILoggingPort):
+    """
+    Live model listing straight from each provider's API. Every call hits the network;
+    use CachedModelCatalog on the request path.
+    """
+
+    def __init__(self, config: AppConfig, logger: ILoggingPort, http_pool: HttpClientPoolService | None = None):
         self._config = config
         self._logger = logger
         self._timeout = httpx.Timeout(self._config.ai_model_connection_timeout)
-        self._openai_client = (
-            AsyncOpenAI(api_key=self._config.openai_api_key, timeout=self._timeout)
-            if self._config.openai_api_key
-            else None
-        )
-        self._xai_client = (
-            AsyncOpenAI(
-                api_key=self._config.grok_api_key,
-                base_url="https://api.x.ai/v1",
-                timeout=self._timeout,
-            )
-            if self._config.grok_api_key
-            else None
+        self._http_pool = http_pool
+        self._openai_client = self._openai_compatible_client(self._config.openai_api_key, OpenAIAdapter.openai_base_url)
+        self._xai_client = self._openai_compatible_client(self._config.grok_api_key, GrokAdapter.grok_base_url)
+        self._groq_client = self._openai_compatible_client(self._config.groq_api_key, GroqAIAdapter.groq_base_url)
+
+    def _openai_compatible_client(self, api_key: str | None, base_url: str) -> AsyncOpenAI | None:
+        if not api_key:
+            return None
+        return AsyncOpenAI(
+            api_key=api_key,
+            base_url=base_url,
+            timeout=self._timeout,
+            http_client=self._http_client(base_url),
         )
 
+    def _http_client(self, base_url: str) -> httpx.AsyncClient | None:
+        return self._http_pool.client_for(base_url) if self._http_pool else None
+
+    def configured_providers(self) -> tuple[AiProvider, ...]:
+        configured = {
+            AiProvider.OPENAI: self._openai_client is not None,
+            AiProvider.GROK: self._xai_client is not None,
+            AiProvider.GEMINI: bool(self._config.gemini_api_key),
+            AiProvider.GROQ: self._groq_client is not None,
+        }
+        return tuple(provider for provider, ok in configured.items() if ok)
+
+    async def fetch_models(self, provider: AiProvider) -> tuple[AIModel, ...]:
+        """
+        Lists one provider's chat models. Raises on API errors so callers can keep a last known good list.
+        """
+        if provider == AiProvider.OPENAI:
+            return await self._fetch_openai_models()
+        if provider == AiProvider.GROK:
+            return await self._fetch_grok_models()
+        if provider == AiProvider.GEMINI:
+            return await self._fetch_gemini_models()
+        if provider == AiProvider.GROQ:
+            return await self._fetch_groq_models()
+        raise ValueError(f"Unsupported provider: {provider!s}")
+
     async def _fetch_openai_models(self) -> tuple[AIModel, ...]:
         if not self._openai_client:
             self._logger.debug("OpenAI API key not configured. Skipping model fetch.")
             return tuple()
         self._logger.debug("Fetching models from OpenAI...")
-        try:
-            resp = await self._openai_client.models.list()
-            models = tuple(
-                AIModel(provider=AiProvider.OPENAI, name=m.id)
-                for m in getattr(resp, "data", [])
-                if "gpt" in getattr(m, "id", "")
-            )
-            self._logger.info(f"Found {len(models)} compatible models from OpenAI.")
-            return models
-        except OpenAIError as e:
-            self._logger.error(f"OpenAI API error while listing models: {e}")
-            return tuple()
-        except Exception as e:
-            self._logger.critical(f"Unexpected error fetching OpenAI models: {e}")
-            return tuple()
+        resp = await self._openai_client.models.list()
+        models = tuple(
+            AIModel(provider=AiProvider.OPENAI, name=m.id)
+            for m in getattr(resp, "data", [])
+            if "gpt" in getattr(m, "id", "")
+        )
+        self._logger.info(f"Found {len(models)} compatible models from OpenAI.")
+        return models
 
     async def _fetch_grok_models(self) -> tuple[AIModel, ...]:
         if not self._xai_client:
             self._logger.debug("Grok API key not configured. Skipping model fetch.")
             return tuple()
         self._logger.debug("Fetching models from Grok (X.ai)...")
-        try:
-            resp = await self._xai_client.models.list()
-            models = tuple(
-                AIModel(provider=AiProvider.GROK, name=m.id)
-                for m in getattr(resp, "data", [])
-                if getattr(m, "id", None)
-            )
-            self._logger.info(f"Found {len(models)} models from Grok (X.ai).")
-            return models
-        except OpenAIError as e:
-            self._logger.error(f"Grok API error while listing models: {e}")
-            return tuple()
-        except Exception as e:
-            self._logger.critical(f"Unexpected error fetching Grok models: {e}")
+        resp = await self._xai_client.models.list()
+        models = tuple(
+            AIModel(provider=AiProvider.GROK, name=m.id)
+            for m in getattr(resp, "data", [])
+            if getattr(m, "id", None)
+        )
+        self._logger.info(f"Found {len(models)} models from Grok (X.ai).")
+        return models
+
+    async def _fetch_groq_models(self) -> tuple[AIModel, ...]:
+        if not self._groq_client:
+            self._logger.debug("Groq API key not configured. Skipping model fetch.")
             return tuple()
+        self._logger.debug("Fetching models from Groq...")
+        resp = await self._groq_client.models.list()
+        models = tuple(
+            AIModel(provider=AiProvider.GROQ, name=m.id)
+            for m in getattr(resp, "data", [])
+            # Groq also serves speech models (whisper) from the same listing.
+            if getattr(m, "id", None) and "whisper" not in m.id
+        )
+        self._logger.info(f"Found {len(models)} models from Groq.")
+        return models
 
-    async def _fetch_gemini_models(self) -> tuple[str, ...]:
+    async def _fetch_gemini_models(self) -> tuple[AIModel, ...]:
         if not getattr(self._config, "gemini_api_key", None):
             self._logger.debug("Gemini API key not configured. Skipping model fetch.")
             return tuple()
         self._logger.debug("Fetching models from Gemini...")
-        try:
-            genai.configure(api_key=self._config.gemini_api_key)  # type: ignore[attr-defined]
-            resp = await asyncio.to_thread(
-                lambda: getattr(genai, "list_models", lambda: [])()
-            )
-            ids = tuple(getattr(m, "name", str(m)) for m in resp or [])
-            return ids
-        except Exception as e:
-            self._logger.error(f"Gemini API error while listing models: {e}")
-            return tuple()
+        genai.configure(api_key=self._config.gemini_api_key)  # type: ignore[attr-defined]
+        # list_models is a blocking, paginated iterator; drain it off the event loop.
+        resp = await asyncio.to_thread(lambda: list(genai.list_models()))  # type: ignore[attr-defined]
+        models = tuple(
+            AIModel(provider=AiProvider.GEMINI, name=getattr(m, "name", "").removeprefix("models/"))
+            for m in resp
+            if "generateContent" in (getattr(m, "supported_generation_methods", None) or [])
+        )
+        self._logger.info(f"Found {len(models)} chat models from Gemini.")
+        return models
 
     async def list_chat_models(self) -> tuple[AIModel, ...]:
         self._logger.info(
             "Starting to fetch model lists from all configured providers."
         )
-        tasks = []
-        if self._openai_client:
-            tasks.append(self._fetch_openai_models())
-        if self._xai_client:
-            tasks.append(self._fetch_grok_models())
-        if not tasks:
+        providers = self.configured_providers()
+        if not providers:
             self._logger.warning(
                 "No AI providers are configured with API keys. Cannot fetch any models."
             )
             return tuple()
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        results = await asyncio.gather(*(self.fetch_models(p) for p in providers), return_exceptions=True)
         all_models: list[AIModel] = []
-        for result in results:
+        for provider, result in zip(providers, results):
             if isinstance(result, Exception):
-                self._logger.error(f"A task failed during model fetching: {result}")
-            elif isinstance(result, tuple):
+                self._logger.error(f"Fetching models from {provider.value} failed: {result}")
+            else:
                 all_models.extend(result)
-        sorted_models = sorted(all_models, key=lambda m: (m.provider.value, m.name))
+        sorted_models = sorted(set(all_models), key=lambda m: (m.provider.value, m.name))
         self._logger.success(
             f"Total unique models fetched from all providers: {len(sorted_models)}"
         )
@@ -0,0 +1,315 @@
+import asyncio
+import itertools
+import re
+import time
+from collections import Counter, deque
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
+from typing import ClassVar
+
+import httpx
+
+from src.a_domain.model.ai_provider import AIModel
+from src.a_domain.model.message import Message
+from src.a_domain.ports.bussiness.ai_port import AiPort
+from src.a_domain.ports.bussiness.token_counter_port import TokenCounterPort
+from src.a_domain.ports.notification.logging_port import ILoggingPort
+from src.a_domain.types.enums import AiProvider, RequestPriority
+from src.b_application.configuration.schemas import AppConfig
+from src.b_application.request_context import current_priority, current_user_id
+
+
+@dataclass(frozen=True)
+class ProviderLimitStats:
+    provider: AiProvider
+    max_concurrency: int
+    tokens_per_minute: int | None
+    in_flight: int
+    queued: int
+    tokens_last_minute: int
+    admitted: int
+    throttled_by_server: int
+    avg_wait_seconds: float
+    max_wait_seconds: float
+    blocked_for_seconds: float
+
+
+@dataclass
+class _Waiter:
+    priority: int
+    seq: int
+    user_id: str
+    tokens: int
+    future: asyncio.Future = field(repr=False)
+
+
+class _ProviderGate:
+    """
+    Admission control for one provider: a concurrency cap, a rolling one-minute token budget and
+    any pause the provider asked for through its rate-limit headers.
+    """
+
+    _WINDOW_SECONDS = 60.0
+    _MAX_TRACKED_USERS = 4096
+
+    def __init__(self, provider: AiProvider, max_concurrency: int, tokens_per_minute: int | None):
+        self.provider = provider
+        self.max_concurrency = max_concurrency
+        self.configured_tpm = tokens_per_minute
+        self.server_tpm: int | None = None
+        self.blocked_until = 0.0
+        self.in_flight = 0
+        self.in_flight_by_user: Counter[str] = Counter()
+        self.last_admitted: dict[str, float] = {}
+        self.spent: deque[tuple[float, int]] = deque()
+        self.waiters: list[_Waiter] = []
+        self.admitted = 0
+        self.throttled_by_server = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self._seq = itertools.count()
+        self._timer: asyncio.TimerHandle | None = None
+
+    @property
+    def tokens_per_minute(self) -> int | None:
+        limits = [limit for limit in (self.configured_tpm, self.server_tpm) if limit]
+        return min(limits) if limits else None
+
+    async def acquire(self, user_id: str, priority: int, tokens: int) -> float:
+        started = time.monotonic()
+        if not self.waiters and self._can_admit(tokens, started):
+            self._admit(user_id, tokens, started)
+            return 0.0
+
+        waiter = _Waiter(priority, next(self._seq), user_id, tokens, asyncio.get_running_loop().create_future())
+        self.waiters.append(waiter)
+        self._dispatch()
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            if waiter in self.waiters:
+                self.waiters.remove(waiter)
+            elif waiter.future.done() and not waiter.future.cancelled():
+                # Admitted in the same tick the caller gave up: hand the slot back.
+                self.release(user_id)
+            raise
+        waited = time.monotonic() - started
+        self.total_wait += waited
+        self.max_wait = max(self.max_wait, waited)
+        return waited
+
+    def release(self, user_id: str) -> None:
+        self.in_flight -= 1
+        self.in_flight_by_user[user_id] -= 1
+        if self.in_flight_by_user[user_id] <= 0:
+            del self.in_flight_by_user[user_id]
+        self._dispatch()
+
+    def pause(self, seconds: float) -> None:
+        self.blocked_until = max(self.blocked_until, time.monotonic() + seconds)
+        self._dispatch()
+
+    def tokens_last_minute(self, now: float) -> int:
+        while self.spent and self.spent[0][0] <= now - self._WINDOW_SECONDS:
+            self.spent.popleft()
+        return sum(tokens for _, tokens in self.spent)
+
+    def _can_admit(self, tokens: int, now: float) -> bool:
+        if self.in_flight >= self.max_concurrency or now < self.blocked_until:
+            return False
+        budget = self.tokens_per_minute
+        if budget is None:
+            return True
+        used = self.tokens_last_minute(now)
+        # A single request larger than the whole budget still goes through once the window is empty.
+        return used + tokens <= budget or used == 0
+
+    def _admit(self, user_id: str, tokens: int, now: float) -> None:
+        self.in_flight += 1
+        self.in_flight_by_user[user_id] += 1
+        self.last_admitted[user_id] = now
+        if len(self.last_admitted) > self._MAX_TRACKED_USERS:
+            cutoff = now - self._WINDOW_SECONDS
+            self.last_admitted = {user: at for user, at in self.last_admitted.items() if at > cutoff}
+        self.spent.append((now, tokens))
+        self.admitted += 1
+
+    def _next_waiter(self) -> _Waiter:
+        # Highest priority first; within it, the user with the fewest calls in flight, then the one
+        # served least recently (round-robin across users), then arrival order.
+        return min(
+            self.waiters,
+            key=lambda w: (
+                w.priority,
+                self.in_flight_by_user[w.user_id],
+                self.last_admitted.get(w.user_id, 0.0),
+                w.seq,
+            ),
+        )
+
+    def _dispatch(self) -> None:
+        now = time.monotonic()
+        while self.waiters:
+            waiter = self._next_waiter()
+            if not self._can_admit(waiter.tokens, now):
+                self._schedule_retry(now)
+                return
+            self.waiters.remove(waiter)
+            self._admit(waiter.user_id, waiter.tokens, now)
+            waiter.future.set_result(None)
+
+    def _schedule_retry(self, now: float) -> None:
+        # Slots free up on release; time-based limits need a timer.
+        delays = []
+        if now < self.blocked_until:
+            delays.append(self.blocked_until - now)
+        if self.tokens_per_minute is not None and self.spent:
+            delays.append(self.spent[0][0] + self._WINDOW_SECONDS - now)
+        if not delays:
+            return
+        if self._timer:
+            self._timer.cancel()
+        self._timer = asyncio.get_running_loop().call_later(max(0.01, min(delays)), self._dispatch)
+
+
+class ProviderRateLimiter:
+    """
+    Per-provider admission queue in front of the AI adapters.
+
+    Each provider gets a concurrency cap and an optional tokens-per-minute budget. Responses from
+    the OpenAI-compatible APIs are inspected through the shared HTTP pool: x-ratelimit-* headers
+    tighten the budget and pause admissions when the provider reports it is exhausted, and a 429
+    pauses for retry-after. Queue waits are tracked separately from model latency.
+    """
+
+    _DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+    _UNITS: ClassVar[dict[str, float]] = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+    def __init__(self, config: AppConfig, logger: ILoggingPort, hosts: dict[str, AiProvider]):
+        self._config = config
+        self._logger = logger
+        self._hosts = hosts
+        self._gates = {
+            provider: _ProviderGate(
+                provider,
+                config.ai_provider_max_concurrency.get(provider, config.ai_max_concurrency_per_provider),
+                config.ai_provider_tokens_per_minute.get(provider),
+            )
+            for provider in AiProvider
+        }
+
+    async def acquire(self, provider: AiProvider, user_id: str, priority: RequestPriority, tokens: int) -> float:
+        """Waits for an admission slot and returns the seconds spent waiting."""
+        gate = self._gates[provider]
+        waited = await gate.acquire(user_id, int(priority), tokens)
+        if waited > 0.5:
+            self._logger.debug(f"Waited {waited:.2f}s for a {provider.value} slot ({len(gate.waiters)} still queued).")
+        return waited
+
+    def release(self, provider: AiProvider, user_id: str) -> None:
+        self._gates[provider].release(user_id)
+
+    async def observe_response(self, response: httpx.Response) -> None:
+        """httpx response hook: adapts the matching provider's gate to its rate-limit headers."""
+        provider = self._hosts.get(response.request.url.host)
+        if provider is None:
+            return
+        gate = self._gates[provider]
+        headers = response.headers
+
+        limit_tokens = headers.get("x-ratelimit-limit-tokens")
+        if limit_tokens and limit_tokens.isdigit():
+            gate.server_tpm = int(limit_tokens)
+
+        if response.status_code == 429:
+            gate.throttled_by_server += 1
+            delay = self._seconds(headers.get("retry-after")) or self._seconds(headers.get("x-ratelimit-reset-tokens"))
+            delay = delay or self._seconds(headers.get("x-ratelimit-reset-requests")) or 1.0
+            self._logger.warning(f"{provider.value} returned 429. Pausing admissions for {delay:.1f}s.")
+            gate.pause(delay)
+            return
+
+        for kind in ("tokens", "requests"):
+            remaining = headers.get(f"x-ratelimit-remaining-{kind}")
+            if remaining == "0":
+                delay = self._seconds(headers.get(f"x-ratelimit-reset-{kind}"))
+                if delay:
+                    self._logger.info(f"{provider.value} {kind} budget exhausted. Pausing admissions for {delay:.1f}s.")
+                    gate.pause(delay)
+
+    def stats(self) -> tuple[ProviderLimitStats, ...]:
+        now = time.monotonic()
+        return tuple(
+            ProviderLimitStats(
+                provider=provider,
+                max_concurrency=gate.max_concurrency,
+                tokens_per_minute=gate.tokens_per_minute,
+                in_flight=gate.in_flight,
+                queued=len(gate.waiters),
+                tokens_last_minute=gate.tokens_last_minute(now),
+                admitted=gate.admitted,
+                throttled_by_server=gate.throttled_by_server,
+                avg_wait_seconds=round(gate.total_wait / gate.admitted, 3) if gate.admitted else 0.0,
+                max_wait_seconds=round(gate.max_wait, 3),
+                blocked_for_seconds=round(max(0.0, gate.blocked_until - now), 1),
+            )
+            for provider, gate in self._gates.items()
+        )
+
+    def _seconds(self, value: str | None) -> float | None:
+        """Parses retry-after seconds or OpenAI-style durations such as '1m2.5s' or '250ms'."""
+        if not value:
+            return None
+        try:
+            return float(value)
+        except ValueError:
+            pass
+        parts = self._DURATION_PART.findall(value)
+        return sum(float(amount) * self._UNITS[unit] for amount, unit in parts) if parts else None
+
+
+class RateLimitedAIAdapter(AiPort):
+    """
+    Holds one of the provider's admission slots for the whole duration of a streamed reply.
+
+    The call is charged against the tokens-per-minute budget with the model's own prompt token
+    count plus the configured completion estimate.
+    """
+
+    def __init__(
+        self,
+        inner: AiPort,
+        model: AIModel,
+        limiter: ProviderRateLimiter,
+        token_counter: TokenCounterPort,
+        completion_tokens: int,
+    ):
+        self._inner = inner
+        self._model = model
+        self._provider = model.provider
+        self._limiter = limiter
+        self._token_counter = token_counter
+        self._completion_tokens = completion_tokens
+
+    async def stream_reply(self, messages: tuple[Message, ...]) -> AsyncIterator[str]:
+        user_id = await self._acquire(messages)
+        try:
+            async for delta in self._inner.stream_reply(messages):
+                yield delta
+        finally:
+            self._limiter.release(self._provider, user_id)
+
+    async def generate_reply(self, messages: tuple[Message, ...]) -> Message:
+        user_id = await self._acquire(messages)
+        try:
+            return await self._inner.generate_reply(messages)
+        finally:
+            self._limiter.release(self._provider, user_id)
+
+    async def _acquire(self, messages: tuple[Message, ...]) -> str:
+        user_id = current_user_id.get() or "anonymous"
+        await self._limiter.acquire(self._provider, user_id, current_priority.get(), self._estimate_tokens(messages))
+        return user_id
+
+    def _estimate_tokens(self, messages: tuple[Message, ...]) -> int:
+        return self._token_counter.count_messages(messages, self._model) + self._completion_tokens
@@ -0,0 +1,93 @@
+import asyncio
+from collections.abc import Iterable
+
+from src.a_domain.model.ai_provider import AIModel
+from src.a_domain.model.provider_health import ProviderHealth
+from src.a_domain.ports.bussiness.ai_port import AiPort
+from src.a_domain.ports.bussiness.ai_registry_port import AiRegistryPort
+from src.a_domain.ports.notification.logging_port import ILoggingPort
+from src.a_domain.types.enums import CircuitState
+from src.b_application.configuration.schemas import AppConfig
+from src.c_infrastructure.ai_models.circuit_breaker import CircuitBreakerAIAdapter
+from src.c_infrastructure.ai_models.factory import AiAdapterFactory
+from src.c_infrastructure.ai_models.failover import FailoverAIAdapter
+from src.c_infrastructure.ai_models.response_cache import CachingAIAdapter, ResponseCache
+
+
+class AiAdapterRegistry(AiRegistryPort):
+    """
+    Hands out one cached adapter stack per model: failover chain with that model first,
+    circuit breakers shared across chains, and the response cache on top when enabled.
+    """
+
+    def __init__(
+        self,
+        factory: AiAdapterFactory,
+        config: AppConfig,
+        logger: ILoggingPort,
+        response_cache: ResponseCache | None = None,
+    ):
+        self._factory = factory
+        self._config = config
+        self._logger = logger
+        self._response_cache = response_cache
+        self._chains: dict[AIModel, FailoverAIAdapter] = {}
+        self._adapters: dict[AIModel, AiPort] = {}
+
+    def adapter_for(self, model: AIModel) -> AiPort:
+        adapter = self._adapters.get(model)
+        if adapter is None:
+            adapter = self.chain_for(model)
+            if self._response_cache is not None:
+                adapter = CachingAIAdapter(adapter, self._response_cache, self._config, self._logger)
+            self._adapters[model] = adapter
+        return adapter
+
+    def chain_for(self, model: AIModel) -> FailoverAIAdapter:
+        chain = self._chains.get(model)
+        if chain is None:
+            chain = self._factory.create_chain(primary=model)
+            self._chains[model] = chain
+        return chain
+
+    def chains(self) -> dict[AIModel, FailoverAIAdapter]:
+        return dict(self._chains)
+
+    def breakers(self) -> tuple[CircuitBreakerAIAdapter, ...]:
+        return self._factory.breakers()
+
+    def health(self, model: AIModel) -> ProviderHealth:
+        try:
+            self._factory.provider_adapter(model)
+        except ValueError:
+            return ProviderHealth(model=model, available=False)
+
+        breaker = self._factory.breaker(model)
+        available = breaker is None or breaker.state == CircuitState.CLOSED
+        stats = self._factory.latency_stats(model)
+        ttft = stats.avg_time_to_first_token if stats and stats.samples else None
+        return ProviderHealth(model=model, available=available, avg_time_to_first_token=ttft)
+
+    async def warm_up(self, models: Iterable[AIModel]) -> None:
+        """
+        Builds the adapter stacks for the given models and warms every provider in their chains.
+        Every provider is attempted; afterwards a RuntimeError names the ones that failed.
+        """
+        providers: dict[AIModel, None] = {}
+        for model in models:
+            self.adapter_for(model)
+            providers.update(dict.fromkeys(self._chains[model].models()))
+
+        results = await asyncio.gather(*(self._factory.warm_up(model) for model in providers), return_exceptions=True)
+        failed = []
+        for model, result in zip(providers, results):
+            if isinstance(result, BaseException):
+                failed.append(f"{model.provider.value}/{model.name} ({result})")
+            else:
+                self._logger.debug(f"Warmed up {model.provider.value}/{model.name}.")
+        if failed:
+            raise RuntimeError(f"Could not warm up {', '.join(failed)}")
+
+    async def aclose(self) -> None:
+        for breaker in self.breakers():
+            await breaker.aclose()
@@ -0,0 +1,158 @@
+import hashlib
+import re
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+
+from src.a_domain.model.ai_provider import AIModel
+from src.a_domain.model.message import Message, MessageRole
+from src.a_domain.ports.bussiness.ai_port import AiPort
+from src.a_domain.ports.notification.logging_port import ILoggingPort
+from src.b_application.configuration.schemas import AppConfig
+from src.b_application.use_cases.process.search_policy import is_time_sensitive
+from src.c_infrastructure.ai_models.base import ERROR_REPLY
+from src.c_infrastructure.ai_models.failover import FailoverAIAdapter
+
+
+@dataclass(frozen=True)
+class ResponseCacheStats:
+    entries: int
+    max_entries: int
+    hits: int
+    misses: int
+    bypassed: int
+    evictions: int
+    hit_rate: float
+
+
+class ResponseCache:
+    """
+    Size-bounded LRU map of prompt keys to reply text, with a fixed TTL per entry.
+    Shared by every CachingAIAdapter so one budget covers all models.
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: int):
+        self._ttl = ttl_seconds
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._bypassed = 0
+        self._evictions = 0
+
+    def get(self, key: str) -> str | None:
+        entry = self._entries.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            if entry is not None:
+                del self._entries[key]
+            self._misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return entry[1]
+
+    def put(self, key: str, reply: str) -> None:
+        self._entries[key] = (time.monotonic() + self._ttl, reply)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def record_bypass(self) -> None:
+        self._bypassed += 1
+
+    def stats(self) -> ResponseCacheStats:
+        lookups = self._hits + self._misses
+        return ResponseCacheStats(
+            entries=len(self._entries),
+            max_entries=self._max_entries,
+            hits=self._hits,
+            misses=self._misses,
+            bypassed=self._bypassed,
+            evictions=self._evictions,
+            hit_rate=round(self._hits / lookups, 3) if lookups else 0.0,
+        )
+
+
+class CachingAIAdapter(AiPort):
+    """
+    Serves repeated prompts from a ResponseCache in front of a failover chain.
+
+    The key covers the normalized latest user message, a hash of the system prompt, the chain's
+    primary model and a fingerprint of the few turns before it. Time-sensitive questions (the ones
+    that would trigger web search) always go to the model. Replies from a fallback provider are not
+    stored: they would later be served as the primary model's answer.
+    """
+
+    _TRAILING_PUNCTUATION = "?!.~,。！？～，…"
+    _WHITESPACE = re.compile(r"\s+")
+
+    def __init__(self, inner: FailoverAIAdapter, cache: ResponseCache, config: AppConfig, logger: ILoggingPort):
+        self._inner = inner
+        self._cache = cache
+        self._model = inner.models()[0]
+        self._config = config
+        self._logger = logger
+
+    async def stream_reply(self, messages: tuple[Message, ...]) -> AsyncIterator[str]:
+        key = self._key(messages)
+        if key is None:
+            async for delta in self._inner.stream_reply(messages):
+                yield delta
+            return
+
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._logger.debug(f"Response cache hit for model {self._model.name}")
+            yield cached
+            return
+
+        answered: list[AIModel] = []
+        parts: list[str] = []
+        async for delta in self._inner.stream_reply(messages, on_answer=answered.append):
+            parts.append(delta)
+            yield delta
+        # Only a reply that streamed to completion, from the model the key names, is stored.
+        if answered == [self._model]:
+            self._store(key, "".join(parts))
+        elif answered:
+            self._logger.debug(f"Reply from fallback {answered[0].name} not cached under {self._model.name}")
+
+    async def generate_reply(self, messages: tuple[Message, ...]) -> Message:
+        try:
+            parts = [delta async for delta in self.stream_reply(messages)]
+            return Message(role=MessageRole.ASSISTANT, content="".join(parts))
+        except Exception:
+            self._logger.exception(f"[{self.__class__.__name__}] Reply failed after the provider started answering")
+            return Message(role=MessageRole.ASSISTANT, content=ERROR_REPLY)
+
+    def _store(self, key: str, reply: str) -> None:
+        if reply.strip() and reply != ERROR_REPLY:
+            self._cache.put(key, reply)
+
+    def _key(self, messages: tuple[Message, ...]) -> str | None:
+        if not messages or messages[-1].role != MessageRole.USER:
+            return None
+        if is_time_sensitive(messages, self._config):
+            self._cache.record_bypass()
+            return None
+
+        system_prompt = "\n".join(m.content for m in messages if m.role == MessageRole.SYSTEM)
+        turns = [m for m in messages[:-1] if m.role != MessageRole.SYSTEM]
+        context_size = self._config.response_cache_context_messages
+        context = turns[-context_size:] if context_size else []
+
+        digest = hashlib.sha256()
+        for part in (
+            f"{self._model.provider.value}/{self._model.name}",
+            hashlib.sha256(system_prompt.encode()).hexdigest(),
+            *(f"{m.role.value}:{self._normalize(m.content)}" for m in context),
+            self._normalize(messages[-1].content),
+        ):
+            digest.update(part.encode())
+            digest.update(b"\x00")
+        return digest.hexdigest()
+
+    def _normalize(self, text: str) -> str:
+        return self._WHITESPACE.sub(" ", text).strip().casefold().rstrip(self._TRAILING_PUNCTUATION).strip()
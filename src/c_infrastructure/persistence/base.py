@@ -0,0 +1,116 @@
+import asyncio
+import time
+from abc import ABC, abstractmethod
+from collections import Counter, deque
+from collections.abc import Awaitable, Callable
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+from src.a_domain.model.conversation import Conversation
+from src.a_domain.ports.bussiness.repository_port import RepositoryPort
+from src.a_domain.ports.notification.logging_port import ILoggingPort
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class RepositoryOperationStats:
+    operation: str
+    calls: int
+    errors: int
+    avg_ms: float
+    p95_ms: float
+    max_ms: float
+
+
+@dataclass(frozen=True)
+class RepositoryStats:
+    backend: str
+    in_flight: int
+    max_in_flight: int
+    operations: tuple[RepositoryOperationStats, ...]
+
+
+class BaseRepositoryAdapter(RepositoryPort, ABC):
+    """
+    Template for conversation stores: times every operation and reports rolling latency stats.
+
+    Backends with a blocking client pass their own bounded executor and run I/O through _blocking,
+    so disk and database work never stalls the event loop (nor queues behind the default executor).
+    """
+
+    _LATENCY_WINDOW = 500
+
+    def __init__(self, logger: ILoggingPort, executor: Executor | None = None):
+        self._logger = logger
+        self._executor = executor
+        self._calls: Counter[str] = Counter()
+        self._errors: Counter[str] = Counter()
+        self._durations: dict[str, deque[float]] = {}
+        self._in_flight = 0
+        self._max_in_flight = 0
+
+    @abstractmethod
+    async def get_conversation_by_user_id(self, user_id: str) -> Conversation | None: ...
+
+    @abstractmethod
+    async def save(self, conversation: Conversation) -> bool: ...
+
+    async def warm_up(self) -> None:
+        """Opens the backing store ahead of the first request. No-op by default."""
+
+    async def aclose(self) -> None:
+        if self._executor is not None:
+            await asyncio.to_thread(self._executor.shutdown)
+
+    def stats(self) -> RepositoryStats:
+        return RepositoryStats(
+            backend=self.__class__.__name__,
+            in_flight=self._in_flight,
+            max_in_flight=self._max_in_flight,
+            operations=tuple(self._operation_stats(operation) for operation in sorted(self._calls)),
+        )
+
+    async def _timed(self, operation: str, call: Callable[[], Awaitable[T]]) -> T:
+        started = time.perf_counter()
+        self._in_flight += 1
+        self._max_in_flight = max(self._max_in_flight, self._in_flight)
+        ok = False
+        try:
+            result = await call()
+            ok = True
+            return result
+        finally:
+            self._in_flight -= 1
+            self._record(operation, time.perf_counter() - started, ok)
+
+    async def _blocking(self, operation: str, call: Callable[..., T], *args: Any) -> T:
+        """Runs a blocking call on the repository's executor. Includes time spent queued for a free worker."""
+        if self._executor is None:
+            raise RuntimeError(f"{self.__class__.__name__} was created without an executor.")
+        loop = asyncio.get_running_loop()
+        return await self._timed(operation, lambda: loop.run_in_executor(self._executor, call, *args))
+
+    def _record(self, operation: str, seconds: float, ok: bool) -> None:
+        self._calls[operation] += 1
+        if not ok:
+            self._errors[operation] += 1
+        durations = self._durations.get(operation)
+        if durations is None:
+            durations = self._durations[operation] = deque(maxlen=self._LATENCY_WINDOW)
+        durations.append(seconds)
+
+    def _operation_stats(self, operation: str) -> RepositoryOperationStats:
+        durations = sorted(self._durations.get(operation) or ())
+        count = len(durations)
+        if not count:
+            return RepositoryOperationStats(operation, self._calls[operation], self._errors[operation], 0.0, 0.0, 0.0)
+        return RepositoryOperationStats(
+            operation=operation,
+            calls=self._calls[operation],
+            errors=self._errors[operation],
+            avg_ms=round(sum(durations) / count * 1000, 3),
+            p95_ms=round(durations[min(count - 1, int(count * 0.95))] * 1000, 3),
+            max_ms=round(durations[-1] * 1000, 3),
+        )
@@ -1,35 +1,226 @@
+import multiprocessing
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any
+from uuid import UUID
+
 import chromadb
 from src.a_domain.model.conversation import Conversation
-from src.a_domain.ports.bussiness.repository_port import RepositoryPort
+from src.a_domain.model.message import Message
+from src.a_domain.types.enums import MessageRole
 from src.a_domain.ports.notification.logging_port import ILoggingPort
 from src.b_application.configuration.schemas import AppConfig
-from src.c_infrastructure.persistence.chroma.schema import ChromaCollection, ChromaResultKey
+from src.c_infrastructure.persistence.base import BaseRepositoryAdapter
+from src.c_infrastructure.persistence.chroma.schema import (
+    MAX_WRITE_BATCH,
+    PLACEHOLDER_EMBEDDING,
+    ChromaCollection,
+    ChromaMetadataKey,
+    ChromaRecordKind,
+    ChromaResultKey,
+)
 from src.c_infrastructure.persistence.chroma.mapper import ConversationMapper
 
-class ChromaRepositoryAdapter(RepositoryPort):
-    
-    def __init__(self, config: AppConfig, logger: ILoggingPort) -> None:
-        self._logger = logger
-        self._logger.info(f"Initializing ChromaDB at: {config.chroma_persist_path}")
-        
-        self._client = chromadb.PersistentClient(path=config.chroma_persist_path)
-        
-        self._collection = self._client.get_or_create_collection(
-            name=ChromaCollection.CHAT_HISTORY
+# --- Worker process ---
+# chromadb's embedded client holds the GIL for the whole call, so a thread pool would still stall
+# the event loop. The collection lives in one dedicated process instead; it is also the only
+# client on the persist path, which Chroma requires.
+
+_collection: Any = None
+
+
+def _open_collection(path: str) -> None:
+    global _collection
+    client = chromadb.PersistentClient(path=path)
+    _collection = client.get_or_create_collection(name=ChromaCollection.CHAT_HISTORY)
+
+
+def _ping() -> None:
+    pass
+
+
+def _get(user_id: str, limit: int) -> Conversation | None:
+    header = _collection.get(ids=[user_id], include=["documents", "metadatas"])
+    documents = header.get(ChromaResultKey.DOCUMENTS)
+
+    if not documents:
+        return None
+    metadata = header[ChromaResultKey.METADATAS][0]
+    if not ConversationMapper.is_header(metadata):
+        conversation = ConversationMapper.to_domain(documents[0])
+        _upsert(conversation)  # migrates the legacy document to header + message records
+        return _get(user_id, limit)
+
+    count = metadata[ChromaMetadataKey.MESSAGE_COUNT]
+    start = max(0, count - limit) if limit > 0 else 0
+    # Keep the summary boundary loaded, or already summarized turns would look new to the summarizer.
+    through = metadata.get(ChromaMetadataKey.SUMMARY_THROUGH_SEQ)
+    if through is not None:
+        start = min(start, through)
+
+    records = _messages(user_id, {ChromaMetadataKey.SEQ: {"$gte": start}})
+    if start > 0:
+        # System messages (the persona prompt) are always part of the context.
+        system = {ChromaMetadataKey.ROLE: MessageRole.SYSTEM.value}
+        records += _messages(user_id, system, {ChromaMetadataKey.SEQ: {"$lt": start}})
+    records.sort()
+    messages = tuple(ConversationMapper.message_to_domain(document) for _, document in records)
+    return ConversationMapper.header_to_domain(documents[0], messages)
+
+
+def _upsert(conversation: Conversation) -> None:
+    """
+    Appends the messages that are not stored yet and rewrites the small header record.
+    An empty conversation (cleared history) deletes the stored messages.
+    """
+    user_id = conversation.user_id
+    header = _collection.get(ids=[user_id], include=["metadatas"])
+    metadatas = header.get(ChromaResultKey.METADATAS) or [None]
+    metadata = metadatas[0] if ConversationMapper.is_header(metadatas[0]) else {}
+    count = metadata.get(ChromaMetadataKey.MESSAGE_COUNT, 0)
+
+    if not conversation.messages and count:
+        _collection.delete(where=_where(user_id, {ChromaMetadataKey.KIND: ChromaRecordKind.MESSAGE}))
+        count = 0
+    new_messages = _unsaved(conversation, metadata.get(ChromaMetadataKey.LAST_MESSAGE_ID), count)
+
+    seqs: dict[UUID, int] = {}
+    for offset in range(0, len(new_messages), MAX_WRITE_BATCH):
+        batch = new_messages[offset : offset + MAX_WRITE_BATCH]
+        records = [
+            ConversationMapper.message_to_persistence(user_id, count + offset + index, message)
+            for index, message in enumerate(batch)
+        ]
+        _collection.upsert(
+            ids=[record_id for record_id, _, _ in records],
+            documents=[document for _, document, _ in records],
+            metadatas=[record_metadata for _, _, record_metadata in records],
+            embeddings=[PLACEHOLDER_EMBEDDING] * len(records),
         )
+        seqs.update((message.id, count + offset + index) for index, message in enumerate(batch))
+    count += len(new_messages)
+
+    if new_messages:
+        last_message_id = str(new_messages[-1].id)
+    else:
+        last_message_id = metadata.get(ChromaMetadataKey.LAST_MESSAGE_ID) if count else None
+
+    json_str, header_metadata = ConversationMapper.header_to_persistence(
+        conversation, count, last_message_id, _summary_through_seq(conversation, metadata, seqs)
+    )
+    _collection.upsert(
+        ids=[user_id],
+        documents=[json_str],
+        metadatas=[header_metadata],
+        # Skips embedding the record with the default ONNX model on every save.
+        embeddings=[PLACEHOLDER_EMBEDDING],
+    )
+
+
+def _unsaved(conversation: Conversation, last_message_id: str | None, count: int) -> tuple[Message, ...]:
+    messages = conversation.messages
+    if count == 0:
+        return messages
+    # Fast path: the conversation was loaded from the latest state, so everything after the last stored id is new.
+    for index in range(len(messages) - 1, -1, -1):
+        if str(messages[index].id) == last_message_id:
+            return messages[index + 1 :]
+    # Someone else saved in between: skip whatever is already stored.
+    stored = {
+        metadata[ChromaMetadataKey.MESSAGE_ID]
+        for metadata in _collection.get(
+            where=_where(conversation.user_id, {ChromaMetadataKey.MESSAGE_ID: {"$in": [str(m.id) for m in messages]}}),
+            include=["metadatas"],
+        )[ChromaResultKey.METADATAS]
+    }
+    return tuple(m for m in messages if str(m.id) not in stored)
+
+
+def _summary_through_seq(conversation: Conversation, metadata: dict[str, Any], seqs: dict[UUID, int]) -> int | None:
+    through = conversation.summary_through
+    if through is None:
+        return None
+    if through in seqs:
+        return seqs[through]
+    found = _collection.get(
+        where=_where(conversation.user_id, {ChromaMetadataKey.MESSAGE_ID: str(through)}),
+        include=["metadatas"],
+    )[ChromaResultKey.METADATAS]
+    return found[0][ChromaMetadataKey.SEQ] if found else metadata.get(ChromaMetadataKey.SUMMARY_THROUGH_SEQ)
+
+
+def _messages(user_id: str, *conditions: dict[str, Any]) -> list[tuple[int, str]]:
+    result = _collection.get(
+        where=_where(user_id, {ChromaMetadataKey.KIND: ChromaRecordKind.MESSAGE}, *conditions),
+        include=["documents", "metadatas"],
+    )
+    return [
+        (metadata[ChromaMetadataKey.SEQ], document)
+        for document, metadata in zip(result[ChromaResultKey.DOCUMENTS], result[ChromaResultKey.METADATAS])
+    ]
+
+
+def _where(user_id: str, *conditions: dict[str, Any]) -> dict[str, Any]:
+    return {"$and": [{ChromaMetadataKey.USER_ID: user_id}, *conditions]}
+
+
+def export_conversations(path: str, batch_size: int = 500) -> Iterator[Conversation]:
+    """
+    Yields every stored conversation with its full history, in either layout, without migrating
+    anything. Runs in the calling process: only use it while the service is not running on the path.
+    """
+    _open_collection(path)
+    offset = 0
+    while True:
+        page = _collection.get(limit=batch_size, offset=offset, include=["metadatas"])
+        ids, metadatas = page[ChromaResultKey.IDS], page[ChromaResultKey.METADATAS]
+        if not ids:
+            return
+        offset += len(ids)
+
+        legacy_ids = []
+        for record_id, metadata in zip(ids, metadatas):
+            if ConversationMapper.is_header(metadata):
+                conversation = _get(record_id, 0)
+                if conversation is not None:
+                    yield conversation
+            elif not metadata or metadata.get(ChromaMetadataKey.KIND) != ChromaRecordKind.MESSAGE:
+                legacy_ids.append(record_id)
+
+        if legacy_ids:
+            legacy = _collection.get(ids=legacy_ids, include=["documents"])
+            for document in legacy[ChromaResultKey.DOCUMENTS]:
+                yield ConversationMapper.to_domain(document)
+
+
+class ChromaRepositoryAdapter(BaseRepositoryAdapter):
+    """
+    Conversation store on an embedded Chroma collection, driven from a dedicated worker process
+    so that Chroma's SQLite and disk I/O (and the JSON mapping) never run on the event loop.
+
+    Each message is its own record and a save only appends the new ones, so a turn writes
+    O(new messages) instead of the whole history. Reads load the newest conversation_history_limit
+    messages. Legacy single-document conversations are migrated the first time they are read.
+    """
+
+    def __init__(self, config: AppConfig, logger: ILoggingPort) -> None:
+        self._path = config.chroma_persist_path
+        self._history_limit = config.conversation_history_limit
+        super().__init__(logger, executor=self._create_executor())
+        self._logger.info(f"Initializing ChromaDB at: {self._path}")
+
+    async def warm_up(self) -> None:
+        # Starts the worker process and opens the collection.
+        await self._blocking("open", _ping)
 
     async def get_conversation_by_user_id(self, user_id: str) -> Conversation | None:
         self._logger.debug(f"Fetching conversation for user_id: {user_id}")
-        
-        try:
-            result = self._collection.get(ids=[user_id])
-            documents = result.get(ChromaResultKey.DOCUMENTS)
 
-            if not documents:
-                return None
-            return ConversationMapper.to_domain(documents[0])
-            
+        try:
+            return await self._blocking("get", _get, user_id, self._history_limit)
         except Exception as e:
+            self._recover(e)
             self._logger.error(f"Error fetching conversation for user {user_id}: {e}")
             return None
 
@@ -37,15 +228,23 @@ class ChromaRepositoryAdapter(RepositoryPort):
         self._logger.debug(f"Saving conversation for user_id: {conversation.user_id}")
 
         try:
-            json_str, metadata = ConversationMapper.to_persistence(conversation)
-
-            self._collection.upsert(
-                ids=[conversation.user_id],
-                documents=[json_str],
-                metadatas=[metadata],
-            )
+            await self._blocking("save", _upsert, conversation)
             return True
-            
         except Exception as e:
+            self._recover(e)
             self._logger.critical(f"Error saving conversation to Chroma: {e}")
             return False
+
+    def _create_executor(self) -> ProcessPoolExecutor:
+        # spawn: forking a process that already runs an event loop and threads is unsafe.
+        return ProcessPoolExecutor(
+            max_workers=1,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_open_collection,
+            initargs=(self._path,),
+        )
+
+    def _recover(self, error: Exception) -> None:
+        if isinstance(error, BrokenProcessPool):
+            self._logger.warning("Chroma worker process died. Starting a new one.")
+            self._executor = self._create_executor()
@@ -1,5 +1,4 @@
 import json
-from dataclasses import asdict
 from datetime import datetime
 from uuid import UUID
 from typing import Any
@@ -7,51 +6,103 @@ from typing import Any
 from src.a_domain.model.conversation import Conversation
 from src.a_domain.model.message import Message
 from src.a_domain.types.enums import MessageRole
-from src.c_infrastructure.persistence.chroma.schema import ChromaMetadataKey
+from src.c_infrastructure.persistence.chroma.schema import ChromaMetadataKey, ChromaRecordKind
+
+
+def _json_serializer(obj):
+    if isinstance(obj, (datetime,)):
+        return obj.isoformat()
+    if isinstance(obj, (UUID,)):
+        return str(obj)
+    raise TypeError(f"Type {type(obj)} not serializable")
+
 
 class ConversationMapper:
-    
+
+    @staticmethod
+    def is_header(metadata: dict[str, Any] | None) -> bool:
+        """False for the legacy format, where the whole conversation is one document under the user id."""
+        return bool(metadata) and metadata.get(ChromaMetadataKey.KIND) == ChromaRecordKind.HEADER
+
     @staticmethod
-    def to_persistence(conversation: Conversation) -> tuple[str, dict[str, Any]]:
-        """        """
+    def message_record_id(user_id: str, seq: int) -> str:
+        return f"{user_id}:{seq}"
+
+    @staticmethod
+    def header_to_persistence(
+        conversation: Conversation, message_count: int, last_message_id: str | None, summary_through_seq: int | None
+    ) -> tuple[str, dict[str, Any]]:
         metadata: dict[str, Any] = {
+            ChromaMetadataKey.KIND: ChromaRecordKind.HEADER,
+            ChromaMetadataKey.USER_ID: conversation.user_id,
             ChromaMetadataKey.UPDATED_AT: conversation.updated_at.isoformat(),
-            ChromaMetadataKey.MESSAGE_COUNT: len(conversation.messages),
+            ChromaMetadataKey.MESSAGE_COUNT: message_count,
             ChromaMetadataKey.MODEL_NAME: conversation.selected_model_name or "unknown",
         }
+        # Chroma metadata values cannot be None; absent keys mean "no value".
+        if last_message_id is not None:
+            metadata[ChromaMetadataKey.LAST_MESSAGE_ID] = last_message_id
+        if summary_through_seq is not None:
+            metadata[ChromaMetadataKey.SUMMARY_THROUGH_SEQ] = summary_through_seq
 
-        data = asdict(conversation)
-
-        def _json_serializer(obj):
-            if isinstance(obj, (datetime,)):
-                return obj.isoformat()
-            if isinstance(obj, (UUID,)):
-                return str(obj)
-            raise TypeError(f"Type {type(obj)} not serializable")
+        data = {
+            "user_id": conversation.user_id,
+            "id": conversation.id,
+            "selected_model_name": conversation.selected_model_name,
+            "summary": conversation.summary,
+            "summary_through": conversation.summary_through,
+            "created_at": conversation.created_at,
+            "updated_at": conversation.updated_at,
+        }
+        return json.dumps(data, default=_json_serializer, ensure_ascii=False), metadata
 
+    @staticmethod
+    def message_to_persistence(user_id: str, seq: int, message: Message) -> tuple[str, str, dict[str, Any]]:
+        metadata: dict[str, Any] = {
+            ChromaMetadataKey.KIND: ChromaRecordKind.MESSAGE,
+            ChromaMetadataKey.USER_ID: user_id,
+            ChromaMetadataKey.SEQ: seq,
+            ChromaMetadataKey.ROLE: message.role.value,
+            ChromaMetadataKey.MESSAGE_ID: str(message.id),
+        }
+        data = {"id": message.id, "role": message.role.value, "content": message.content, "timestamp": message.timestamp}
         json_str = json.dumps(data, default=_json_serializer, ensure_ascii=False)
-        
-        return json_str, metadata
+        return ConversationMapper.message_record_id(user_id, seq), json_str, metadata
+
+    @staticmethod
+    def message_to_domain(json_str: str) -> Message:
+        return ConversationMapper._message(json.loads(json_str))
+
+    @staticmethod
+    def header_to_domain(json_str: str, messages: tuple[Message, ...]) -> Conversation:
+        data = json.loads(json_str)
+        return ConversationMapper._conversation(data, messages)
 
     @staticmethod
     def to_domain(json_str: str) -> Conversation:
+        """Reads the legacy single-document format."""
         data = json.loads(json_str)
+        messages = tuple(ConversationMapper._message(msg) for msg in data.get("messages", []))
+        return ConversationMapper._conversation(data, messages)
 
-        messages_list = [
-            Message(
-                id=UUID(msg["id"]),
-                role=MessageRole(msg["role"]),
-                content=msg["content"],
-                timestamp=datetime.fromisoformat(msg["timestamp"]),
-            )
-            for msg in data.get("messages", [])
-        ]
+    @staticmethod
+    def _message(data: dict[str, Any]) -> Message:
+        return Message(
+            id=UUID(data["id"]),
+            role=MessageRole(data["role"]),
+            content=data["content"],
+            timestamp=datetime.fromisoformat(data["timestamp"]),
+        )
 
+    @staticmethod
+    def _conversation(data: dict[str, Any], messages: tuple[Message, ...]) -> Conversation:
         return Conversation(
             user_id=data["user_id"],
             id=UUID(data["id"]),
             selected_model_name=data.get("selected_model_name"),
-            messages=tuple(messages_list),
+            messages=messages,
+            summary=data.get("summary"),
+            summary_through=UUID(data["summary_through"]) if data.get("summary_through") else None,
             created_at=datetime.fromisoformat(data["created_at"]),
             updated_at=datetime.fromisoformat(data["updated_at"]),
         )
@@ -1,12 +1,36 @@
 from enum import StrEnum
 
+# Conversations are only looked up by id, so records carry a fixed vector instead of a computed embedding.
+# 384 matches the default embedding function, keeping collections created before this change writable.
+PLACEHOLDER_EMBEDDING = [0.0] * 384
+
+# Chroma rejects larger writes; migrations of long histories are split into batches of this size.
+MAX_WRITE_BATCH = 1000
+
+
 class ChromaCollection(StrEnum):
     CHAT_HISTORY = "chat_history"
 
+class ChromaRecordKind(StrEnum):
+    """
+    Records in chat_history. The header sits under the user id (where the legacy single document,
+    which has no kind, used to live); each message is its own record under "{user_id}:{seq}".
+    """
+
+    HEADER = "header"
+    MESSAGE = "message"
+
 class ChromaMetadataKey(StrEnum):
     UPDATED_AT = "updated_at"
     MESSAGE_COUNT = "message_count"
     MODEL_NAME = "model"
+    KIND = "kind"
+    USER_ID = "user_id"
+    SEQ = "seq"
+    ROLE = "role"
+    MESSAGE_ID = "message_id"
+    LAST_MESSAGE_ID = "last_message_id"
+    SUMMARY_THROUGH_SEQ = "summary_through_seq"
 
 class ChromaResultKey(StrEnum):
     DOCUMENTS = "documents"
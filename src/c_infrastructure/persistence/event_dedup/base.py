@@ -0,0 +1,62 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+
+from src.a_domain.ports.bussiness.event_dedup_port import EventDeduplicationPort
+from src.a_domain.ports.notification.logging_port import ILoggingPort
+
+
+@dataclass(frozen=True)
+class EventDedupStats:
+    backend: str
+    checked: int
+    duplicates: int
+    errors: int
+
+
+class BaseEventDeduplicator(EventDeduplicationPort, ABC):
+    """
+    Template for seen-event caches. Backends only implement the atomic insert-if-absent.
+    """
+
+    def __init__(self, logger: ILoggingPort, ttl_seconds: float):
+        self._logger = logger
+        self._ttl = ttl_seconds
+        self._checked = 0
+        self._duplicates = 0
+        self._errors = 0
+
+    @abstractmethod
+    async def _insert_if_absent(self, event_id: str) -> bool: ...
+
+    @abstractmethod
+    async def _remove(self, event_id: str) -> None: ...
+
+    async def mark_seen(self, event_id: str) -> bool:
+        self._checked += 1
+        try:
+            is_new = await self._insert_if_absent(event_id)
+        except Exception:
+            # Fail open: processing a redelivery twice is better than dropping a real message.
+            self._errors += 1
+            self._logger.exception(f"[{self.__class__.__name__}] Dedup check failed for {event_id}")
+            return True
+
+        if not is_new:
+            self._duplicates += 1
+            self._logger.info(f"[{self.__class__.__name__}] Dropped duplicate event: {event_id}")
+        return is_new
+
+    async def forget(self, event_id: str) -> None:
+        try:
+            await self._remove(event_id)
+        except Exception:
+            self._errors += 1
+            self._logger.exception(f"[{self.__class__.__name__}] Could not forget event {event_id}")
+
+    def stats(self) -> EventDedupStats:
+        return EventDedupStats(
+            backend=self.__class__.__name__,
+            checked=self._checked,
+            duplicates=self._duplicates,
+            errors=self._errors,
+        )
@@ -0,0 +1,39 @@
+import time
+from collections import OrderedDict
+
+from src.a_domain.ports.notification.logging_port import ILoggingPort
+from src.c_infrastructure.persistence.event_dedup.base import BaseEventDeduplicator
+
+
+class InMemoryEventDeduplicator(BaseEventDeduplicator):
+    """
+    Bounded TTL/LRU seen-event cache local to the current process.
+    """
+
+    def __init__(self, logger: ILoggingPort, ttl_seconds: float, max_entries: int):
+        super().__init__(logger, ttl_seconds)
+        self._max_entries = max_entries
+        self._seen: OrderedDict[str, float] = OrderedDict()
+
+    async def _insert_if_absent(self, event_id: str) -> bool:
+        now = time.monotonic()
+        self._evict_expired(now)
+
+        is_new = event_id not in self._seen
+        # Re-seen ids get a fresh TTL and move to the back, keeping expiry order intact.
+        self._seen[event_id] = now + self._ttl
+        self._seen.move_to_end(event_id)
+        while len(self._seen) > self._max_entries:
+            self._seen.popitem(last=False)
+        return is_new
+
+    async def _remove(self, event_id: str) -> None:
+        self._seen.pop(event_id, None)
+
+    def _evict_expired(self, now: float) -> None:
+        # Entries are kept in insertion order, so expired ones are always at the front.
+        while self._seen:
+            oldest_id, expires_at = next(iter(self._seen.items()))
+            if expires_at > now:
+                break
+            del self._seen[oldest_id]
@@ -0,0 +1,56 @@
+import asyncio
+import sqlite3
+import time
+from contextlib import closing
+from pathlib import Path
+
+from src.a_domain.ports.notification.logging_port import ILoggingPort
+from src.c_infrastructure.persistence.event_dedup.base import BaseEventDeduplicator
+
+
+class SqliteEventDeduplicator(BaseEventDeduplicator):
+    """
+    Seen-event cache in a shared SQLite file, so every uvicorn worker on the host sees the same ids.
+    """
+
+    _PURGE_EVERY = 500
+
+    def __init__(self, logger: ILoggingPort, ttl_seconds: float, path: str):
+        super().__init__(logger, ttl_seconds)
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._path = path
+        self._inserts = 0
+        with closing(self._connect()) as conn, conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("CREATE TABLE IF NOT EXISTS seen_events (event_id TEXT PRIMARY KEY, expires_at REAL NOT NULL)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_seen_events_expires_at ON seen_events (expires_at)")
+        self._logger.info(f"Using shared SQLite event dedup store at: {path}")
+
+    async def _insert_if_absent(self, event_id: str) -> bool:
+        return await asyncio.to_thread(self._insert_sync, event_id)
+
+    async def _remove(self, event_id: str) -> None:
+        await asyncio.to_thread(self._remove_sync, event_id)
+
+    def _remove_sync(self, event_id: str) -> None:
+        with closing(self._connect()) as conn, conn:
+            conn.execute("DELETE FROM seen_events WHERE event_id = ?", (event_id,))
+
+    def _insert_sync(self, event_id: str) -> bool:
+        now = time.time()
+        with closing(self._connect()) as conn, conn:
+            # An expired row no longer counts as seen; replace it instead of reporting a duplicate.
+            conn.execute("DELETE FROM seen_events WHERE event_id = ? AND expires_at <= ?", (event_id, now))
+            cursor = conn.execute(
+                "INSERT OR IGNORE INTO seen_events (event_id, expires_at) VALUES (?, ?)",
+                (event_id, now + self._ttl),
+            )
+            is_new = cursor.rowcount == 1
+
+            self._inserts += 1
+            if self._inserts % self._PURGE_EVERY == 0:
+                conn.execute("DELETE FROM seen_events WHERE expires_at <= ?", (now,))
+        return is_new
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self._path, timeout=5.0)
@@ -1,15 +1,15 @@
 # TODO: This file will be replaced later
 from src.a_domain.model.conversation import Conversation
-from src.a_domain.ports.bussiness.repository_port import RepositoryPort
 from src.a_domain.ports.notification.logging_port import ILoggingPort
+from src.c_infrastructure.persistence.base import BaseRepositoryAdapter
 
 
-class InMemoryRepositoryAdapter(RepositoryPort):
+class InMemoryRepositoryAdapter(BaseRepositoryAdapter):
 
     _store: dict[str, Conversation] = {}
 
     def __init__(self, logger: ILoggingPort):
-        self._logger = logger
+        super().__init__(logger)
         self._logger.warning("Using InMemoryRepositoryAdapter. Data is not persistent.")
 
     async def get_conversation_by_user_id(self, user_id: str) -> Conversation | None:
@@ -0,0 +1,78 @@
+import json
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from src.a_domain.model.conversation import Conversation
+from src.a_domain.model.message import Message
+from src.a_domain.types.enums import MessageRole
+from src.c_infrastructure.persistence.redis.schema import HeaderField
+
+
+class RedisConversationMapper:
+
+    @staticmethod
+    def header_to_persistence(
+        conversation: Conversation,
+        version: int,
+        message_count: int,
+        last_message_id: str | None,
+        summary_through_seq: int | None,
+    ) -> str:
+        data = {
+            HeaderField.VERSION: version,
+            HeaderField.MESSAGE_COUNT: message_count,
+            HeaderField.LAST_MESSAGE_ID: last_message_id,
+            HeaderField.SUMMARY_THROUGH_SEQ: summary_through_seq,
+            "user_id": conversation.user_id,
+            "id": str(conversation.id),
+            "selected_model_name": conversation.selected_model_name,
+            "summary": conversation.summary,
+            "summary_through": str(conversation.summary_through) if conversation.summary_through else None,
+            "created_at": conversation.created_at.isoformat(),
+            "updated_at": conversation.updated_at.isoformat(),
+        }
+        return json.dumps(data, ensure_ascii=False)
+
+    @staticmethod
+    def header_from_persistence(raw: str | None) -> dict[str, Any]:
+        return json.loads(raw) if raw else {}
+
+    @staticmethod
+    def message_to_persistence(message: Message, seq: int | None = None) -> str:
+        data: dict[str, Any] = {
+            "id": str(message.id),
+            "role": message.role.value,
+            "content": message.content,
+            "timestamp": message.timestamp.isoformat(),
+        }
+        if seq is not None:
+            data["seq"] = seq
+        return json.dumps(data, ensure_ascii=False)
+
+    @staticmethod
+    def message_to_domain(raw: str) -> Message:
+        data = json.loads(raw)
+        return Message(
+            id=UUID(data["id"]),
+            role=MessageRole(data["role"]),
+            content=data["content"],
+            timestamp=datetime.fromisoformat(data["timestamp"]),
+        )
+
+    @staticmethod
+    def system_message_seq(raw: str) -> int:
+        return json.loads(raw)["seq"]
+
+    @staticmethod
+    def header_to_domain(header: dict[str, Any], messages: tuple[Message, ...]) -> Conversation:
+        return Conversation(
+            user_id=header["user_id"],
+            id=UUID(header["id"]),
+            selected_model_name=header.get("selected_model_name"),
+            messages=messages,
+            summary=header.get("summary"),
+            summary_through=UUID(header["summary_through"]) if header.get("summary_through") else None,
+            created_at=datetime.fromisoformat(header["created_at"]),
+            updated_at=datetime.fromisoformat(header["updated_at"]),
+        )
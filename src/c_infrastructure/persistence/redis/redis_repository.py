@@ -0,0 +1,186 @@
+from typing import Any
+from uuid import UUID
+
+from redis.asyncio import Redis
+from redis.asyncio.client import Pipeline
+from redis.exceptions import RedisError, WatchError
+
+from src.a_domain.model.conversation import Conversation
+from src.a_domain.model.message import Message
+from src.a_domain.ports.notification.logging_port import ILoggingPort
+from src.a_domain.types.enums import MessageRole
+from src.b_application.configuration.schemas import AppConfig
+from src.c_infrastructure.persistence.base import BaseRepositoryAdapter
+from src.c_infrastructure.persistence.redis.mapper import RedisConversationMapper
+from src.c_infrastructure.persistence.redis.schema import ConversationKeys, HeaderField
+
+
+class RedisRepositoryAdapter(BaseRepositoryAdapter):
+    """
+    Conversation store on a Redis-protocol server, shared by every worker process and node.
+
+    Each message is appended to a per-user list, so a save writes O(new messages) and a read fetches
+    the newest conversation_history_limit of them. Reads are one pipelined MULTI/EXEC round trip.
+    Saves are optimistic: the header carries a version, the save WATCHes it, and if another worker
+    saved in between the transaction is discarded and retried against the new state, so concurrent
+    turns are merged instead of overwriting each other.
+    """
+
+    def __init__(self, config: AppConfig, logger: ILoggingPort) -> None:
+        super().__init__(logger)
+        self._prefix = config.redis_key_prefix
+        self._history_limit = config.conversation_history_limit
+        self._max_retries = config.redis_max_write_retries
+        self._client = Redis.from_url(
+            config.redis_url,
+            max_connections=config.redis_max_connections,
+            socket_timeout=config.redis_socket_timeout_seconds,
+            socket_connect_timeout=config.redis_socket_timeout_seconds,
+            decode_responses=True,
+        )
+        self._conflicts = 0
+        connection = self._client.connection_pool.connection_kwargs
+        address = f"{connection.get('host')}:{connection.get('port')}/{connection.get('db')}"
+        self._logger.info(f"Using Redis conversation store at: {address}")
+
+    async def warm_up(self) -> None:
+        await self._timed("open", self._client.ping)
+
+    async def get_conversation_by_user_id(self, user_id: str) -> Conversation | None:
+        self._logger.debug(f"Fetching conversation for user_id: {user_id}")
+
+        try:
+            return await self._timed("get", lambda: self._get(user_id))
+        except (RedisError, RuntimeError, ValueError, KeyError) as e:
+            self._logger.error(f"Error fetching conversation for user {user_id}: {e}")
+            return None
+
+    async def save(self, conversation: Conversation) -> bool:
+        self._logger.debug(f"Saving conversation for user_id: {conversation.user_id}")
+
+        try:
+            await self._timed("save", lambda: self._save(conversation))
+            return True
+        except (RedisError, RuntimeError, ValueError, KeyError) as e:
+            self._logger.critical(f"Error saving conversation to Redis: {e}")
+            return False
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+        if self._conflicts:
+            self._logger.info(f"Redis repository resolved {self._conflicts} concurrent save conflicts.")
+
+    async def _get(self, user_id: str) -> Conversation | None:
+        keys = ConversationKeys.for_user(self._prefix, user_id)
+        tail_start = -self._history_limit if self._history_limit > 0 else 0
+        async with self._client.pipeline(transaction=True) as pipe:
+            pipe.get(keys.header)
+            pipe.llen(keys.messages)
+            pipe.lrange(keys.messages, tail_start, -1)
+            pipe.lrange(keys.system, 0, -1)
+            raw_header, count, tail, system = await pipe.execute()
+
+        if raw_header is None:
+            return None
+        header = RedisConversationMapper.header_from_persistence(raw_header)
+        start = count - len(tail)
+
+        # Keep the summary boundary loaded, or already summarized turns would look new to the summarizer.
+        # Only needed when it is older than the tail; messages are append-only, so a second read is safe.
+        through = header.get(HeaderField.SUMMARY_THROUGH_SEQ)
+        if through is not None and through < start:
+            tail = await self._client.lrange(keys.messages, through, start - 1) + tail
+            start = through
+
+        # System messages (the persona prompt) are always part of the context.
+        older_system = [raw for raw in system if RedisConversationMapper.system_message_seq(raw) < start]
+        messages = tuple(RedisConversationMapper.message_to_domain(raw) for raw in older_system + tail)
+        return RedisConversationMapper.header_to_domain(header, messages)
+
+    async def _save(self, conversation: Conversation) -> None:
+        keys = ConversationKeys.for_user(self._prefix, conversation.user_id)
+        async with self._client.pipeline(transaction=True) as pipe:
+            for _ in range(self._max_retries):
+                try:
+                    await self._save_once(pipe, keys, conversation)
+                    return
+                except WatchError:
+                    self._conflicts += 1
+                    self._logger.debug(f"Conversation {conversation.user_id} changed during save. Retrying.")
+        raise RuntimeError(f"conversation kept changing during {self._max_retries} save attempts")
+
+    async def _save_once(self, pipe: Pipeline, keys: ConversationKeys, conversation: Conversation) -> None:
+        """
+        Appends the messages that are not stored yet and rewrites the header with the next version.
+        An empty conversation (cleared history) deletes the stored messages.
+        """
+        # Every save rewrites the header, so watching it detects any concurrent save.
+        await pipe.watch(keys.header)
+        header = RedisConversationMapper.header_from_persistence(await pipe.get(keys.header))
+        version = header.get(HeaderField.VERSION, 0)
+        count = header.get(HeaderField.MESSAGE_COUNT, 0)
+        last_message_id = header.get(HeaderField.LAST_MESSAGE_ID)
+
+        cleared = not conversation.messages and count > 0
+        if cleared:
+            count, last_message_id = 0, None
+        new_messages = await self._unsaved(pipe, keys, conversation, last_message_id, count)
+        seqs = {message.id: count + index for index, message in enumerate(new_messages)}
+        through_seq = await self._summary_through_seq(pipe, keys, conversation, header, seqs)
+
+        pipe.multi()
+        if cleared:
+            pipe.delete(keys.messages, keys.system, keys.message_seqs)
+        if new_messages:
+            pipe.rpush(keys.messages, *(RedisConversationMapper.message_to_persistence(m) for m in new_messages))
+            pipe.hset(keys.message_seqs, mapping={str(m.id): seqs[m.id] for m in new_messages})
+            system = [m for m in new_messages if m.role == MessageRole.SYSTEM]
+            if system:
+                pipe.rpush(
+                    keys.system, *(RedisConversationMapper.message_to_persistence(m, seqs[m.id]) for m in system)
+                )
+            count, last_message_id = count + len(new_messages), str(new_messages[-1].id)
+        pipe.set(
+            keys.header,
+            RedisConversationMapper.header_to_persistence(
+                conversation, version + 1, count, last_message_id, through_seq
+            ),
+        )
+        await pipe.execute()
+
+    async def _unsaved(
+        self,
+        pipe: Pipeline,
+        keys: ConversationKeys,
+        conversation: Conversation,
+        last_message_id: str | None,
+        count: int,
+    ) -> tuple[Message, ...]:
+        messages = conversation.messages
+        if count == 0:
+            return messages
+        # Fast path: the conversation was loaded from the latest state, so everything after the last stored id is new.
+        for index in range(len(messages) - 1, -1, -1):
+            if str(messages[index].id) == last_message_id:
+                return messages[index + 1 :]
+        if not messages:
+            return messages
+        # Someone else saved in between: skip whatever is already stored.
+        stored = await pipe.hmget(keys.message_seqs, [str(m.id) for m in messages])
+        return tuple(m for m, seq in zip(messages, stored) if seq is None)
+
+    @staticmethod
+    async def _summary_through_seq(
+        pipe: Pipeline,
+        keys: ConversationKeys,
+        conversation: Conversation,
+        header: dict[str, Any],
+        seqs: dict[UUID, int],
+    ) -> int | None:
+        through = conversation.summary_through
+        if through is None:
+            return None
+        if through in seqs:
+            return seqs[through]
+        found = await pipe.hget(keys.message_seqs, str(through))
+        return int(found) if found is not None else header.get(HeaderField.SUMMARY_THROUGH_SEQ)
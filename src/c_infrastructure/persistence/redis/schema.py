@@ -0,0 +1,32 @@
+from dataclasses import dataclass
+from enum import StrEnum
+
+
+@dataclass(frozen=True)
+class ConversationKeys:
+    """
+    Keys holding one conversation. The {user_id} hash tag puts all of them in the same Redis Cluster
+    slot, so a save can update them together in one MULTI/EXEC.
+    """
+
+    header: str  # string: JSON header with the version, message count and conversation fields
+    messages: str  # list: every message as JSON, index == seq
+    system: str  # list: system messages again, with their seq, so reads of the tail can include them
+    message_seqs: str  # hash: message id -> seq, for stale-writer checks and the summary boundary
+
+    @classmethod
+    def for_user(cls, prefix: str, user_id: str) -> "ConversationKeys":
+        base = f"{prefix}:{{{user_id}}}"
+        return cls(
+            header=f"{base}:header",
+            messages=f"{base}:messages",
+            system=f"{base}:system",
+            message_seqs=f"{base}:seqs",
+        )
+
+
+class HeaderField(StrEnum):
+    VERSION = "version"
+    MESSAGE_COUNT = "message_count"
+    LAST_MESSAGE_ID = "last_message_id"
+    SUMMARY_THROUGH_SEQ = "summary_through_seq"
@@ -0,0 +1,52 @@
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from src.a_domain.model.conversation import Conversation
+from src.a_domain.model.message import Message
+from src.a_domain.types.enums import MessageRole
+
+
+class ConversationRowMapper:
+
+    @staticmethod
+    def conversation_to_row(conversation: Conversation, message_count: int, last_message_id: str | None) -> tuple:
+        return (
+            conversation.user_id,
+            str(conversation.id),
+            conversation.selected_model_name,
+            conversation.summary,
+            str(conversation.summary_through) if conversation.summary_through else None,
+            message_count,
+            last_message_id,
+            conversation.created_at.isoformat(),
+            conversation.updated_at.isoformat(),
+        )
+
+    @staticmethod
+    def message_to_row(user_id: str, seq: int, message: Message) -> tuple:
+        return (user_id, seq, str(message.id), message.role.value, message.content, message.timestamp.isoformat())
+
+    @staticmethod
+    def message_to_domain(row: tuple[Any, ...]) -> Message:
+        _, message_id, role, content, timestamp = row
+        return Message(
+            id=UUID(message_id),
+            role=MessageRole(role),
+            content=content,
+            timestamp=datetime.fromisoformat(timestamp),
+        )
+
+    @staticmethod
+    def conversation_to_domain(row: tuple[Any, ...], messages: tuple[Message, ...]) -> Conversation:
+        user_id, conversation_id, model_name, summary, summary_through, _, created_at, updated_at = row
+        return Conversation(
+            user_id=user_id,
+            id=UUID(conversation_id),
+            selected_model_name=model_name,
+            messages=messages,
+            summary=summary,
+            summary_through=UUID(summary_through) if summary_through else None,
+            created_at=datetime.fromisoformat(created_at),
+            updated_at=datetime.fromisoformat(updated_at),
+        )
@@ -0,0 +1,64 @@
+# One row per user, plus one row per message keyed by (user_id, seq). seq is the message's position
+# in the full history, so the newest N messages are a primary-key range scan.
+CREATE_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS conversations (
+        user_id TEXT PRIMARY KEY,
+        id TEXT NOT NULL,
+        selected_model_name TEXT,
+        summary TEXT,
+        summary_through TEXT,
+        message_count INTEGER NOT NULL,
+        last_message_id TEXT,
+        created_at TEXT NOT NULL,
+        updated_at TEXT NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS messages (
+        user_id TEXT NOT NULL,
+        seq INTEGER NOT NULL,
+        id TEXT NOT NULL,
+        role TEXT NOT NULL,
+        content TEXT NOT NULL,
+        timestamp TEXT NOT NULL,
+        PRIMARY KEY (user_id, seq)
+    )
+    """,
+    # Existence checks for stale writers and the summary boundary lookup.
+    "CREATE UNIQUE INDEX IF NOT EXISTS idx_messages_user_message_id ON messages (user_id, id)",
+    # System messages older than the loaded tail.
+    "CREATE INDEX IF NOT EXISTS idx_messages_user_role_seq ON messages (user_id, role, seq)",
+)
+
+# Statements are fixed strings with ? parameters, so each connection's statement cache keeps them prepared.
+SELECT_CONVERSATION = """
+    SELECT user_id, id, selected_model_name, summary, summary_through, message_count, created_at, updated_at
+    FROM conversations WHERE user_id = ?
+"""
+SELECT_CONVERSATION_STATE = "SELECT message_count, last_message_id FROM conversations WHERE user_id = ?"
+SELECT_MESSAGE_SEQ = "SELECT seq FROM messages WHERE user_id = ? AND id = ?"
+SELECT_TAIL = """
+    SELECT seq, id, role, content, timestamp FROM messages WHERE user_id = ? AND seq >= ?
+    UNION ALL
+    SELECT seq, id, role, content, timestamp FROM messages WHERE user_id = ? AND role = ? AND seq < ?
+    ORDER BY seq
+"""
+INSERT_MESSAGE = """
+    INSERT OR IGNORE INTO messages (user_id, seq, id, role, content, timestamp) VALUES (?, ?, ?, ?, ?, ?)
+"""
+DELETE_MESSAGES = "DELETE FROM messages WHERE user_id = ?"
+UPSERT_CONVERSATION = """
+    INSERT INTO conversations (
+        user_id, id, selected_model_name, summary, summary_through, message_count, last_message_id, created_at, updated_at
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT (user_id) DO UPDATE SET
+        id = excluded.id,
+        selected_model_name = excluded.selected_model_name,
+        summary = excluded.summary,
+        summary_through = excluded.summary_through,
+        message_count = excluded.message_count,
+        last_message_id = excluded.last_message_id,
+        created_at = excluded.created_at,
+        updated_at = excluded.updated_at
+"""
@@ -0,0 +1,220 @@
+import sqlite3
+import threading
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing, contextmanager
+from pathlib import Path
+
+from src.a_domain.model.conversation import Conversation
+from src.a_domain.model.message import Message
+from src.a_domain.ports.notification.logging_port import ILoggingPort
+from src.a_domain.types.enums import MessageRole
+from src.b_application.configuration.schemas import AppConfig
+from src.c_infrastructure.persistence.base import BaseRepositoryAdapter
+from src.c_infrastructure.persistence.sqlite.mapper import ConversationRowMapper
+from src.c_infrastructure.persistence.sqlite.schema import (
+    CREATE_SCHEMA,
+    DELETE_MESSAGES,
+    INSERT_MESSAGE,
+    SELECT_CONVERSATION,
+    SELECT_CONVERSATION_STATE,
+    SELECT_MESSAGE_SEQ,
+    SELECT_TAIL,
+    UPSERT_CONVERSATION,
+)
+
+
+@contextmanager
+def _transaction(conn: sqlite3.Connection, mode: str = "DEFERRED") -> Iterator[sqlite3.Connection]:
+    conn.execute(f"BEGIN {mode}")
+    try:
+        yield conn
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    conn.execute("COMMIT")
+
+
+class SqliteRepositoryAdapter(BaseRepositoryAdapter):
+    """
+    Conversation store in a local SQLite file: one row per conversation and one per message, keyed by
+    (user_id, seq). A save appends only the new messages and a read fetches the newest
+    conversation_history_limit of them with a primary-key range scan.
+
+    The database runs in WAL mode, so readers never wait for the writer. sqlite3 releases the GIL while
+    a statement runs, so a small thread pool keeps the I/O off the event loop; each thread holds one
+    connection whose statement cache keeps the queries prepared.
+    """
+
+    # Covers every statement in schema.py with room to spare.
+    _STATEMENT_CACHE_SIZE = 32
+
+    def __init__(self, config: AppConfig, logger: ILoggingPort) -> None:
+        self._path = str(config.project_root / config.sqlite_repository_path)
+        self._history_limit = config.conversation_history_limit
+        self._local = threading.local()
+        self._connections: list[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        super().__init__(
+            logger,
+            executor=ThreadPoolExecutor(max_workers=config.sqlite_repository_workers, thread_name_prefix="sqlite-repo"),
+        )
+
+        Path(self._path).parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as conn:
+            for statement in CREATE_SCHEMA:
+                conn.execute(statement)
+        self._logger.info(f"Using SQLite conversation store at: {self._path}")
+
+    async def warm_up(self) -> None:
+        # Opens a connection on one of the worker threads; the others connect on first use.
+        await self._blocking("open", self._connection)
+
+    async def get_conversation_by_user_id(self, user_id: str) -> Conversation | None:
+        self._logger.debug(f"Fetching conversation for user_id: {user_id}")
+
+        try:
+            return await self._blocking("get", self._get_sync, user_id)
+        except (sqlite3.Error, OSError, RuntimeError, ValueError) as e:
+            self._logger.error(f"Error fetching conversation for user {user_id}: {e}")
+            return None
+
+    async def save(self, conversation: Conversation) -> bool:
+        self._logger.debug(f"Saving conversation for user_id: {conversation.user_id}")
+
+        try:
+            await self._blocking("save", self._save_sync, conversation)
+            return True
+        except (sqlite3.Error, OSError, RuntimeError, ValueError) as e:
+            self._logger.critical(f"Error saving conversation to SQLite: {e}")
+            return False
+
+    async def import_conversations(self, conversations: Iterable[Conversation], overwrite: bool = False) -> int:
+        """
+        Writes complete conversations in one transaction and returns how many were written.
+        Users that already have a conversation here are skipped unless overwrite is set.
+        """
+        return await self._blocking("import", self._import_sync, list(conversations), overwrite)
+
+    async def aclose(self) -> None:
+        await super().aclose()
+        with self._connections_lock:
+            for conn in self._connections:
+                conn.execute("PRAGMA optimize")
+                conn.close()
+            self._connections.clear()
+
+    # --- Worker threads ---
+
+    def _get_sync(self, user_id: str) -> Conversation | None:
+        conn = self._connection()
+        with _transaction(conn):
+            row = conn.execute(SELECT_CONVERSATION, (user_id,)).fetchone()
+            if row is None:
+                return None
+
+            count = row[5]
+            start = max(0, count - self._history_limit) if self._history_limit > 0 else 0
+            # Keep the summary boundary loaded, or already summarized turns would look new to the summarizer.
+            summary_through = row[4]
+            if summary_through and start > 0:
+                found = conn.execute(SELECT_MESSAGE_SEQ, (user_id, summary_through)).fetchone()
+                if found is not None:
+                    start = min(start, found[0])
+
+            # System messages (the persona prompt) are always part of the context.
+            rows = conn.execute(SELECT_TAIL, (user_id, start, user_id, MessageRole.SYSTEM.value, start)).fetchall()
+
+        messages = tuple(ConversationRowMapper.message_to_domain(message_row) for message_row in rows)
+        return ConversationRowMapper.conversation_to_domain(row, messages)
+
+    def _save_sync(self, conversation: Conversation) -> None:
+        """
+        Appends the messages that are not stored yet and rewrites the conversation row.
+        An empty conversation (cleared history) deletes the stored messages.
+        """
+        user_id = conversation.user_id
+        conn = self._connection()
+        # IMMEDIATE takes the write lock up front, so concurrent saves queue on busy_timeout
+        # instead of failing when a read transaction tries to upgrade.
+        with _transaction(conn, "IMMEDIATE"):
+            state = conn.execute(SELECT_CONVERSATION_STATE, (user_id,)).fetchone()
+            count, last_message_id = state if state else (0, None)
+
+            if not conversation.messages and count:
+                conn.execute(DELETE_MESSAGES, (user_id,))
+                count, last_message_id = 0, None
+            count, last_message_id = self._append(conn, conversation, count, last_message_id)
+
+            conn.execute(
+                UPSERT_CONVERSATION, ConversationRowMapper.conversation_to_row(conversation, count, last_message_id)
+            )
+
+    def _append(
+        self, conn: sqlite3.Connection, conversation: Conversation, count: int, last_message_id: str | None
+    ) -> tuple[int, str | None]:
+        messages = conversation.messages
+        new_messages: tuple[Message, ...] | None = messages if count == 0 else None
+        # Fast path: the conversation was loaded from the latest state, so everything after the last stored id is new.
+        if new_messages is None:
+            for index in range(len(messages) - 1, -1, -1):
+                if str(messages[index].id) == last_message_id:
+                    new_messages = messages[index + 1 :]
+                    break
+
+        if new_messages is not None:
+            conn.executemany(
+                INSERT_MESSAGE,
+                (
+                    ConversationRowMapper.message_to_row(conversation.user_id, count + index, message)
+                    for index, message in enumerate(new_messages)
+                ),
+            )
+            if new_messages:
+                return count + len(new_messages), str(new_messages[-1].id)
+            return count, last_message_id
+
+        # Someone else saved in between: the unique (user_id, id) index skips whatever is already stored.
+        for message in messages:
+            row = ConversationRowMapper.message_to_row(conversation.user_id, count, message)
+            if conn.execute(INSERT_MESSAGE, row).rowcount:
+                count, last_message_id = count + 1, str(message.id)
+        return count, last_message_id
+
+    def _import_sync(self, conversations: list[Conversation], overwrite: bool) -> int:
+        conn = self._connection()
+        imported = 0
+        with _transaction(conn, "IMMEDIATE"):
+            for conversation in conversations:
+                if not overwrite and conn.execute(SELECT_CONVERSATION_STATE, (conversation.user_id,)).fetchone():
+                    continue
+                conn.execute(DELETE_MESSAGES, (conversation.user_id,))
+                count, last_message_id = self._append(conn, conversation, 0, None)
+                conn.execute(
+                    UPSERT_CONVERSATION, ConversationRowMapper.conversation_to_row(conversation, count, last_message_id)
+                )
+                imported += 1
+        return imported
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = self._connect()
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+
+    def _connect(self) -> sqlite3.Connection:
+        # isolation_level=None: transactions are opened explicitly with _transaction.
+        # check_same_thread=False only so aclose can close them; each is used by its own thread.
+        conn = sqlite3.connect(
+            self._path,
+            timeout=5.0,
+            isolation_level=None,
+            check_same_thread=False,
+            cached_statements=self._STATEMENT_CACHE_SIZE,
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        # Safe with WAL: a power loss can only drop the last commits, never corrupt the file.
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
@@ -0,0 +1,211 @@
+import asyncio
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from src.a_domain.model.conversation import Conversation
+from src.a_domain.ports.bussiness.repository_port import RepositoryPort
+from src.a_domain.ports.notification.logging_port import ILoggingPort
+
+
+@dataclass(frozen=True)
+class ConversationCacheStats:
+    entries: int
+    max_entries: int
+    dirty: int
+    hits: int
+    misses: int
+    hit_rate: float
+    evictions: int
+    flushes: int
+    flushed_conversations: int
+    flush_failures: int
+    last_flush_seconds: float
+
+
+@dataclass
+class _Entry:
+    conversation: Conversation
+    version: int = 0
+    flushed_version: int = 0
+    reset_version: int = 0  # version of the newest save that cleared the history
+
+    @property
+    def dirty(self) -> bool:
+        return self.version != self.flushed_version
+
+    @property
+    def reset_pending(self) -> bool:
+        return self.reset_version > self.flushed_version
+
+
+class WriteBehindRepositoryAdapter(RepositoryPort):
+    """
+    LRU cache of hot conversations in front of another repository.
+
+    Reads are served from memory after the first load. Saves only update the cached copy and mark it
+    dirty; dirty conversations are written to the inner repository in batches every flush_interval
+    seconds, as soon as max_dirty are pending, and always on shutdown. Only clean entries are evicted,
+    so a conversation is never dropped before it has been written. Once written, cached copies are
+    trimmed to the history_limit view the repositories load, so hot conversations stay bounded.
+
+    The cache is per process: run a single worker (or route each user to one worker) when it is enabled.
+    """
+
+    def __init__(
+        self,
+        inner: RepositoryPort,
+        logger: ILoggingPort,
+        max_entries: int,
+        flush_interval_seconds: float,
+        max_dirty: int,
+        history_limit: int,
+    ):
+        self._inner = inner
+        self._logger = logger
+        self._max_entries = max_entries
+        self._flush_interval = flush_interval_seconds
+        self._max_dirty = max_dirty
+        self._history_limit = history_limit
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._dirty: set[str] = set()
+        self._flush_lock = asyncio.Lock()
+        self._flusher: asyncio.Task | None = None
+        self._early_flush: asyncio.Task | None = None
+        self._closed = False
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._flushes = 0
+        self._flushed = 0
+        self._flush_failures = 0
+        self._last_flush_seconds = 0.0
+
+    async def get_conversation_by_user_id(self, user_id: str) -> Conversation | None:
+        entry = self._entries.get(user_id)
+        if entry is not None:
+            self._entries.move_to_end(user_id)
+            self._hits += 1
+            return entry.conversation
+
+        self._misses += 1
+        conversation = await self._inner.get_conversation_by_user_id(user_id)
+        # A save may have landed while the inner read was in flight; the cached copy is newer then.
+        if conversation is not None and user_id not in self._entries:
+            self._entries[user_id] = _Entry(conversation)
+            self._evict()
+        entry = self._entries.get(user_id)
+        return entry.conversation if entry else conversation
+
+    async def save(self, conversation: Conversation) -> bool:
+        if self._closed:
+            return await self._inner.save(conversation)
+
+        entry = self._entries.get(conversation.user_id)
+        if entry is None:
+            entry = self._entries[conversation.user_id] = _Entry(conversation)
+        entry.conversation = conversation
+        entry.version += 1
+        if not conversation.messages:
+            entry.reset_version = entry.version
+        self._dirty.add(conversation.user_id)
+        self._entries.move_to_end(conversation.user_id)
+        self._ensure_flusher()
+
+        if len(self._dirty) >= self._max_dirty and (self._early_flush is None or self._early_flush.done()):
+            self._early_flush = asyncio.create_task(self.flush(), name="conversation-cache-flush")
+        self._evict()
+        return True
+
+    async def flush(self) -> None:
+        """Writes every dirty conversation to the inner repository."""
+        async with self._flush_lock:
+            batch = [(user_id, self._entries[user_id], self._entries[user_id].version) for user_id in self._dirty]
+            if not batch:
+                return
+
+            started = time.perf_counter()
+            results = await asyncio.gather(
+                *(self._write(entry, entry.conversation) for _, entry, _ in batch), return_exceptions=True
+            )
+            failed = 0
+            for (user_id, entry, version), result in zip(batch, results):
+                if result is True:
+                    # Saves made during the flush bumped version past this one and stay dirty.
+                    entry.flushed_version = max(entry.flushed_version, version)
+                    if not entry.dirty:
+                        self._dirty.discard(user_id)
+                        entry.conversation = entry.conversation.recent(self._history_limit)
+                else:
+                    failed += 1
+                    self._logger.error(f"Write-behind flush failed for user_id: {user_id}: {result}")
+
+            self._flushes += 1
+            self._flushed += len(batch) - failed
+            self._flush_failures += failed
+            self._last_flush_seconds = round(time.perf_counter() - started, 3)
+            self._logger.debug(
+                f"Flushed {len(batch) - failed}/{len(batch)} conversations in {self._last_flush_seconds:.3f}s."
+            )
+        self._evict()
+
+    async def warm_up(self) -> None:
+        await self._inner.warm_up()
+
+    async def aclose(self) -> None:
+        self._closed = True
+        if self._flusher is not None:
+            self._flusher.cancel()
+            await asyncio.gather(self._flusher, return_exceptions=True)
+            self._flusher = None
+        if self._early_flush is not None:
+            await asyncio.gather(self._early_flush, return_exceptions=True)
+        await self.flush()
+        if self._dirty:
+            self._logger.critical(f"{len(self._dirty)} conversations could not be written before shutdown.")
+        await self._inner.aclose()
+
+    def stats(self) -> ConversationCacheStats:
+        lookups = self._hits + self._misses
+        return ConversationCacheStats(
+            entries=len(self._entries),
+            max_entries=self._max_entries,
+            dirty=len(self._dirty),
+            hits=self._hits,
+            misses=self._misses,
+            hit_rate=round(self._hits / lookups, 3) if lookups else 0.0,
+            evictions=self._evictions,
+            flushes=self._flushes,
+            flushed_conversations=self._flushed,
+            flush_failures=self._flush_failures,
+            last_flush_seconds=self._last_flush_seconds,
+        )
+
+    async def _write(self, entry: _Entry, conversation: Conversation) -> bool:
+        # Saves between flushes are merged into one write of the newest conversation. If the history
+        # was cleared in between, the clear must reach the store first: the append-only stores would
+        # otherwise append the new turns to the old history instead of replacing it.
+        if entry.reset_pending and conversation.messages and not await self._inner.save(conversation.clear_history()):
+            return False
+        return await self._inner.save(conversation)
+
+    def _ensure_flusher(self) -> None:
+        if self._flusher is None or self._flusher.done():
+            self._flusher = asyncio.create_task(self._flush_periodically(), name="conversation-cache-flusher")
+
+    async def _flush_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self._flush_interval)
+            try:
+                await self.flush()
+            except Exception:
+                self._logger.exception("Write-behind flush loop error")
+
+    def _evict(self) -> None:
+        if len(self._entries) <= self._max_entries:
+            return
+        for user_id in [user_id for user_id in self._entries if user_id not in self._dirty]:
+            if len(self._entries) <= self._max_entries:
+                return
+            del self._entries[user_id]
+            self._evictions += 1
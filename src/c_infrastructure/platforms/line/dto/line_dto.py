@@ -12,10 +12,24 @@ class LineSource(BaseModel):
     userId: str
 
 
+class LineDeliveryContext(BaseModel):
+    isRedelivery: bool = False
+
+
 class LineEvent(BaseModel):
     type: str
     message: LineMessage | None = None
     source: LineSource
+    replyToken: str | None = None
+    timestamp: int | None = None
+    webhookEventId: str | None = None
+    deliveryContext: LineDeliveryContext | None = None
+
+    @property
+    def dedup_id(self) -> str | None:
+        if self.webhookEventId:
+            return self.webhookEventId
+        return self.message.id if self.message else None
 
 
 class LineWebhookPayload(BaseModel):
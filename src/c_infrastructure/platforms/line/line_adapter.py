@@ -4,16 +4,26 @@
 #  Description:   Description of the file
 #  Location:      src\c_infrastructure\platforms\line\line_adapter.py
 # ***********************************************************************
+from collections import Counter
+from typing import Any
+
 import httpx
 from src.a_domain.model.message import Message
 from src.a_domain.ports.bussiness.platform_port import PlatformPort
 from src.a_domain.ports.notification.logging_port import ILoggingPort
+from src.a_domain.types.enums import DeliveryPath
 from src.b_application.configuration.schemas import AppConfig
-from src.c_infrastructure.platforms.line.line_constants import PUSH_MESSAGE_URL
+from src.c_infrastructure.platforms.line.line_constants import (
+    BOT_INFO_URL,
+    MAX_MESSAGES_PER_REQUEST,
+    PUSH_MESSAGE_URL,
+    REPLY_MESSAGE_URL,
+)
+from src.c_infrastructure.services.http_client_pool_service import HttpClientPoolService
 
 
 class LinePlatformAdapter(PlatformPort):
-    def __init__(self, config: AppConfig, logger: ILoggingPort):
+    def __init__(self, config: AppConfig, logger: ILoggingPort, http_pool: HttpClientPoolService):
         if not config.line_channel_access_token:
             raise ValueError("Missing line_channel_access_token in configuration. Cannot send messages.")
 
@@ -21,40 +31,83 @@ class LinePlatformAdapter(PlatformPort):
         self._timeout = config.ai_model_connection_timeout
         self._logger = logger
         self._base_url = PUSH_MESSAGE_URL
+        self._http_pool = http_pool
+        self._delivered: Counter[DeliveryPath] = Counter()
+
+    @property
+    def max_messages_per_request(self) -> int:
+        return MAX_MESSAGES_PER_REQUEST
 
     async def send_message(self, user_id: str, message: Message) -> bool:
+        (success,) = await self.send_messages(user_id, (message,))
+        return success
+
+    async def send_messages(self, user_id: str, messages: tuple[Message, ...]) -> tuple[bool, ...]:
+        results: list[bool] = []
+        # Batches are sent one after another so the bubbles arrive in order.
+        for start in range(0, len(messages), MAX_MESSAGES_PER_REQUEST):
+            batch = messages[start : start + MAX_MESSAGES_PER_REQUEST]
+            payload = {
+                "to": user_id,
+                "messages": [self._to_line_message(message) for message in batch],
+            }
+            results.append(
+                await self._post(self._base_url, payload, DeliveryPath.PUSH, f"user_id: {user_id}", len(batch))
+            )
+        return tuple(results)
+
+    async def reply_messages(self, reply_token: str, messages: tuple[Message, ...]) -> bool:
+        if len(messages) > MAX_MESSAGES_PER_REQUEST:
+            raise ValueError(f"LINE accepts at most {MAX_MESSAGES_PER_REQUEST} messages per reply.")
+
+        payload = {
+            "replyToken": reply_token,
+            "messages": [self._to_line_message(message) for message in messages],
+        }
+        return await self._post(REPLY_MESSAGE_URL, payload, DeliveryPath.REPLY, "reply token", len(messages))
 
+    async def warm_up(self) -> None:
+        # Push, reply and bot info share api.line.me, so this leaves a warm connection for the first reply.
+        resp = await self._client().get(
+            BOT_INFO_URL, headers={"Authorization": f"Bearer {self._channel_access_token}"}, timeout=self._timeout
+        )
+        if resp.status_code != 200:
+            raise RuntimeError(f"LINE bot info returned {resp.status_code}: {resp.text}")
+        self._logger.debug(f"LINE connection warmed up for bot {resp.json().get('basicId')}.")
+
+    def stats(self) -> dict[str, int]:
+        return {path.value: self._delivered[path] for path in DeliveryPath}
+
+    def _client(self) -> httpx.AsyncClient:
+        # Looked up per request: the pool replaces a client that was closed.
+        return self._http_pool.client_for(self._base_url)
+
+    def _to_line_message(self, message: Message) -> dict[str, Any]:
+        return {"type": "text", "text": message.content}
+
+    async def _post(self, url: str, payload: dict[str, Any], path: DeliveryPath, target: str, count: int) -> bool:
         headers = {
             "Authorization": f"Bearer {self._channel_access_token}",
             "Content-Type": "application/json",
         }
 
-        payload = {
-            "to": user_id,
-            "messages": [
-                {"type": "text", "text": message.content},
-            ],
-        }
+        try:
+            self._logger.debug(f"Sending {count} LINE message(s) via {path} to {target}")
+            resp = await self._client().post(url, headers=headers, json=payload, timeout=self._timeout)
 
-        async with httpx.AsyncClient(timeout=self._timeout) as client:
-            try:
-                self._logger.debug(f"Sending LINE message to user_id: {user_id}")
-                resp = await client.post(self._base_url, headers=headers, json=payload)
-
-                if 200 <= resp.status_code < 300:
-                    self._logger.success(f"Successfully sent LINE message to user_id: {user_id}.")
-                    return True
-                else:
-                    self._logger.error(
-                        f"Failed to send LINE message to user_id: {user_id}. "
-                        f"Status: {resp.status_code}, Response: {resp.text}"
-                    )
-                    return False
-            except httpx.RequestError as e:
-                self._logger.error(f"An HTTP error occurred while sending message to LINE for user {user_id}: {e}")
-                return False
-            except Exception as e:
-                self._logger.critical(
-                    f"An unexpected error occurred during LINE message sending for user {user_id}: {e}"
+            if 200 <= resp.status_code < 300:
+                self._delivered[path] += count
+                self._logger.success(f"Successfully sent {count} LINE message(s) via {path} to {target}.")
+                return True
+            else:
+                self._logger.error(
+                    f"Failed to send LINE message(s) via {path} to {target}. "
+                    f"Status: {resp.status_code}, Response: {resp.text}"
                 )
                 return False
+        except httpx.RequestError as e:
+            self._logger.error(f"An HTTP error occurred while sending {path} message to LINE for {target}: {e}")
+            return False
+        except Exception as e:
+            self._logger.critical(f"An unexpected error occurred during LINE {path} message sending for {target}: {e}")
+            return False
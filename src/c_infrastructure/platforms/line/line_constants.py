@@ -1,5 +1,10 @@
 # --- API Endpoints ---
 PUSH_MESSAGE_URL = "https://api.line.me/v2/bot/message/push"
+REPLY_MESSAGE_URL = "https://api.line.me/v2/bot/message/reply"
+BOT_INFO_URL = "https://api.line.me/v2/bot/info"
+
+# --- API Limits ---
+MAX_MESSAGES_PER_REQUEST = 5
 
 # --- Webhook Event Types ---
 EVENT_TYPE_MESSAGE = "message"
@@ -1,20 +1,35 @@
+from datetime import UTC, datetime
+from functools import partial
+
 from fastapi import HTTPException, Request, status
 from pydantic import ValidationError
+from src.a_domain.model.reply_token import ReplyToken
+from src.a_domain.ports.bussiness.event_dedup_port import EventDeduplicationPort
 from src.b_application.pipeline import Pipeline
-from src.c_infrastructure.platforms.line.dto.line_dto import LineWebhookPayload
+from src.c_infrastructure.platforms.line.dto.line_dto import LineEvent, LineWebhookPayload
 from src.c_infrastructure.platforms.line.line_constants import EVENT_TYPE_MESSAGE, MESSAGE_TYPE_TEXT
 from src.c_infrastructure.platforms.line.line_security import LineSecurityService
+from src.c_infrastructure.services.job_queue_service import Job
+from src.c_infrastructure.services.message_coalescer_service import MessageCoalescerService
 
 class LineWebhookHandler:
-    def __init__(self, security_service: LineSecurityService, pipeline: Pipeline):
+    def __init__(
+        self,
+        security_service: LineSecurityService,
+        pipeline: Pipeline,
+        coalescer: MessageCoalescerService,
+        deduplicator: EventDeduplicationPort,
+    ):
         self._security_service = security_service
         self._pipeline = pipeline
+        self._coalescer = coalescer
+        self._deduplicator = deduplicator
 
     async def handle(self, request: Request, signature: str | None):
         body = await request.body()
         if not self._security_service.verify_signature(body, signature):
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail='Invalid signature')
-        
+
         try:
             payload = LineWebhookPayload.model_validate_json(body)
         except ValidationError as e:
@@ -24,5 +39,35 @@ class LineWebhookHandler:
             if event.type == EVENT_TYPE_MESSAGE and event.message and (event.message.type == MESSAGE_TYPE_TEXT):
                 user_id = event.source.userId
                 text_content = event.message.text
-                if text_content:
-                    await self._pipeline.execute(user_id=user_id, incoming_content=text_content)
+                if text_content and await self._is_first_delivery(event):
+                    accepted = self._coalescer.add(
+                        user_id,
+                        text_content,
+                        build_job=partial(self._build_job, user_id, self._reply_token(event)),
+                        name=f"line:{user_id}",
+                        # Reset commands must not be merged into a burst, or they would no longer match.
+                        immediate=self._pipeline.is_reset_command(text_content),
+                    )
+                    if not accepted:
+                        # Let LINE redeliver later instead of silently dropping the event; the redelivery
+                        # must not be mistaken for a duplicate of this rejected delivery.
+                        if event.dedup_id:
+                            await self._deduplicator.forget(event.dedup_id)
+                        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail='Server busy')
+
+    async def _is_first_delivery(self, event: LineEvent) -> bool:
+        event_id = event.dedup_id
+        if not event_id:
+            return True
+        return await self._deduplicator.mark_seen(event_id)
+
+    def _reply_token(self, event: LineEvent) -> ReplyToken | None:
+        if not event.replyToken:
+            return None
+        if event.timestamp is None:
+            return ReplyToken(value=event.replyToken)
+        issued_at = datetime.fromtimestamp(event.timestamp / 1000, tz=UTC)
+        return ReplyToken(value=event.replyToken, issued_at=issued_at)
+
+    def _build_job(self, user_id: str, reply_token: ReplyToken | None, content: str) -> Job:
+        return partial(self._pipeline.execute, user_id=user_id, incoming_content=content, reply_token=reply_token)
@@ -1,11 +1,10 @@
 from __future__ import annotations
 
-import httpx
-
 from src.a_domain.model.web_search_result import WebSearchResult
 from src.a_domain.ports.bussiness.web_search_port import WebSearchPort
 from src.a_domain.ports.notification.logging_port import ILoggingPort
 from src.b_application.configuration.schemas import AppConfig
+from src.c_infrastructure.services.http_client_pool_service import HttpClientPoolService
 
 
 class TavilySearchAdapter(WebSearchPort):
@@ -13,15 +12,16 @@ class TavilySearchAdapter(WebSearchPort):
     Tavily web search adapter.
     """
 
-    def __init__(self, config: AppConfig, logger: ILoggingPort) -> None:
+    search_url = "https://api.tavily.com/search"
+
+    def __init__(self, config: AppConfig, logger: ILoggingPort, http_pool: HttpClientPoolService) -> None:
         self._config = config
         self._logger = logger
 
         if not self._config.tavily_api_key:
             raise ValueError("Missing tavily_api_key in configuration.")
 
-        timeout = getattr(self._config, "ai_model_connection_timeout", 30)
-        self._client = httpx.AsyncClient(timeout=httpx.Timeout(timeout))
+        self._http_pool = http_pool
 
     async def search(self, query: str, limit: int = 3) -> list[WebSearchResult]:
         payload: dict = {
@@ -43,7 +43,8 @@ class TavilySearchAdapter(WebSearchPort):
             payload["exclude_domains"] = list(excluded)
 
         try:
-            resp = await self._client.post("https://api.tavily.com/search", json=payload)
+            # Looked up per request: the pool replaces a client that was closed.
+            resp = await self._http_pool.client_for(self.search_url).post(self.search_url, json=payload)
             resp.raise_for_status()
             data = resp.json()
 
@@ -1,4 +1,5 @@
 import re
+from collections.abc import AsyncIterator
 
 from src.a_domain.model.message import Message, MessageRole
 from src.a_domain.ports.bussiness.chat_styler_port import IChatStylerPort
@@ -7,9 +8,39 @@ from src.a_domain.ports.bussiness.chat_styler_port import IChatStylerPort
 class ChatStylerService(IChatStylerPort):
     _MAX_MESSAGE_LENGTH = 400
     _SPLIT_DELIMITERS = r"\n\n+"
+    _SPLIT_PATTERN = re.compile(_SPLIT_DELIMITERS)
+    _CODE_FENCE = "```"
+    _FALLBACK_REPLY = "Could you ask me again?🤔"
 
     def format_response(self, message: Message) -> tuple[Message, ...]:
-        content = self._remove_markdown(message.content)
+        final_messages = self._format_text(message.content)
+
+        if not final_messages:
+            return (Message(role=MessageRole.ASSISTANT, content=self._FALLBACK_REPLY),)
+
+        return tuple(final_messages)
+
+    async def format_stream(self, deltas: AsyncIterator[str]) -> AsyncIterator[Message]:
+        buffer = ""
+        scanned = fences = 0
+        emitted = False
+        async for delta in deltas:
+            buffer += delta
+            completed, buffer, scanned, fences = self._take_completed_text(buffer, scanned, fences)
+            for chunk in completed:
+                for message in self._format_text(chunk):
+                    emitted = True
+                    yield message
+
+        for message in self._format_text(buffer):
+            emitted = True
+            yield message
+
+        if not emitted:
+            yield Message(role=MessageRole.ASSISTANT, content=self._FALLBACK_REPLY)
+
+    def _format_text(self, text: str) -> list[Message]:
+        content = self._remove_markdown(text)
 
         raw_chunks = re.split(self._SPLIT_DELIMITERS, content)
 
@@ -23,11 +54,42 @@ class ChatStylerService(IChatStylerPort):
                 final_messages.extend(self._force_split_long_text(trimmed_chunk))
             else:
                 final_messages.append(Message(role=MessageRole.ASSISTANT, content=trimmed_chunk))
-
-        if not final_messages:
-            return (Message(role=MessageRole.ASSISTANT, content="Could you ask me again?🤔"),)
-
-        return tuple(final_messages)
+        return final_messages
+
+    def _take_completed_text(self, buffer: str, scanned: int, fences: int) -> tuple[list[str], str, int, int]:
+        """
+        Splits finished paragraphs (or sentence chunks of an over-long paragraph) off the stream buffer.
+        buffer[:scanned] was already searched and holds `fences` code fences, so each delta only scans
+        the new text. Returns the finished pieces, the still-growing remainder and its scan state.
+        """
+        completed: list[str] = []
+        start = counted = 0
+        for match in self._SPLIT_PATTERN.finditer(buffer, scanned):
+            fences += buffer.count(self._CODE_FENCE, max(counted, scanned), match.start())
+            counted = match.start()
+            # A blank line inside a code block is not a paragraph break; the block is styled as a whole.
+            if fences % 2 == 1:
+                continue
+            completed.append(buffer[start : match.start()])
+            start = counted = match.end()
+            fences = 0
+
+        # Trailing newlines and backticks may still become a break or a fence; leave them for the next scan.
+        end = len(buffer)
+        while end > max(counted, scanned) and buffer[end - 1] in "\n`":
+            end -= 1
+        fences += buffer.count(self._CODE_FENCE, max(counted, scanned), end)
+        unscanned = len(buffer) - end
+        has_fence = fences > 0 or self._CODE_FENCE in buffer[end:]
+        tail = buffer[start:]
+
+        while len(tail) > self._MAX_MESSAGE_LENGTH and not has_fence:
+            split_at = self._find_split_position(tail)
+            completed.append(tail[:split_at])
+            # Only strip the left side: a trailing newline may be the start of the next paragraph break.
+            tail = tail[split_at:].lstrip()
+
+        return completed, tail, max(0, len(tail) - unscanned), fences
 
     def _remove_markdown(self, text: str) -> str:
         text = re.sub(r"\*\*(.*?)\*\*|\*(.*?)\*", r"\1\2", text)
@@ -39,26 +101,30 @@ class ChatStylerService(IChatStylerPort):
     def _force_split_long_text(self, text: str) -> list[Message]:
         parts = []
         while len(text) > self._MAX_MESSAGE_LENGTH:
-            possible_splits = [
-                text.rfind("。", 0, self._MAX_MESSAGE_LENGTH),
-                text.rfind(".", 0, self._MAX_MESSAGE_LENGTH),
-                text.rfind("！", 0, self._MAX_MESSAGE_LENGTH),
-                text.rfind("!", 0, self._MAX_MESSAGE_LENGTH),
-                text.rfind("？", 0, self._MAX_MESSAGE_LENGTH),
-                text.rfind("?", 0, self._MAX_MESSAGE_LENGTH),
-            ]
-
-            split_at = max(possible_splits)
-
-            if split_at == -1:
-                split_at = text.rfind(" ", 0, self._MAX_MESSAGE_LENGTH)
-
-            if split_at == -1:
-                split_at = self._MAX_MESSAGE_LENGTH
-
+            split_at = self._find_split_position(text)
             parts.append(Message(role=MessageRole.ASSISTANT, content=text[:split_at].strip()))
             text = text[split_at:].strip()
 
         if text:
             parts.append(Message(role=MessageRole.ASSISTANT, content=text))
         return parts
+
+    def _find_split_position(self, text: str) -> int:
+        possible_splits = [
+            text.rfind("。", 0, self._MAX_MESSAGE_LENGTH),
+            text.rfind(".", 0, self._MAX_MESSAGE_LENGTH),
+            text.rfind("！", 0, self._MAX_MESSAGE_LENGTH),
+            text.rfind("!", 0, self._MAX_MESSAGE_LENGTH),
+            text.rfind("？", 0, self._MAX_MESSAGE_LENGTH),
+            text.rfind("?", 0, self._MAX_MESSAGE_LENGTH),
+        ]
+
+        split_at = max(possible_splits)
+
+        if split_at == -1:
+            split_at = text.rfind(" ", 0, self._MAX_MESSAGE_LENGTH)
+
+        if split_at <= 0:
+            split_at = self._MAX_MESSAGE_LENGTH
+
+        return split_at
@@ -0,0 +1,155 @@
+from collections.abc import AsyncIterator, Awaitable, Callable
+from dataclasses import dataclass
+from importlib.util import find_spec
+
+import httpx
+
+from src.a_domain.ports.notification.logging_port import ILoggingPort
+from src.b_application.configuration.schemas import AppConfig
+
+ResponseHook = Callable[[httpx.Response], Awaitable[None]]
+
+
+@dataclass(frozen=True)
+class HostPoolStats:
+    host: str
+    http2: bool
+    max_connections: int
+    in_flight: int
+    max_in_flight: int
+    # Requests queued for a free connection. Known over HTTP/1.1, where each request holds a connection until
+    # its response is closed; None over HTTP/2, which multiplexes requests on shared connections.
+    waiting: int | None
+
+
+class _CountedStream(httpx.AsyncByteStream):
+    def __init__(self, inner: httpx.AsyncByteStream, on_close: Callable[[], None]):
+        self._inner = inner
+        self._on_close: Callable[[], None] | None = on_close
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._inner:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._inner.aclose()
+        finally:
+            if self._on_close is not None:
+                self._on_close()
+                self._on_close = None
+
+
+class _CountingTransport(httpx.AsyncBaseTransport):
+    """Counts requests from the moment they are sent until their response is closed."""
+
+    def __init__(self, inner: httpx.AsyncBaseTransport):
+        self._inner = inner
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            response = await self._inner.handle_async_request(request)
+        except BaseException:
+            self._finished()
+            raise
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=response.headers,
+            stream=_CountedStream(response.stream, self._finished),
+            extensions=response.extensions,
+        )
+
+    async def aclose(self) -> None:
+        await self._inner.aclose()
+
+    def _finished(self) -> None:
+        self.in_flight -= 1
+
+
+class HttpClientPoolService:
+    """
+    Owns the long-lived httpx clients used by every outbound adapter (LINE, Tavily, OpenAI-compatible SDKs).
+
+    One client per host keeps keep-alive connections warm and gives each upstream its own connection limit.
+    Create it once at startup and close it at shutdown.
+    """
+
+    def __init__(self, config: AppConfig, logger: ILoggingPort):
+        self._config = config
+        self._logger = logger
+        self._clients: dict[str, httpx.AsyncClient] = {}
+        self._transports: dict[str, _CountingTransport] = {}
+        self._response_hooks: list[ResponseHook] = []
+        self._http2 = config.http2_enabled and self._http2_available()
+
+    def client_for(self, url: str) -> httpx.AsyncClient:
+        host = httpx.URL(url).host
+        client = self._clients.get(host)
+        if client is None or client.is_closed:
+            client = self._create_client(host)
+            self._clients[host] = client
+        return client
+
+    def add_response_hook(self, hook: ResponseHook) -> None:
+        """Registers a hook that sees every response (e.g. to read rate-limit headers), on all clients."""
+        self._response_hooks.append(hook)
+        for client in self._clients.values():
+            client.event_hooks["response"].append(hook)
+
+    async def aclose(self) -> None:
+        for host, client in self._clients.items():
+            await client.aclose()
+            self._logger.debug(f"Closed HTTP connection pool for {host}")
+        self._clients.clear()
+        self._transports.clear()
+
+    def stats(self) -> tuple[HostPoolStats, ...]:
+        return tuple(self._host_stats(host, transport) for host, transport in sorted(self._transports.items()))
+
+    def _create_client(self, host: str) -> httpx.AsyncClient:
+        max_connections = self._max_connections(host)
+        limits = self._limits(max_connections)
+        self._logger.debug(f"Creating HTTP connection pool for {host} (max={max_connections}, http2={self._http2})")
+        transport = _CountingTransport(self._create_transport(limits))
+        self._transports[host] = transport
+        return httpx.AsyncClient(
+            http2=self._http2,
+            limits=limits,
+            transport=transport,
+            timeout=httpx.Timeout(self._config.ai_model_connection_timeout),
+            event_hooks={"response": list(self._response_hooks)},
+        )
+
+    def _create_transport(self, limits: httpx.Limits) -> httpx.AsyncBaseTransport:
+        return httpx.AsyncHTTPTransport(http2=self._http2, limits=limits)
+
+    def _limits(self, max_connections: int) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=min(self._config.http_max_keepalive_connections, max_connections),
+            keepalive_expiry=self._config.http_keepalive_expiry_seconds,
+        )
+
+    def _max_connections(self, host: str) -> int:
+        return self._config.http_host_max_connections.get(host, self._config.http_max_connections_per_host)
+
+    def _http2_available(self) -> bool:
+        if find_spec("h2") is None:
+            self._logger.warning("http2_enabled is set but the 'h2' package is not installed. Using HTTP/1.1.")
+            return False
+        return True
+
+    def _host_stats(self, host: str, transport: _CountingTransport) -> HostPoolStats:
+        max_connections = self._max_connections(host)
+        return HostPoolStats(
+            host=host,
+            http2=self._http2,
+            max_connections=max_connections,
+            in_flight=transport.in_flight,
+            max_in_flight=transport.max_in_flight,
+            waiting=None if self._http2 else max(0, transport.in_flight - max_connections),
+        )
@@ -0,0 +1,183 @@
+import asyncio
+import itertools
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+
+from src.a_domain.ports.notification.logging_port import ILoggingPort
+
+Job = Callable[[], Awaitable[None]]
+
+
+@dataclass(frozen=True)
+class JobQueueStats:
+    worker_count: int
+    busy_workers: int
+    depth: int
+    oldest_job_age_seconds: float
+    active_keys: int
+    max_key_depth: int
+    processed: int
+    failed: int
+    rejected: int
+    busiest_keys: dict[str, int] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class _QueuedJob:
+    name: str
+    job: Job
+    enqueued_at: float
+
+
+class JobQueueService:
+    """
+    In-process keyed job scheduler drained by a fixed pool of asyncio workers.
+
+    Jobs sharing a key (e.g. a LINE userId) run strictly one after another in submission
+    order, while jobs for different keys run concurrently, bounded by the worker count.
+    Keys with more work are re-queued behind other keys after each job so one busy user
+    cannot starve the rest.
+    """
+
+    _BUSIEST_KEYS_REPORTED = 10
+
+    def __init__(
+        self, logger: ILoggingPort, worker_count: int, max_size: int, shutdown_timeout: float, name: str = "job"
+    ):
+        self._logger = logger
+        self._name = name
+        self._label = f"{name.capitalize()} queue"
+        self._worker_count = worker_count
+        self._max_size = max_size
+        self._shutdown_timeout = shutdown_timeout
+        self._pending: dict[str, deque[_QueuedJob]] = {}
+        self._ready: asyncio.Queue[str] = asyncio.Queue()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._anonymous_keys = itertools.count()
+        self._workers: list[asyncio.Task] = []
+        self._accepting = False
+        self._depth = 0
+        self._busy = 0
+        self._processed = 0
+        self._failed = 0
+        self._rejected = 0
+
+    async def start(self) -> None:
+        if self._workers:
+            return
+        self._accepting = True
+        self._workers = [
+            asyncio.create_task(self._worker(index), name=f"{self._name}-worker-{index}")
+            for index in range(self._worker_count)
+        ]
+        self._logger.info(f"{self._label} started with {self._worker_count} workers.")
+
+    async def stop(self) -> None:
+        self._accepting = False
+        if not self._workers:
+            return
+
+        self._logger.info(f"Draining {self._label.lower()} ({self._depth} pending jobs)...")
+        try:
+            await asyncio.wait_for(self._idle.wait(), timeout=self._shutdown_timeout)
+        except TimeoutError:
+            self._logger.warning(
+                f"{self._label} did not drain within {self._shutdown_timeout}s. Dropping {self._depth} pending jobs."
+            )
+
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        self._logger.info(f"{self._label} stopped.")
+
+    def submit(self, job: Job, name: str = "job", key: str | None = None) -> bool:
+        """
+        Enqueues a job. Jobs submitted with the same key are executed in order, one at a time.
+        """
+        if not self._accepting:
+            self._logger.warning(f"{self._label} is not accepting jobs. Rejected: {name}")
+            self._rejected += 1
+            return False
+
+        if self._depth >= self._max_size:
+            self._logger.error(f"{self._label} is full ({self._max_size}). Rejected: {name}")
+            self._rejected += 1
+            return False
+
+        if key is None:
+            key = f"__anonymous-{next(self._anonymous_keys)}"
+
+        queued = _QueuedJob(name=name, job=job, enqueued_at=time.monotonic())
+        jobs = self._pending.get(key)
+        if jobs is None:
+            # A key is scheduled on the ready queue only while it owns pending work,
+            # and only once, which is what keeps its jobs strictly ordered.
+            self._pending[key] = deque((queued,))
+            self._ready.put_nowait(key)
+        else:
+            jobs.append(queued)
+
+        self._depth += 1
+        self._idle.clear()
+        self._logger.trace(f"Job enqueued: {name} (key_depth={len(self._pending[key])}, depth={self._depth})")
+        return True
+
+    @property
+    def accepting(self) -> bool:
+        return self._accepting
+
+    def free_slots(self) -> int:
+        """Jobs that submit would still accept right now."""
+        return max(0, self._max_size - self._depth) if self._accepting else 0
+
+    def key_depth(self, key: str) -> int:
+        jobs = self._pending.get(key)
+        return len(jobs) if jobs else 0
+
+    def stats(self) -> JobQueueStats:
+        now = time.monotonic()
+        oldest_age = max((now - jobs[0].enqueued_at for jobs in self._pending.values() if jobs), default=0.0)
+        key_depths = {key: len(jobs) for key, jobs in self._pending.items() if jobs}
+        busiest = sorted(key_depths.items(), key=lambda item: item[1], reverse=True)[: self._BUSIEST_KEYS_REPORTED]
+        return JobQueueStats(
+            worker_count=len(self._workers),
+            busy_workers=self._busy,
+            depth=self._depth,
+            oldest_job_age_seconds=round(oldest_age, 3),
+            active_keys=len(self._pending),
+            max_key_depth=busiest[0][1] if busiest else 0,
+            processed=self._processed,
+            failed=self._failed,
+            rejected=self._rejected,
+            busiest_keys=dict(busiest),
+        )
+
+    async def _worker(self, index: int) -> None:
+        while True:
+            key = await self._ready.get()
+            jobs = self._pending[key]
+            queued = jobs.popleft()
+            self._depth -= 1
+            self._busy += 1
+            try:
+                waited = time.monotonic() - queued.enqueued_at
+                self._logger.debug(f"[{self._name}-worker-{index}] Running {queued.name} after waiting {waited:.3f}s")
+                await queued.job()
+                self._processed += 1
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self._failed += 1
+                self._logger.exception(f"[{self._name}-worker-{index}] Job {queued.name} failed")
+            finally:
+                self._busy -= 1
+                if jobs:
+                    self._ready.put_nowait(key)
+                else:
+                    del self._pending[key]
+                if self._depth == 0 and self._busy == 0:
+                    self._idle.set()
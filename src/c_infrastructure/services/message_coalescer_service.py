@@ -0,0 +1,138 @@
+import asyncio
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+from src.a_domain.ports.notification.logging_port import ILoggingPort
+from src.c_infrastructure.services.job_queue_service import Job, JobQueueService
+
+
+@dataclass(frozen=True)
+class CoalescerStats:
+    window_seconds: float
+    pending_keys: int
+    buffered_messages: int
+    flushed_turns: int
+    merged_messages: int
+    retried_flushes: int
+    dropped_turns: int
+
+
+@dataclass
+class _Burst:
+    started_at: float
+    texts: list[str] = field(default_factory=list)
+    build_job: Callable[[str], Job] | None = None
+    timer: asyncio.TimerHandle | None = None
+    retries: int = 0
+
+
+class MessageCoalescerService:
+    """
+    Debounces rapid consecutive text messages per key into a single job.
+
+    Every new message restarts the key's window; once the window passes quietly (or the
+    burst has been open for max_wait_seconds) the buffered texts are joined into one turn
+    and submitted to the job queue under the same key.
+
+    The webhook is acknowledged before the burst is flushed, so a burst is only opened while the
+    job queue has a slot for it; otherwise add() refuses the text and the platform redelivers it.
+    A flush the queue still rejects keeps the burst and retries with backoff.
+    """
+
+    _JOINER = "\n"
+    _RETRY_BASE_SECONDS = 0.5
+    _RETRY_MAX_SECONDS = 10.0
+
+    def __init__(
+        self, job_queue: JobQueueService, logger: ILoggingPort, window_seconds: float, max_wait_seconds: float
+    ):
+        self._job_queue = job_queue
+        self._logger = logger
+        self._window = window_seconds
+        self._max_wait = max(max_wait_seconds, window_seconds)
+        self._bursts: dict[str, _Burst] = {}
+        self._flushed_turns = 0
+        self._merged_messages = 0
+        self._retried_flushes = 0
+        self._dropped_turns = 0
+
+    def add(
+        self, key: str, text: str, build_job: Callable[[str], Job], name: str = "job", immediate: bool = False
+    ) -> bool:
+        """
+        Buffers a text for the key. build_job receives the merged text; the latest one wins.
+
+        With immediate=True any open burst is flushed first and the text is submitted on its own.
+        Returns False when the job queue has no room for the text.
+        """
+        if immediate or self._window <= 0:
+            if not self.flush(key, name):
+                return False
+            return self._job_queue.submit(build_job(text), name=name, key=key)
+
+        now = time.monotonic()
+        burst = self._bursts.get(key)
+        if burst is None:
+            # Every open burst becomes one job, so each needs a free slot in the queue.
+            if self._job_queue.free_slots() <= len(self._bursts):
+                self._logger.warning(f"No job queue capacity for a new burst from {key}.")
+                return False
+            burst = _Burst(started_at=now)
+            self._bursts[key] = burst
+        elif burst.timer:
+            burst.timer.cancel()
+
+        burst.texts.append(text)
+        burst.build_job = build_job
+        delay = max(0.0, min(self._window, burst.started_at + self._max_wait - now))
+        burst.timer = asyncio.get_running_loop().call_later(delay, self.flush, key, name)
+        self._logger.trace(f"Buffered message for {key} ({len(burst.texts)} in burst, flush in {delay:.2f}s)")
+        return True
+
+    def flush(self, key: str, name: str = "job") -> bool:
+        burst = self._bursts.pop(key, None)
+        if burst is None or burst.build_job is None:
+            return True
+        if burst.timer:
+            burst.timer.cancel()
+
+        merged = self._JOINER.join(burst.texts)
+        if not self._job_queue.submit(burst.build_job(merged), name=name, key=key):
+            return self._retry_later(key, name, burst)
+
+        self._flushed_turns += 1
+        if len(burst.texts) > 1:
+            self._merged_messages += len(burst.texts) - 1
+            self._logger.debug(f"Coalesced {len(burst.texts)} messages from {key} into one turn.")
+        return True
+
+    def flush_all(self) -> None:
+        for key in list(self._bursts):
+            self.flush(key)
+
+    def _retry_later(self, key: str, name: str, burst: _Burst) -> bool:
+        if not self._job_queue.accepting:
+            # Shutting down: nothing will drain the queue any more.
+            self._dropped_turns += 1
+            self._logger.error(f"Dropped coalesced turn for {key}: job queue is stopped.")
+            return False
+
+        burst.retries += 1
+        delay = min(self._RETRY_BASE_SECONDS * 2 ** (burst.retries - 1), self._RETRY_MAX_SECONDS)
+        burst.timer = asyncio.get_running_loop().call_later(delay, self.flush, key, name)
+        self._bursts[key] = burst
+        self._retried_flushes += 1
+        self._logger.warning(f"Job queue rejected the coalesced turn for {key}. Retrying in {delay:.1f}s.")
+        return False
+
+    def stats(self) -> CoalescerStats:
+        return CoalescerStats(
+            window_seconds=self._window,
+            pending_keys=len(self._bursts),
+            buffered_messages=sum(len(burst.texts) for burst in self._bursts.values()),
+            flushed_turns=self._flushed_turns,
+            merged_messages=self._merged_messages,
+            retried_flushes=self._retried_flushes,
+            dropped_turns=self._dropped_turns,
+        )
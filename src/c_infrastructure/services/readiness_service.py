@@ -0,0 +1,102 @@
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+
+from src.a_domain.ports.notification.logging_port import ILoggingPort
+
+WarmupStep = Callable[[], Awaitable[None]]
+
+
+@dataclass(frozen=True)
+class WarmupStepStats:
+    name: str
+    finished: bool
+    ok: bool
+    seconds: float
+    error: str | None = None
+
+
+@dataclass(frozen=True)
+class ReadinessStats:
+    ready: bool
+    stopping: bool
+    warmup_seconds: float
+    steps: tuple[WarmupStepStats, ...]
+
+
+class ReadinessService:
+    """
+    Runs the warm-up steps (provider and platform connections, tokenizer loading) after startup
+    and reports the service ready once all of them have finished.
+
+    Steps run concurrently, each bounded by timeout_seconds. A failed or timed-out step is logged
+    and reported but does not hold readiness back: the first real request simply pays for it.
+    """
+
+    def __init__(self, logger: ILoggingPort, timeout_seconds: float):
+        self._logger = logger
+        self._timeout = timeout_seconds
+        self._steps: dict[str, WarmupStep] = {}
+        self._results: dict[str, WarmupStepStats] = {}
+        self._started_at: float | None = None
+        self._finished_at: float | None = None
+        self._ready = False
+        self._stopping = False
+
+    @property
+    def ready(self) -> bool:
+        return self._ready and not self._stopping
+
+    def add_step(self, name: str, step: WarmupStep) -> None:
+        self._steps[name] = step
+
+    async def run(self) -> None:
+        self._started_at = time.perf_counter()
+        self._logger.info(f"Warming up: {', '.join(self._steps) or 'nothing to do'}.")
+        await asyncio.gather(*(self._run_step(name, step) for name, step in self._steps.items()))
+        self._finished_at = time.perf_counter()
+        self._ready = True
+
+        failed = [result.name for result in self._results.values() if not result.ok]
+        elapsed = self._finished_at - self._started_at
+        if failed:
+            self._logger.warning(
+                f"Warm-up finished in {elapsed:.2f}s; failed steps: {', '.join(failed)}. Ready anyway."
+            )
+        else:
+            self._logger.info(f"Warm-up finished in {elapsed:.2f}s. Ready.")
+
+    def mark_stopping(self) -> None:
+        """Reports not-ready from now on so the load balancer stops routing here during shutdown."""
+        self._stopping = True
+
+    def stats(self) -> ReadinessStats:
+        now = time.perf_counter()
+        if self._started_at is None:
+            elapsed = 0.0
+        else:
+            elapsed = (self._finished_at or now) - self._started_at
+
+        steps = tuple(
+            self._results.get(name) or WarmupStepStats(name=name, finished=False, ok=False, seconds=round(elapsed, 3))
+            for name in self._steps
+        )
+        return ReadinessStats(ready=self.ready, stopping=self._stopping, warmup_seconds=round(elapsed, 3), steps=steps)
+
+    async def _run_step(self, name: str, step: WarmupStep) -> None:
+        started = time.perf_counter()
+        error: str | None = None
+        try:
+            await asyncio.wait_for(step(), timeout=self._timeout)
+        except TimeoutError:
+            error = f"timed out after {self._timeout}s"
+        except Exception as e:  # noqa: BLE001 - any failure is reported as a failed step, not raised.
+            error = str(e) or e.__class__.__name__
+
+        seconds = round(time.perf_counter() - started, 3)
+        if error:
+            self._logger.warning(f"Warm-up step '{name}' failed after {seconds:.3f}s: {error}")
+        else:
+            self._logger.debug(f"Warm-up step '{name}' done in {seconds:.3f}s.")
+        self._results[name] = WarmupStepStats(name=name, finished=True, ok=error is None, seconds=seconds, error=error)
@@ -0,0 +1,78 @@
+import re
+from collections import OrderedDict
+from collections.abc import Iterable
+from uuid import UUID
+
+import tiktoken
+
+from src.a_domain.model.ai_provider import AIModel
+from src.a_domain.model.message import Message
+from src.a_domain.ports.bussiness.token_counter_port import TokenCounterPort
+from src.a_domain.ports.notification.logging_port import ILoggingPort
+from src.a_domain.types.enums import AiProvider
+
+
+class TokenCounterService(TokenCounterPort):
+    """
+    Counts prompt tokens per provider and model, caching the count of every (immutable) message.
+
+    OpenAI-compatible models use tiktoken. Everything else, and every model whose encoding cannot be
+    loaded (tiktoken downloads it on first use), uses a heuristic: one token per CJK character and
+    roughly four characters per token for other text. That slightly over-counts, which is the safe
+    side for a budget.
+    """
+
+    _MESSAGE_OVERHEAD = 4
+    _CHARS_PER_TOKEN = 4
+    _CJK_PATTERN = re.compile(r"[\u3000-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af\uf900-\ufaff\uff00-\uffef]")
+    _TIKTOKEN_PROVIDERS = frozenset({AiProvider.OPENAI, AiProvider.GROK, AiProvider.GROQ})
+
+    def __init__(self, logger: ILoggingPort, max_cached_messages: int = 50_000):
+        self._logger = logger
+        self._max_cached = max_cached_messages
+        self._cache: OrderedDict[tuple[UUID, AiProvider, str], int] = OrderedDict()
+        self._encodings: dict[str, tiktoken.Encoding | None] = {}
+
+    def count_message(self, message: Message, model: AIModel) -> int:
+        key = (message.id, model.provider, model.name)
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            return cached
+
+        count = self._count_text(message.content, model) + self._MESSAGE_OVERHEAD
+        self._cache[key] = count
+        if len(self._cache) > self._max_cached:
+            self._cache.popitem(last=False)
+        return count
+
+    def count_messages(self, messages: Iterable[Message], model: AIModel) -> int:
+        return sum(self.count_message(message, model) for message in messages)
+
+    def _count_text(self, text: str, model: AIModel) -> int:
+        encoding = self._encoding_for(model)
+        if encoding is not None:
+            return len(encoding.encode(text, disallowed_special=()))
+
+        cjk_chars = len(self._CJK_PATTERN.findall(text))
+        other_chars = len(text) - cjk_chars
+        return cjk_chars + -(-other_chars // self._CHARS_PER_TOKEN)
+
+    def _encoding_for(self, model: AIModel) -> tiktoken.Encoding | None:
+        if model.provider not in self._TIKTOKEN_PROVIDERS:
+            return None
+        if model.name not in self._encodings:
+            self._encodings[model.name] = self._load_encoding(model.name)
+        return self._encodings[model.name]
+
+    def _load_encoding(self, model_name: str) -> tiktoken.Encoding | None:
+        try:
+            try:
+                return tiktoken.encoding_for_model(model_name)
+            except KeyError:
+                # Non-OpenAI model ids (Grok, Groq-hosted models) map best to the newest general encoding.
+                return tiktoken.get_encoding("o200k_base")
+        except (OSError, ValueError) as e:
+            # The encoding files are downloaded on first use; without them, count with the heuristic.
+            self._logger.warning(f"Could not load a tiktoken encoding for {model_name}: {e}. Using heuristic counts.")
+            return None
@@ -0,0 +1,101 @@
+from collections import deque
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+
+from src.a_domain.model.usage_record import UsageRecord
+from src.a_domain.ports.bussiness.usage_recorder_port import UsageRecorderPort
+from src.a_domain.ports.notification.logging_port import ILoggingPort
+
+
+@dataclass(frozen=True)
+class UsageSummary:
+    key: str
+    calls: int
+    prompt_tokens: int
+    completion_tokens: int
+    estimated_calls: int
+    estimated_tokens: int  # Part of prompt_tokens + completion_tokens counted locally, not reported by the provider
+    aborted_calls: int
+    cost_usd: float
+    unpriced_calls: int
+    avg_time_to_first_token: float
+    avg_total_seconds: float
+
+
+class UsageAccountingService(UsageRecorderPort):
+    """
+    Keeps recent model-call records in memory and aggregates them over rolling windows,
+    per provider, per model or per user.
+
+    Records older than retention_seconds (or beyond max_records) are dropped, so the
+    longest answerable window is the retention period.
+    """
+
+    def __init__(self, logger: ILoggingPort, retention_seconds: int, max_records: int):
+        self._logger = logger
+        self._retention = timedelta(seconds=retention_seconds)
+        self._records: deque[UsageRecord] = deque(maxlen=max_records)
+
+    def record(self, record: UsageRecord) -> None:
+        self._records.append(record)
+        self._prune(record.at)
+        cost = f", ${record.cost_usd:.6f}" if record.cost_usd is not None else ""
+        self._logger.debug(
+            f"Usage {record.provider.value}/{record.model_name} user={record.user_id}: "
+            f"{record.prompt_tokens}+{record.completion_tokens} tokens{' (estimated)' if record.estimated else ''}"
+            f"{' (aborted)' if record.aborted else ''}, "
+            f"ttft={record.time_to_first_token:.3f}s, total={record.total_seconds:.3f}s{cost}"
+        )
+
+    def by_provider(self, window_seconds: int) -> tuple[UsageSummary, ...]:
+        return self._group(self._window(window_seconds), lambda r: r.provider.value)
+
+    def by_model(self, window_seconds: int) -> tuple[UsageSummary, ...]:
+        return self._group(self._window(window_seconds), lambda r: f"{r.provider.value}/{r.model_name}")
+
+    def by_user(self, window_seconds: int, limit: int) -> tuple[UsageSummary, ...]:
+        summaries = self._group(self._window(window_seconds), lambda r: r.user_id or "anonymous")
+        return tuple(
+            sorted(summaries, key=lambda s: (s.cost_usd, s.prompt_tokens + s.completion_tokens), reverse=True)[:limit]
+        )
+
+    def for_user(self, user_id: str, window_seconds: int) -> tuple[UsageSummary, ...]:
+        """One summary per provider/model the user's turns were answered by."""
+        records = (r for r in self._window(window_seconds) if r.user_id == user_id)
+        return self._group(records, lambda r: f"{r.provider.value}/{r.model_name}")
+
+    def recent(self, limit: int, user_id: str | None = None) -> tuple[UsageRecord, ...]:
+        matching = (r for r in reversed(self._records) if user_id is None or r.user_id == user_id)
+        return tuple(record for record, _ in zip(matching, range(limit)))
+
+    def _window(self, window_seconds: int) -> Iterable[UsageRecord]:
+        since = datetime.now(UTC) - timedelta(seconds=window_seconds)
+        return (r for r in self._records if r.at >= since)
+
+    def _prune(self, now: datetime) -> None:
+        cutoff = now - self._retention
+        while self._records and self._records[0].at < cutoff:
+            self._records.popleft()
+
+    def _group(self, records: Iterable[UsageRecord], key: Callable[[UsageRecord], str]) -> tuple[UsageSummary, ...]:
+        groups: dict[str, list[UsageRecord]] = {}
+        for record in records:
+            groups.setdefault(key(record), []).append(record)
+        return tuple(self._summarize(name, group) for name, group in sorted(groups.items()))
+
+    def _summarize(self, key: str, records: list[UsageRecord]) -> UsageSummary:
+        calls = len(records)
+        return UsageSummary(
+            key=key,
+            calls=calls,
+            prompt_tokens=sum(r.prompt_tokens for r in records),
+            completion_tokens=sum(r.completion_tokens for r in records),
+            estimated_calls=sum(r.estimated for r in records),
+            estimated_tokens=sum(r.prompt_tokens + r.completion_tokens for r in records if r.estimated),
+            aborted_calls=sum(r.aborted for r in records),
+            cost_usd=round(sum(r.cost_usd or 0.0 for r in records), 6),
+            unpriced_calls=sum(r.cost_usd is None for r in records),
+            avg_time_to_first_token=round(sum(r.time_to_first_token for r in records) / calls, 3),
+            avg_total_seconds=round(sum(r.total_seconds for r in records) / calls, 3),
+        )
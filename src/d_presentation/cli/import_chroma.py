@@ -0,0 +1,52 @@
+"""
+Copies every conversation from a Chroma chat_history collection into the SQLite conversation store.
+
+Reads both the legacy single-document layout and the header + message records, leaves the Chroma
+data untouched, and skips users already present in SQLite unless --overwrite is given, so it can be
+re-run safely. Stop the service first: Chroma allows a single client per persist path.
+
+    uv run python -m src.d_presentation.cli.import_chroma --chroma-path ./chroma_data
+"""
+
+import argparse
+import asyncio
+import time
+from itertools import batched
+
+from src.c_infrastructure.config.loader import load_settings
+from src.c_infrastructure.persistence.chroma.chroma_repository import export_conversations
+from src.c_infrastructure.persistence.sqlite.sqlite_repository import SqliteRepositoryAdapter
+from src.c_infrastructure.services.logger_service import LoggerService
+
+
+async def main() -> None:
+    settings = load_settings()
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--chroma-path", default=settings.chroma_persist_path)
+    parser.add_argument("--sqlite-path", default=settings.sqlite_repository_path, help="relative to the project root")
+    parser.add_argument("--batch-size", type=int, default=200, help="conversations written per transaction")
+    parser.add_argument("--overwrite", action="store_true", help="replace conversations already in SQLite")
+    args = parser.parse_args()
+
+    logger = LoggerService(level=settings.log_level)
+    repository = SqliteRepositoryAdapter(
+        config=settings.model_copy(update={"sqlite_repository_path": args.sqlite_path}), logger=logger
+    )
+
+    started = time.perf_counter()
+    read = imported = 0
+    try:
+        for batch in batched(export_conversations(args.chroma_path), args.batch_size):
+            read += len(batch)
+            imported += await repository.import_conversations(batch, overwrite=args.overwrite)
+            logger.info(f"Imported {imported}/{read} conversations...")
+    finally:
+        await repository.aclose()
+
+    logger.info(
+        f"Done in {time.perf_counter() - started:.1f}s: {imported} imported, {read - imported} already in SQLite."
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
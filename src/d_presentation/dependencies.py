@@ -1,39 +1,67 @@
+import asyncio
+import secrets
 from functools import lru_cache
 
-from fastapi import Depends
+import httpx
+from fastapi import Depends, Header, HTTPException, status
+from src.a_domain.model.ai_provider import AIModel
+from src.a_domain.model.message import Message, MessageRole
 from src.a_domain.ports.bussiness.ai_port import AiPort
 from src.a_domain.ports.bussiness.chat_styler_port import IChatStylerPort
+from src.a_domain.ports.bussiness.event_dedup_port import EventDeduplicationPort
 from src.a_domain.ports.bussiness.platform_port import PlatformPort
 from src.a_domain.ports.bussiness.repository_port import RepositoryPort
+from src.a_domain.ports.bussiness.token_counter_port import TokenCounterPort
 from src.a_domain.ports.bussiness.web_search_port import WebSearchPort
 
 # Ports
 from src.a_domain.ports.notification.logging_port import ILoggingPort
 
 # Configurations
-from src.a_domain.types.enums import DatabaseProvider
+from src.a_domain.types.enums import AiProvider, DatabaseProvider, EventDedupProvider
 from src.b_application.configuration.schemas import AppConfig
 from src.b_application.pipeline import Pipeline
 from src.b_application.use_cases.collect.context_loader import ContextLoader
+from src.b_application.use_cases.collect.context_window import ContextWindowBuilder
 from src.b_application.use_cases.process.ai_processor import AiProcessor
+from src.b_application.use_cases.process.model_router import ModelRouter
 from src.b_application.use_cases.ship.dispatcher import Dispatcher
 from src.b_application.use_cases.ship.state_manager import StateManager
+from src.b_application.use_cases.ship.summarizer import ConversationSummarizer
+from src.c_infrastructure.ai_models.ai_adapter.grok_adapter import GrokAdapter
+from src.c_infrastructure.ai_models.ai_adapter.groq_adapter import GroqAIAdapter
+from src.c_infrastructure.ai_models.ai_adapter.openai_adapter import OpenAIAdapter
+from src.c_infrastructure.ai_models.cached_model_catalog import CachedModelCatalog
 from src.c_infrastructure.ai_models.factory import AiAdapterFactory
+from src.c_infrastructure.ai_models.model_catalog import ModelsCatalog
+from src.c_infrastructure.ai_models.rate_limiter import ProviderRateLimiter
+from src.c_infrastructure.ai_models.registry import AiAdapterRegistry
+from src.c_infrastructure.ai_models.response_cache import ResponseCache
 from src.c_infrastructure.config.loader import load_settings
 
 # Adapters & Services
 from src.c_infrastructure.persistence.chroma.chroma_repository import (
     ChromaRepositoryAdapter,
 )
+from src.c_infrastructure.persistence.event_dedup.inmemory_event_dedup import InMemoryEventDeduplicator
+from src.c_infrastructure.persistence.event_dedup.sqlite_event_dedup import SqliteEventDeduplicator
 from src.c_infrastructure.persistence.inmemory_repository import (
     InMemoryRepositoryAdapter,
 )
+from src.c_infrastructure.persistence.sqlite.sqlite_repository import SqliteRepositoryAdapter
+from src.c_infrastructure.persistence.write_behind_repository import WriteBehindRepositoryAdapter
 from src.c_infrastructure.platforms.line.line_adapter import LinePlatformAdapter
 from src.c_infrastructure.platforms.line.line_handler import LineWebhookHandler
 from src.c_infrastructure.platforms.line.line_security import LineSecurityService
 from src.c_infrastructure.search.tavily_search_adapter import TavilySearchAdapter
 from src.c_infrastructure.services.chat_styler_service import ChatStylerService
+from src.c_infrastructure.services.http_client_pool_service import HttpClientPoolService
+from src.c_infrastructure.services.job_queue_service import JobQueueService
+from src.c_infrastructure.services.message_coalescer_service import MessageCoalescerService
 from src.c_infrastructure.services.logger_service import LoggerService
+from src.c_infrastructure.services.readiness_service import ReadinessService
+from src.c_infrastructure.services.token_counter_service import TokenCounterService
+from src.c_infrastructure.services.usage_accounting_service import UsageAccountingService
 
 # Pipeline Components
 
@@ -50,13 +78,25 @@ def get_logger() -> ILoggingPort:
 
 
 @lru_cache
-def get_repository() -> RepositoryPort:
+def get_http_pool() -> HttpClientPoolService:
+    return HttpClientPoolService(config=get_settings(), logger=get_logger())
+
+
+@lru_cache
+def get_persistent_repository() -> RepositoryPort:
     # Call dependencies directly inside to keep signature clean for lru_cache
     settings = get_settings()
     logger = get_logger()
 
     if settings.database_provider == DatabaseProvider.CHROMA:
         return ChromaRepositoryAdapter(config=settings, logger=logger)
+    if settings.database_provider == DatabaseProvider.SQLITE:
+        return SqliteRepositoryAdapter(config=settings, logger=logger)
+    if settings.database_provider == DatabaseProvider.REDIS:
+        # Imported here so the redis client is only required when this provider is selected.
+        from src.c_infrastructure.persistence.redis.redis_repository import RedisRepositoryAdapter
+
+        return RedisRepositoryAdapter(config=settings, logger=logger)
     if settings.database_provider == DatabaseProvider.MEMORY:
         return InMemoryRepositoryAdapter(logger=logger)
 
@@ -66,16 +106,67 @@ def get_repository() -> RepositoryPort:
     return InMemoryRepositoryAdapter(logger=logger)
 
 
+@lru_cache
+def get_conversation_cache() -> WriteBehindRepositoryAdapter:
+    settings = get_settings()
+    return WriteBehindRepositoryAdapter(
+        inner=get_persistent_repository(),
+        logger=get_logger(),
+        max_entries=settings.conversation_cache_max_entries,
+        flush_interval_seconds=settings.conversation_cache_flush_interval_seconds,
+        max_dirty=settings.conversation_cache_flush_max_dirty,
+        history_limit=settings.conversation_history_limit,
+    )
+
+
+def get_enabled_conversation_cache(
+    settings: AppConfig = Depends(get_settings),
+) -> WriteBehindRepositoryAdapter:
+    if not settings.conversation_cache_enabled:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Conversation cache is disabled")
+    return get_conversation_cache()
+
+
+@lru_cache
+def get_repository() -> RepositoryPort:
+    if get_settings().conversation_cache_enabled:
+        return get_conversation_cache()
+    return get_persistent_repository()
+
+
+@lru_cache
+def get_event_deduplicator() -> EventDeduplicationPort:
+    settings = get_settings()
+    logger = get_logger()
+
+    if settings.event_dedup_provider == EventDedupProvider.SQLITE:
+        return SqliteEventDeduplicator(
+            logger=logger,
+            ttl_seconds=settings.event_dedup_ttl_seconds,
+            path=str(settings.project_root / settings.event_dedup_sqlite_path),
+        )
+    return InMemoryEventDeduplicator(
+        logger=logger,
+        ttl_seconds=settings.event_dedup_ttl_seconds,
+        max_entries=settings.event_dedup_max_entries,
+    )
+
+
 @lru_cache
 def get_styler() -> IChatStylerPort:
     return ChatStylerService()
 
 
+@lru_cache
+def get_token_counter() -> TokenCounterPort:
+    return TokenCounterService(logger=get_logger())
+
+
 @lru_cache
 def get_platform_adapter() -> PlatformPort:
     settings = get_settings()
     logger = get_logger()
-    return LinePlatformAdapter(config=settings, logger=logger)
+    return LinePlatformAdapter(config=settings, logger=logger, http_pool=get_http_pool())
 
 
 @lru_cache
@@ -87,74 +178,227 @@ def get_web_search() -> WebSearchPort | None:
         logger.debug("Tavily API key not configured. Web search disabled.")
         return None
     
-    return TavilySearchAdapter(config=settings, logger=logger)
+    return TavilySearchAdapter(config=settings, logger=logger, http_pool=get_http_pool())
+
+@lru_cache
+def get_rate_limiter() -> ProviderRateLimiter:
+    hosts = {
+        httpx.URL(OpenAIAdapter.openai_base_url).host: AiProvider.OPENAI,
+        httpx.URL(GrokAdapter.grok_base_url).host: AiProvider.GROK,
+        httpx.URL(GroqAIAdapter.groq_base_url).host: AiProvider.GROQ,
+    }
+    limiter = ProviderRateLimiter(config=get_settings(), logger=get_logger(), hosts=hosts)
+    get_http_pool().add_response_hook(limiter.observe_response)
+    return limiter
+
+
+@lru_cache
+def get_usage_accounting() -> UsageAccountingService:
+    settings = get_settings()
+    return UsageAccountingService(
+        logger=get_logger(),
+        retention_seconds=settings.usage_retention_seconds,
+        max_records=settings.usage_max_records,
+    )
+
+
+@lru_cache
+def get_ai_adapter_factory() -> AiAdapterFactory:
+    return AiAdapterFactory(
+        config=get_settings(),
+        logger=get_logger(),
+        web_search=get_web_search(),
+        http_pool=get_http_pool(),
+        rate_limiter=get_rate_limiter(),
+        usage_recorder=get_usage_accounting(),
+        token_counter=get_token_counter(),
+    )
+
 
 @lru_cache
-def get_ai_adapter() -> AiPort:
+def get_response_cache() -> ResponseCache:
+    settings = get_settings()
+    return ResponseCache(
+        ttl_seconds=settings.response_cache_ttl_seconds, max_entries=settings.response_cache_max_entries
+    )
+
+
+@lru_cache
+def get_ai_registry() -> AiAdapterRegistry:
+    settings = get_settings()
+    return AiAdapterRegistry(
+        factory=get_ai_adapter_factory(),
+        config=settings,
+        logger=get_logger(),
+        response_cache=get_response_cache() if settings.response_cache_enabled else None,
+    )
+
+
+@lru_cache
+def get_model_catalog() -> CachedModelCatalog:
     settings = get_settings()
     logger = get_logger()
-    web_search = get_web_search()
-    factory = AiAdapterFactory(config=settings, logger=logger, web_search=web_search)
-    return factory.create_adapter()
+    return CachedModelCatalog(
+        source=ModelsCatalog(config=settings, logger=logger, http_pool=get_http_pool()),
+        logger=logger,
+        path=str(settings.project_root / settings.model_catalog_path),
+        ttl_seconds=settings.model_catalog_ttl_seconds,
+    )
+
+
+@lru_cache
+def get_summary_ai_adapter() -> AiPort:
+    settings = get_settings()
+    provider = settings.summary_model_provider or settings.active_model
+    name = settings.summary_model_name or settings.available_models.get(provider)
+    if name is None:
+        raise ValueError(f"No model id resolved for summary provider {provider!s}.")
+    # Shares the provider's breaker and admission queue with chat traffic (at background priority).
+    return get_ai_adapter_factory().provider_adapter(AIModel(provider=provider, name=name))
+
+
+@lru_cache
+def get_job_queue() -> JobQueueService:
+    settings = get_settings()
+    logger = get_logger()
+    return JobQueueService(
+        logger=logger,
+        worker_count=settings.webhook_worker_count,
+        max_size=settings.webhook_queue_max_size,
+        shutdown_timeout=settings.webhook_shutdown_timeout,
+    )
+
+
+@lru_cache
+def get_summary_queue() -> JobQueueService:
+    settings = get_settings()
+    return JobQueueService(
+        logger=get_logger(),
+        worker_count=settings.summary_worker_count,
+        max_size=settings.summary_queue_max_size,
+        shutdown_timeout=settings.webhook_shutdown_timeout,
+        name="summary",
+    )
+
+
+@lru_cache
+def get_message_coalescer() -> MessageCoalescerService:
+    settings = get_settings()
+    return MessageCoalescerService(
+        job_queue=get_job_queue(),
+        logger=get_logger(),
+        window_seconds=settings.message_coalesce_window_seconds,
+        max_wait_seconds=settings.message_coalesce_max_wait_seconds,
+    )
+
+
+@lru_cache
+def get_summarizer() -> ConversationSummarizer:
+    return ConversationSummarizer(
+        repository=get_repository(),
+        ai_port=get_summary_ai_adapter(),
+        scheduler=get_job_queue(),
+        summary_scheduler=get_summary_queue(),
+        config=get_settings(),
+        logger=get_logger(),
+    )
 
 
 # --- Pipeline Assembly ---
+# Built once (at startup, by the lifespan) and shared by every request; these components hold no per-request state.
+
+
+@lru_cache
+def get_context_loader() -> ContextLoader:
+    return ContextLoader(repository=get_repository(), config=get_settings(), logger=get_logger())
 
 
-def get_context_loader(
-    repo: RepositoryPort = Depends(get_repository),
-    config: AppConfig = Depends(get_settings),
-    logger: ILoggingPort = Depends(get_logger),
-) -> ContextLoader:
-    return ContextLoader(repository=repo, config=config, logger=logger)
+@lru_cache
+def get_context_window() -> ContextWindowBuilder:
+    return ContextWindowBuilder(token_counter=get_token_counter(), config=get_settings(), logger=get_logger())
 
 
-def get_ai_processor(
-    ai: AiPort = Depends(get_ai_adapter),
-    styler: IChatStylerPort = Depends(get_styler),
-    logger: ILoggingPort = Depends(get_logger),
-) -> AiProcessor:
-    return AiProcessor(ai_port=ai, styler_port=styler, logger=logger)
+@lru_cache
+def get_model_router() -> ModelRouter:
+    return ModelRouter(
+        registry=get_ai_registry(), token_counter=get_token_counter(), config=get_settings(), logger=get_logger()
+    )
 
 
-def get_state_manager(
-    repo: RepositoryPort = Depends(get_repository),
-    logger: ILoggingPort = Depends(get_logger),
-) -> StateManager:
-    return StateManager(repository=repo, logger=logger)
+@lru_cache
+def get_ai_processor() -> AiProcessor:
+    return AiProcessor(registry=get_ai_registry(), styler_port=get_styler(), logger=get_logger())
 
 
-def get_dispatcher(
-    platform: PlatformPort = Depends(get_platform_adapter),
-    logger: ILoggingPort = Depends(get_logger),
-) -> Dispatcher:
-    return Dispatcher(platform=platform, logger=logger)
+@lru_cache
+def get_state_manager() -> StateManager:
+    return StateManager(repository=get_repository(), logger=get_logger())
 
 
-def get_chat_pipeline(
-    loader: ContextLoader = Depends(get_context_loader),
-    processor: AiProcessor = Depends(get_ai_processor),
-    manager: StateManager = Depends(get_state_manager),
-    dispatcher: Dispatcher = Depends(get_dispatcher),
-    config: AppConfig = Depends(get_settings),
-) -> Pipeline:
-    return Pipeline(loader, processor, manager, dispatcher, config)
+@lru_cache
+def get_dispatcher() -> Dispatcher:
+    return Dispatcher(platform=get_platform_adapter(), config=get_settings(), logger=get_logger())
 
 
-# --- Webhook Handler ---
+@lru_cache
+def get_chat_pipeline() -> Pipeline:
+    return Pipeline(
+        get_context_loader(),
+        get_context_window(),
+        get_model_router(),
+        get_ai_processor(),
+        get_state_manager(),
+        get_dispatcher(),
+        get_summarizer(),
+        get_settings(),
+        get_logger(),
+    )
 
 
-def get_line_security(
+# --- Admin ---
+
+
+def verify_admin_token(
+    x_admin_token: str | None = Header(None),
     settings: AppConfig = Depends(get_settings),
-    logger: ILoggingPort = Depends(get_logger),
-) -> LineSecurityService:
-    return LineSecurityService(
-        channel_secret=settings.line_channel_secret, logger=logger
+) -> None:
+    if not settings.admin_api_token:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Admin API is disabled")
+    if not x_admin_token or not secrets.compare_digest(x_admin_token, settings.admin_api_token):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid admin token")
+
+
+# --- Webhook Handler ---
+
+
+@lru_cache
+def get_line_security() -> LineSecurityService:
+    return LineSecurityService(channel_secret=get_settings().line_channel_secret, logger=get_logger())
+
+
+@lru_cache
+def get_line_handler() -> LineWebhookHandler:
+    return LineWebhookHandler(
+        security_service=get_line_security(),
+        pipeline=get_chat_pipeline(),
+        coalescer=get_message_coalescer(),
+        deduplicator=get_event_deduplicator(),
     )
 
 
-def get_line_handler(
-    security: LineSecurityService = Depends(get_line_security),
-    pipeline: Pipeline = Depends(get_chat_pipeline),
-) -> LineWebhookHandler:
-    return LineWebhookHandler(security_service=security, pipeline=pipeline)
+# --- Startup ---
+
+
+@lru_cache
+def get_readiness() -> ReadinessService:
+    settings = get_settings()
+    readiness = ReadinessService(logger=get_logger(), timeout_seconds=settings.startup_warmup_timeout_seconds)
+    active = AIModel(provider=settings.active_model, name=settings.active_model_name)
+    probe = Message(role=MessageRole.USER, content="warm-up")
+
+    readiness.add_step("ai", lambda: get_ai_registry().warm_up(get_model_router().candidates()))
+    readiness.add_step("repository", get_repository().warm_up)
+    readiness.add_step("line", get_platform_adapter().warm_up)
+    # Loading a tiktoken encoding may download it on first use.
+    readiness.add_step("tokenizer", lambda: asyncio.to_thread(get_token_counter().count_message, probe, active))
+    return readiness
@@ -1,11 +1,54 @@
+import asyncio
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+from src.d_presentation.dependencies import (
+    get_ai_registry,
+    get_http_pool,
+    get_job_queue,
+    get_line_handler,
+    get_message_coalescer,
+    get_model_catalog,
+    get_readiness,
+    get_repository,
+    get_summary_queue,
+)
 from src.d_presentation.web.routers.api_v1 import router as api_v1_router
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Build the whole object graph (Chroma client, adapters, pipeline) before accepting traffic,
+    # so a missing setting fails the deploy instead of the first webhook.
+    get_line_handler()
+    job_queue = get_job_queue()
+    await job_queue.start()
+    summary_queue = get_summary_queue()
+    await summary_queue.start()
+    model_catalog = get_model_catalog()
+    await model_catalog.start()
+    readiness = get_readiness()
+    warmup = asyncio.create_task(readiness.run(), name="startup-warmup")
+    yield
+    readiness.mark_stopping()
+    warmup.cancel()
+    await asyncio.gather(warmup, return_exceptions=True)
+    await model_catalog.stop()
+    get_message_coalescer().flush_all()
+    # Summaries drain first: each one finishes by queueing its write on the webhook queue.
+    await summary_queue.stop()
+    await job_queue.stop()
+    await get_repository().aclose()
+    await get_ai_registry().aclose()
+    await get_http_pool().aclose()
+
+
 def create_app() -> FastAPI:
     app = FastAPI(
         title='ChatFriend AI Assistant', 
         description='An AI chat assistant service for WhatsApp and Line.', 
-        version='0.1.0'
+        version='0.1.0',
+        lifespan=lifespan,
     )
     app.include_router(api_v1_router)
     return app
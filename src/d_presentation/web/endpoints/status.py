@@ -0,0 +1,125 @@
+from fastapi import APIRouter, Depends, Response, status
+
+from src.c_infrastructure.ai_models.cached_model_catalog import CachedModelCatalog, CatalogProviderStats
+from src.c_infrastructure.ai_models.circuit_breaker import BreakerStats
+from src.c_infrastructure.ai_models.failover import ProviderStats
+from src.c_infrastructure.ai_models.rate_limiter import ProviderLimitStats, ProviderRateLimiter
+from src.c_infrastructure.ai_models.registry import AiAdapterRegistry
+from src.c_infrastructure.ai_models.response_cache import ResponseCache, ResponseCacheStats
+from src.c_infrastructure.persistence.base import BaseRepositoryAdapter, RepositoryStats
+from src.c_infrastructure.persistence.event_dedup.base import BaseEventDeduplicator, EventDedupStats
+from src.c_infrastructure.persistence.write_behind_repository import (
+    ConversationCacheStats,
+    WriteBehindRepositoryAdapter,
+)
+from src.c_infrastructure.platforms.line.line_adapter import LinePlatformAdapter
+from src.c_infrastructure.services.http_client_pool_service import HostPoolStats, HttpClientPoolService
+from src.c_infrastructure.services.job_queue_service import JobQueueService, JobQueueStats
+from src.c_infrastructure.services.message_coalescer_service import CoalescerStats, MessageCoalescerService
+from src.c_infrastructure.services.readiness_service import ReadinessService, ReadinessStats
+from src.d_presentation.dependencies import (
+    get_ai_registry,
+    get_enabled_conversation_cache,
+    get_event_deduplicator,
+    get_http_pool,
+    get_job_queue,
+    get_message_coalescer,
+    get_model_catalog,
+    get_persistent_repository,
+    get_platform_adapter,
+    get_rate_limiter,
+    get_readiness,
+    get_response_cache,
+    get_summary_queue,
+)
+
+router = APIRouter()
+
+
+@router.get("/ready")
+async def get_readiness_status(
+    response: Response, readiness: ReadinessService = Depends(get_readiness)
+) -> ReadinessStats:
+    # 503 until warm-up has finished (and again once shutdown starts), so load balancers hold traffic back.
+    if not readiness.ready:
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    return readiness.stats()
+
+
+@router.get("/queue")
+async def get_queue_status(job_queue: JobQueueService = Depends(get_job_queue)) -> JobQueueStats:
+    return job_queue.stats()
+
+
+@router.get("/queue/summary")
+async def get_summary_queue_status(summary_queue: JobQueueService = Depends(get_summary_queue)) -> JobQueueStats:
+    return summary_queue.stats()
+
+
+@router.get("/coalescer")
+async def get_coalescer_status(
+    coalescer: MessageCoalescerService = Depends(get_message_coalescer),
+) -> CoalescerStats:
+    return coalescer.stats()
+
+
+@router.get("/dedup")
+async def get_dedup_status(
+    deduplicator: BaseEventDeduplicator = Depends(get_event_deduplicator),
+) -> EventDedupStats:
+    return deduplicator.stats()
+
+
+@router.get("/repository")
+async def get_repository_status(
+    repository: BaseRepositoryAdapter = Depends(get_persistent_repository),
+) -> RepositoryStats:
+    return repository.stats()
+
+
+@router.get("/repository/cache")
+async def get_conversation_cache_status(
+    cache: WriteBehindRepositoryAdapter = Depends(get_enabled_conversation_cache),
+) -> ConversationCacheStats:
+    return cache.stats()
+
+
+@router.get("/delivery")
+async def get_delivery_status(platform: LinePlatformAdapter = Depends(get_platform_adapter)) -> dict[str, int]:
+    return platform.stats()
+
+
+@router.get("/http")
+async def get_http_pool_status(http_pool: HttpClientPoolService = Depends(get_http_pool)) -> tuple[HostPoolStats, ...]:
+    return http_pool.stats()
+
+
+@router.get("/ai")
+async def get_ai_status(registry: AiAdapterRegistry = Depends(get_ai_registry)) -> dict[str, tuple[ProviderStats, ...]]:
+    # One failover chain per routed model, keyed by the model it tries first.
+    return {f"{model.provider.value}/{model.name}": chain.stats() for model, chain in registry.chains().items()}
+
+
+@router.get("/ai/breakers")
+async def get_ai_breaker_status(registry: AiAdapterRegistry = Depends(get_ai_registry)) -> tuple[BreakerStats, ...]:
+    return tuple(breaker.stats() for breaker in registry.breakers())
+
+
+@router.get("/ai/limits")
+async def get_ai_limit_status(
+    limiter: ProviderRateLimiter = Depends(get_rate_limiter),
+) -> tuple[ProviderLimitStats, ...]:
+    # Queue wait is reported here; model latency (time to first token) is under /ai.
+    return limiter.stats()
+
+
+@router.get("/ai/cache")
+async def get_response_cache_status(cache: ResponseCache = Depends(get_response_cache)) -> ResponseCacheStats:
+    return cache.stats()
+
+
+@router.get("/models")
+async def get_model_catalog_status(
+    catalog: CachedModelCatalog = Depends(get_model_catalog),
+) -> tuple[CatalogProviderStats, ...]:
+    return catalog.stats()
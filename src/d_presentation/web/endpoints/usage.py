@@ -0,0 +1,52 @@
+from fastapi import APIRouter, Depends, Query
+
+from src.a_domain.model.usage_record import UsageRecord
+from src.c_infrastructure.services.usage_accounting_service import UsageAccountingService, UsageSummary
+from src.d_presentation.dependencies import get_usage_accounting
+
+router = APIRouter()
+
+_DEFAULT_WINDOW = 3600
+
+
+@router.get("/providers")
+async def get_usage_by_provider(
+    window_seconds: int = Query(_DEFAULT_WINDOW, ge=1),
+    usage: UsageAccountingService = Depends(get_usage_accounting),
+) -> tuple[UsageSummary, ...]:
+    return usage.by_provider(window_seconds)
+
+
+@router.get("/models")
+async def get_usage_by_model(
+    window_seconds: int = Query(_DEFAULT_WINDOW, ge=1),
+    usage: UsageAccountingService = Depends(get_usage_accounting),
+) -> tuple[UsageSummary, ...]:
+    return usage.by_model(window_seconds)
+
+
+@router.get("/users")
+async def get_usage_by_user(
+    window_seconds: int = Query(_DEFAULT_WINDOW, ge=1),
+    limit: int = Query(50, ge=1, le=1000),
+    usage: UsageAccountingService = Depends(get_usage_accounting),
+) -> tuple[UsageSummary, ...]:
+    return usage.by_user(window_seconds, limit)
+
+
+@router.get("/users/{user_id}")
+async def get_usage_for_user(
+    user_id: str,
+    window_seconds: int = Query(_DEFAULT_WINDOW, ge=1),
+    usage: UsageAccountingService = Depends(get_usage_accounting),
+) -> tuple[UsageSummary, ...]:
+    return usage.for_user(user_id, window_seconds)
+
+
+@router.get("/turns")
+async def get_recent_turns(
+    limit: int = Query(50, ge=1, le=1000),
+    user_id: str | None = None,
+    usage: UsageAccountingService = Depends(get_usage_accounting),
+) -> tuple[UsageRecord, ...]:
+    return usage.recent(limit, user_id)
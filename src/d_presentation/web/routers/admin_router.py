@@ -0,0 +1,8 @@
+from fastapi import APIRouter, Depends
+
+from src.d_presentation.dependencies import verify_admin_token
+from src.d_presentation.web.endpoints import usage
+
+router = APIRouter(dependencies=[Depends(verify_admin_token)])
+
+router.include_router(usage.router, prefix="/usage", tags=["Admin: Usage"])
@@ -1,6 +1,8 @@
 from fastapi import APIRouter
-from src.d_presentation.web.routers import webhook_router
+from src.d_presentation.web.routers import admin_router, status_router, webhook_router
 
 router = APIRouter(prefix="/v1")
 
 router.include_router(webhook_router.router, prefix="/webhook")
+router.include_router(status_router.router, prefix="/status")
+router.include_router(admin_router.router, prefix="/admin")
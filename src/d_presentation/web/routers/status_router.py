@@ -0,0 +1,7 @@
+from fastapi import APIRouter
+
+from src.d_presentation.web.endpoints import status
+
+router = APIRouter()
+
+router.include_router(status.router, tags=["Status"])
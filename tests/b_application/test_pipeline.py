@@ -0,0 +1,96 @@
+import pytest
+
+from src.a_domain.model.ai_provider import AIModel
+from src.a_domain.model.conversation import Conversation
+from src.a_domain.model.message import Message, MessageRole
+from src.a_domain.types.enums import AiProvider
+from src.b_application.pipeline import Pipeline
+from src.b_application.use_cases.process.ai_processor import AiProcessor, StreamInterruptedError
+
+_MODEL = AIModel(provider=AiProvider.OPENAI, name="test-model")
+_PROMPT = Conversation(user_id="user-1")
+
+
+def _reply(content: str) -> Message:
+    return Message(role=MessageRole.ASSISTANT, content=content)
+
+
+class _Processor:
+    def __init__(self, chunks: list[str], fail: bool):
+        self._chunks = chunks
+        self._fail = fail
+
+    async def execute_stream(self, conversation, model):
+        for chunk in self._chunks:
+            yield _reply(chunk)
+        if self._fail:
+            raise StreamInterruptedError("connection reset")
+
+
+class _Dispatcher:
+    max_messages_per_request = 5
+
+    def __init__(self):
+        self.sent: list[str] = []
+
+    async def execute(self, user_id, messages, reply_token):
+        self.sent.extend(m.content for m in messages)
+
+
+class _Registry:
+    def __init__(self, error: Exception):
+        self._error = error
+
+    def adapter_for(self, model):
+        return self
+
+    async def stream_reply(self, messages):
+        yield "partial"
+        raise self._error
+
+
+class _Styler:
+    async def format_stream(self, deltas):
+        async for delta in deltas:
+            yield _reply(delta)
+
+
+def _pipeline(processor, dispatcher, settings, logger) -> Pipeline:
+    return Pipeline(None, None, None, processor, None, dispatcher, None, settings, logger)
+
+
+async def test_a_stream_cut_off_delivers_what_arrived_and_marks_the_saved_reply(settings, logger):
+    dispatcher = _Dispatcher()
+    pipeline = _pipeline(_Processor(["first", "second", "third"], fail=True), dispatcher, settings, logger)
+
+    replies = await pipeline._stream_replies("user-1", _PROMPT, _MODEL, None)
+
+    assert dispatcher.sent == ["first", "second", "third"]
+    assert [m.content for m in replies] == ["first", "second", "third" + Pipeline._TRUNCATED_MARKER]
+
+
+async def test_a_stream_failing_before_any_text_saves_no_reply(settings, logger):
+    dispatcher = _Dispatcher()
+    pipeline = _pipeline(_Processor([], fail=True), dispatcher, settings, logger)
+
+    assert await pipeline._stream_replies("user-1", _PROMPT, _MODEL, None) == ()
+    assert dispatcher.sent == []
+
+
+async def test_a_completed_stream_is_saved_unmarked(settings, logger):
+    dispatcher = _Dispatcher()
+    pipeline = _pipeline(_Processor(["first", "second"], fail=False), dispatcher, settings, logger)
+
+    replies = await pipeline._stream_replies("user-1", _PROMPT, _MODEL, None)
+
+    assert [m.content for m in replies] == dispatcher.sent == ["first", "second"]
+
+
+async def test_the_processor_reports_a_failed_stream(logger):
+    processor = AiProcessor(_Registry(ConnectionError("reset")), _Styler(), logger)
+
+    received: list[str] = []
+    with pytest.raises(StreamInterruptedError):
+        async for message in processor.execute_stream(_PROMPT, _MODEL):
+            received.append(message.content)
+    assert received == ["partial"]
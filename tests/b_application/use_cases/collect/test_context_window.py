@@ -0,0 +1,35 @@
+from src.a_domain.model.ai_provider import AIModel
+from src.a_domain.model.conversation import Conversation
+from src.a_domain.model.message import Message, MessageRole
+from src.a_domain.types.enums import AiProvider
+from src.b_application.use_cases.collect.context_window import ContextWindowBuilder
+
+_VERBOSE = AIModel(provider=AiProvider.OPENAI, name="verbose")
+_COMPACT = AIModel(provider=AiProvider.GROQ, name="compact")
+
+
+class _PerModelCounter:
+    """Counts 10 tokens per message for the verbose model and 1 for the compact one."""
+
+    def count_message(self, message: Message, model: AIModel) -> int:
+        return 10 if model == _VERBOSE else 1
+
+
+def _conversation(turns: int) -> Conversation:
+    messages = [Message(role=MessageRole.SYSTEM, content="persona")]
+    for index in range(turns):
+        role = MessageRole.USER if index % 2 == 0 else MessageRole.ASSISTANT
+        messages.append(Message(role=role, content=f"m{index}"))
+    return Conversation(user_id="user-1").add_messages(messages)
+
+
+def test_the_window_is_sized_with_the_given_models_token_counts(settings, logger):
+    builder = ContextWindowBuilder(_PerModelCounter(), settings.model_copy(update={"context_max_tokens": 41}), logger)
+    conversation = _conversation(21)
+
+    verbose = builder.execute(conversation, _VERBOSE)
+    compact = builder.execute(conversation, _COMPACT)
+
+    # persona + 3 turns fit 41 tokens at 10 per message; the compact model fits every turn.
+    assert [m.content for m in verbose.messages] == ["persona", "m18", "m19", "m20"]
+    assert len(compact.messages) == 22
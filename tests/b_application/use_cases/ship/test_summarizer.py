@@ -0,0 +1,123 @@
+import asyncio
+
+import pytest
+
+from src.a_domain.model.conversation import Conversation
+from src.a_domain.model.message import Message, MessageRole
+from src.b_application.use_cases.ship.summarizer import ConversationSummarizer
+from src.c_infrastructure.services.job_queue_service import JobQueueService
+
+
+class _MemoryRepository:
+    def __init__(self):
+        self.conversations: dict[str, Conversation] = {}
+
+    async def get_conversation_by_user_id(self, user_id: str) -> Conversation | None:
+        return self.conversations.get(user_id)
+
+    async def save(self, conversation: Conversation) -> bool:
+        self.conversations[conversation.user_id] = conversation
+        return True
+
+
+class _GatedAi:
+    def __init__(self):
+        self.started = asyncio.Event()
+        self.release = asyncio.Event()
+
+    async def stream_reply(self, messages):
+        self.started.set()
+        await self.release.wait()
+        yield "the summary"
+
+
+@pytest.fixture
+async def queue(logger):
+    service = JobQueueService(logger=logger, worker_count=4, max_size=100, shutdown_timeout=5)
+    await service.start()
+    yield service
+    await service.stop()
+
+
+@pytest.fixture
+async def summary_queue(logger):
+    service = JobQueueService(logger=logger, worker_count=1, max_size=10, shutdown_timeout=5, name="summary")
+    await service.start()
+    yield service
+    await service.stop()
+
+
+async def _idle(*queues: JobQueueService) -> None:
+    # stop() would refuse the write the summary job submits on completion; wait for both instead.
+    while any(queue.stats().depth or queue.stats().busy_workers for queue in queues):
+        await asyncio.sleep(0.01)
+
+
+def _history(count: int) -> Conversation:
+    messages = [
+        Message(role=MessageRole.USER if index % 2 == 0 else MessageRole.ASSISTANT, content=f"m{index}")
+        for index in range(count)
+    ]
+    return Conversation(user_id="user-1").add_messages(messages)
+
+
+async def test_the_summary_is_written_between_turns_and_keeps_a_turn_saved_meanwhile(
+    queue, summary_queue, settings, logger
+):
+    settings = settings.model_copy(update={"summary_trigger_messages": 4, "summary_keep_recent_messages": 2})
+    repository, ai = _MemoryRepository(), _GatedAi()
+    summarizer = ConversationSummarizer(repository, ai, queue, summary_queue, settings, logger)
+    await repository.save(_history(6))
+
+    summarizer.schedule(repository.conversations["user-1"])
+    await ai.started.wait()
+
+    turn_loaded = asyncio.Event()
+
+    async def turn():
+        # A turn is a load-modify-save on the user's key; the summary lands in the middle of it.
+        conversation = await repository.get_conversation_by_user_id("user-1")
+        turn_loaded.set()
+        await asyncio.sleep(0.05)
+        await repository.save(conversation.add_messages([Message(role=MessageRole.USER, content="new turn")]))
+
+    assert queue.submit(turn, key="user-1")
+    await turn_loaded.wait()
+    ai.release.set()
+    await _idle(summary_queue, queue)
+
+    stored = repository.conversations["user-1"]
+    assert stored.summary == "the summary"
+    assert stored.messages[-1].content == "new turn"
+
+
+async def test_only_one_summary_runs_per_user_until_it_is_written(queue, summary_queue, settings, logger):
+    settings = settings.model_copy(update={"summary_trigger_messages": 4, "summary_keep_recent_messages": 2})
+    repository, ai = _MemoryRepository(), _GatedAi()
+    summarizer = ConversationSummarizer(repository, ai, queue, summary_queue, settings, logger)
+    await repository.save(_history(6))
+
+    summarizer.schedule(repository.conversations["user-1"])
+    summarizer.schedule(repository.conversations["user-1"])
+    await ai.started.wait()
+    assert summary_queue.stats().busy_workers == 1 and summary_queue.stats().depth == 0
+
+    ai.release.set()
+    await _idle(summary_queue, queue)
+    assert repository.conversations["user-1"].summary == "the summary"
+
+
+async def test_the_model_call_leaves_the_webhook_queue_free(queue, summary_queue, settings, logger):
+    settings = settings.model_copy(update={"summary_trigger_messages": 4, "summary_keep_recent_messages": 2})
+    repository, ai = _MemoryRepository(), _GatedAi()
+    summarizer = ConversationSummarizer(repository, ai, queue, summary_queue, settings, logger)
+    await repository.save(_history(6))
+
+    summarizer.schedule(repository.conversations["user-1"])
+    await ai.started.wait()
+    assert (queue.stats().busy_workers, queue.stats().depth) == (0, 0)
+    assert queue.free_slots() == 100
+
+    ai.release.set()
+    await _idle(summary_queue, queue)
+    assert repository.conversations["user-1"].summary == "the summary"
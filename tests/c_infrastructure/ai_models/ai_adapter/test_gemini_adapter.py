@@ -0,0 +1,47 @@
+import pytest
+
+from src.a_domain.model.message import Message, MessageRole
+from src.c_infrastructure.ai_models.ai_adapter.gemini_adapter import GeminiAIAdapter
+
+
+@pytest.fixture
+def adapter(settings, logger):
+    return GeminiAIAdapter(settings.model_copy(update={"gemini_api_key": "test-key"}), logger, "gemini-test")
+
+
+def _message(role: MessageRole, content: str) -> Message:
+    return Message(role=role, content=content)
+
+
+def test_only_leading_system_messages_become_the_system_instruction(adapter):
+    messages = (
+        _message(MessageRole.SYSTEM, "persona"),
+        _message(MessageRole.USER, "hi"),
+        _message(MessageRole.ASSISTANT, "hello"),
+        _message(MessageRole.SYSTEM, "search results"),
+        _message(MessageRole.USER, "and?"),
+    )
+
+    system_instruction, contents = adapter._convert_to_contents(messages)
+
+    assert system_instruction == "persona"
+    assert contents == [
+        {"role": "user", "parts": ["hi"]},
+        {"role": "model", "parts": ["hello"]},
+        {"role": "user", "parts": ["search results", "and?"]},
+    ]
+
+
+def test_a_request_with_only_system_messages_is_rejected(adapter):
+    with pytest.raises(ValueError, match="at least one user or model turn"):
+        adapter._convert_to_contents((_message(MessageRole.SYSTEM, "persona"),))
+
+
+def test_models_are_cached_per_instruction_and_the_least_recently_used_is_evicted(adapter):
+    persona = adapter._model_for("persona")
+    for index in range(GeminiAIAdapter._MAX_CACHED_MODELS - 1):
+        adapter._model_for(f"other {index}")
+        assert adapter._model_for("persona") is persona
+
+    adapter._model_for("one more")
+    assert adapter._model_for("persona") is persona
@@ -0,0 +1,92 @@
+import pytest
+
+from src.a_domain.model.ai_provider import AIModel
+from src.a_domain.model.message import Message, MessageRole
+from src.a_domain.model.usage_record import TokenUsage
+from src.a_domain.types.enums import AiProvider
+from src.c_infrastructure.ai_models.base import BaseAIAdapter
+from src.c_infrastructure.services.token_counter_service import TokenCounterService
+from src.c_infrastructure.services.usage_accounting_service import UsageAccountingService
+
+_PROMPT = (Message(role=MessageRole.USER, content="x" * 40),)
+_MODEL = AIModel(provider=AiProvider.GEMINI, name="test-model")
+
+
+class _ScriptedAdapter(BaseAIAdapter):
+    provider = AiProvider.GEMINI
+
+    def __init__(self, script, **kwargs):
+        super().__init__(**kwargs)
+        self._script = script
+
+    async def _stream_api(self, messages):
+        for item in self._script:
+            if isinstance(item, Exception):
+                raise item
+            yield item
+
+
+@pytest.fixture
+def usage(logger):
+    return UsageAccountingService(logger=logger, retention_seconds=3600, max_records=100)
+
+
+@pytest.fixture
+def counter(logger):
+    return TokenCounterService(logger)
+
+
+def _adapter(script, settings, logger, usage, counter=None) -> _ScriptedAdapter:
+    return _ScriptedAdapter(
+        script, config=settings, logger=logger, model_name=_MODEL.name, usage_recorder=usage, token_counter=counter
+    )
+
+
+async def test_a_completed_stream_records_the_reported_usage(settings, logger, usage):
+    adapter = _adapter(["hello ", "world", TokenUsage(12, 3)], settings, logger, usage)
+
+    assert [delta async for delta in adapter.stream_reply(_PROMPT)] == ["hello ", "world"]
+
+    (record,) = usage.recent(10)
+    assert (record.prompt_tokens, record.completion_tokens, record.estimated, record.aborted) == (12, 3, False, False)
+    assert adapter.latency_stats().samples == 1
+
+
+async def test_a_stream_closed_early_records_estimated_usage_as_aborted(settings, logger, usage, counter):
+    adapter = _adapter(["a" * 20, "b" * 20, TokenUsage(12, 3)], settings, logger, usage, counter)
+
+    stream = adapter.stream_reply(_PROMPT)
+    await anext(stream)
+    await stream.aclose()
+
+    (record,) = usage.recent(10)
+    completion = counter.count_messages((Message(role=MessageRole.ASSISTANT, content="a" * 20),), _MODEL)
+    assert (record.prompt_tokens, record.completion_tokens) == (counter.count_messages(_PROMPT, _MODEL), completion)
+    assert record.estimated and record.aborted
+    assert adapter.latency_stats().samples == 0
+    (summary,) = usage.by_model(3600)
+    assert (summary.aborted_calls, summary.estimated_tokens) == (1, record.prompt_tokens + record.completion_tokens)
+
+
+async def test_estimated_usage_counts_cjk_text_by_character(settings, logger, usage, counter):
+    reply = "好的，我明天再跟你說"
+    prompt = (Message(role=MessageRole.USER, content="請幫我整理一下今天的行程安排"),)
+    adapter = _adapter([reply], settings, logger, usage, counter)
+
+    assert [delta async for delta in adapter.stream_reply(prompt)] == [reply]
+
+    (record,) = usage.recent(10)
+    assert record.estimated and not record.aborted
+    assert record.prompt_tokens >= len(prompt[0].content)
+    assert record.completion_tokens >= len(reply)
+
+
+async def test_a_stream_failing_partway_is_recorded_as_aborted(settings, logger, usage):
+    adapter = _adapter(["partial", RuntimeError("connection reset")], settings, logger, usage)
+
+    with pytest.raises(RuntimeError):
+        async for _ in adapter.stream_reply(_PROMPT):
+            pass
+
+    (record,) = usage.recent(10)
+    assert record.aborted and record.estimated
@@ -0,0 +1,98 @@
+import httpx
+import openai
+import pytest
+from google.api_core.exceptions import InvalidArgument, ServiceUnavailable
+
+from src.a_domain.model.ai_provider import AIModel
+from src.a_domain.model.message import Message, MessageRole
+from src.a_domain.types.enums import AiProvider, CircuitState
+from src.c_infrastructure.ai_models.circuit_breaker import (
+    CircuitBreakerAIAdapter,
+    CircuitOpenError,
+    is_provider_failure,
+)
+
+_MODEL = AIModel(provider=AiProvider.OPENAI, name="test-model")
+_PROMPT = (Message(role=MessageRole.USER, content="hi"),)
+_REQUEST = httpx.Request("POST", "https://api.example.com/v1/chat")
+
+
+def _status_error(status: int) -> openai.APIStatusError:
+    return openai.APIStatusError("error", response=httpx.Response(status, request=_REQUEST), body=None)
+
+
+class _Provider:
+    def __init__(self):
+        self.error: Exception | None = None
+
+    async def stream_reply(self, messages):
+        if self.error is not None:
+            raise self.error
+        yield "ok"
+
+
+@pytest.fixture
+def provider():
+    return _Provider()
+
+
+@pytest.fixture
+async def breaker(provider, settings, logger):
+    config = settings.model_copy(
+        update={
+            "ai_breaker_window": 4,
+            "ai_breaker_min_calls": 4,
+            "ai_breaker_failure_rate": 0.5,
+            "ai_breaker_open_seconds": 60,
+        }
+    )
+    adapter = CircuitBreakerAIAdapter(provider, _MODEL, config, logger)
+    yield adapter
+    await adapter.aclose()
+
+
+async def _call(breaker: CircuitBreakerAIAdapter) -> None:
+    with pytest.raises(openai.APIStatusError):
+        async for _ in breaker.stream_reply(_PROMPT):
+            pass
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        httpx.ConnectError("refused"),
+        openai.APITimeoutError(request=_REQUEST),
+        TimeoutError(),
+        _status_error(429),
+        _status_error(503),
+        ServiceUnavailable("down"),
+    ],
+)
+def test_transport_errors_timeouts_rate_limits_and_server_errors_count(error):
+    assert is_provider_failure(error)
+
+
+@pytest.mark.parametrize(
+    "error", [_status_error(400), _status_error(401), InvalidArgument("bad prompt"), ValueError("bug"), KeyError("x")]
+)
+def test_client_errors_and_bugs_do_not_count(error):
+    assert not is_provider_failure(error)
+
+
+async def test_server_errors_open_the_circuit(breaker, provider):
+    provider.error = _status_error(500)
+    for _ in range(4):
+        await _call(breaker)
+
+    assert breaker.state == CircuitState.OPEN
+    with pytest.raises(CircuitOpenError):
+        await anext(breaker.stream_reply(_PROMPT))
+
+
+async def test_rejected_requests_keep_the_circuit_closed(breaker, provider):
+    provider.error = _status_error(400)
+    for _ in range(8):
+        await _call(breaker)
+
+    assert breaker.state == CircuitState.CLOSED
+    assert breaker.stats().failure_rate == 0.0
@@ -0,0 +1,100 @@
+import asyncio
+
+import pytest
+
+from src.a_domain.model.ai_provider import AIModel
+from src.a_domain.model.message import Message, MessageRole
+from src.a_domain.types.enums import AiProvider
+from src.c_infrastructure.ai_models.base import ERROR_REPLY
+from src.c_infrastructure.ai_models.failover import FailoverAIAdapter
+
+_PRIMARY = AIModel(provider=AiProvider.OPENAI, name="primary")
+_FALLBACK = AIModel(provider=AiProvider.GROQ, name="fallback")
+_PROMPT = (Message(role=MessageRole.USER, content="hi"),)
+
+
+class _Provider:
+    def __init__(self, reply: list[str], delay: float = 0.0, error: Exception | None = None, fail_after: int = -1):
+        self.reply = reply
+        self.delay = delay
+        self.error = error
+        self.fail_after = fail_after
+        self.closed = False
+
+    async def stream_reply(self, messages):
+        try:
+            await asyncio.sleep(self.delay)
+            if self.error is not None and self.fail_after < 0:
+                raise self.error
+            for index, delta in enumerate(self.reply):
+                if index == self.fail_after:
+                    raise self.error
+                yield delta
+        finally:
+            self.closed = True
+
+
+def _chain(logger, primary: _Provider, fallback: _Provider, **kwargs) -> FailoverAIAdapter:
+    kwargs.setdefault("first_token_timeout", 1.0)
+    return FailoverAIAdapter([(_PRIMARY, primary), (_FALLBACK, fallback)], logger, **kwargs)
+
+
+def _stats(chain: FailoverAIAdapter, model: AIModel):
+    return next(s for s in chain.stats() if s.model_name == model.name)
+
+
+async def _reply(chain: FailoverAIAdapter) -> str:
+    return "".join([delta async for delta in chain.stream_reply(_PROMPT)])
+
+
+async def test_a_failing_provider_fails_over_to_the_next(logger):
+    chain = _chain(logger, _Provider([], error=ConnectionError("down")), _Provider(["from ", "fallback"]))
+
+    assert await _reply(chain) == "from fallback"
+    assert _stats(chain, _PRIMARY).failures == 1
+    assert _stats(chain, _FALLBACK).wins == 1
+
+
+async def test_a_provider_without_a_first_token_in_time_fails_over(logger):
+    primary = _Provider(["late"], delay=1.0)
+    chain = _chain(logger, primary, _Provider(["fallback"]), first_token_timeout=0.05)
+
+    assert await _reply(chain) == "fallback"
+    assert _stats(chain, _PRIMARY).timeouts == 1
+    assert primary.closed
+
+
+async def test_a_slow_provider_is_hedged_and_the_loser_is_closed(logger):
+    primary = _Provider(["primary"], delay=0.5)
+    chain = _chain(logger, primary, _Provider(["hedge"]), hedge_after_seconds=0.05)
+
+    assert await _reply(chain) == "hedge"
+    assert _stats(chain, _FALLBACK).hedged_starts == 1
+    assert primary.closed
+
+
+async def test_a_fast_provider_is_not_hedged(logger):
+    fallback = _Provider(["hedge"])
+    chain = _chain(logger, _Provider(["primary"]), fallback, hedge_after_seconds=0.5)
+
+    assert await _reply(chain) == "primary"
+    assert _stats(chain, _FALLBACK).attempts == 0
+
+
+async def test_the_fallback_reply_is_sent_when_every_provider_fails(logger):
+    chain = _chain(logger, _Provider([], error=ConnectionError("down")), _Provider([], error=TimeoutError()))
+
+    assert await _reply(chain) == ERROR_REPLY
+
+
+async def test_once_text_has_streamed_the_provider_is_committed(logger):
+    fallback = _Provider(["fallback"])
+    chain = _chain(logger, _Provider(["partial", "rest"], error=ConnectionError("reset"), fail_after=1), fallback)
+
+    received: list[str] = []
+    with pytest.raises(ConnectionError):
+        async for delta in chain.stream_reply(_PROMPT):
+            received.append(delta)
+
+    assert received == ["partial"]
+    assert _stats(chain, _FALLBACK).attempts == 0
@@ -0,0 +1,113 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from src.a_domain.model.ai_provider import AIModel
+from src.a_domain.model.message import Message, MessageRole
+from src.a_domain.types.enums import AiProvider, RequestPriority
+from src.c_infrastructure.ai_models.rate_limiter import ProviderRateLimiter, RateLimitedAIAdapter
+from src.c_infrastructure.services.token_counter_service import TokenCounterService
+
+_HOST = "api.openai.com"
+_OPENAI = AiProvider.OPENAI
+
+
+@pytest.fixture
+def limiter(settings, logger):
+    config = settings.model_copy(
+        update={"ai_provider_max_concurrency": {_OPENAI: 1}, "ai_provider_tokens_per_minute": {}}
+    )
+    return ProviderRateLimiter(config, logger, hosts={_HOST: _OPENAI})
+
+
+def _stats(limiter: ProviderRateLimiter):
+    return next(s for s in limiter.stats() if s.provider == _OPENAI)
+
+
+async def test_calls_beyond_the_concurrency_cap_wait_for_a_release(limiter):
+    await limiter.acquire(_OPENAI, "user-1", RequestPriority.INTERACTIVE, 10)
+    waiting = asyncio.create_task(limiter.acquire(_OPENAI, "user-2", RequestPriority.INTERACTIVE, 10))
+    await asyncio.sleep(0.01)
+    assert not waiting.done() and _stats(limiter).queued == 1
+
+    limiter.release(_OPENAI, "user-1")
+    await asyncio.wait_for(waiting, timeout=1)
+    assert _stats(limiter).in_flight == 1
+
+
+async def test_interactive_calls_and_less_served_users_are_admitted_first(limiter):
+    await limiter.acquire(_OPENAI, "busy", RequestPriority.INTERACTIVE, 10)
+    admitted: list[str] = []
+
+    async def call(user_id: str, priority: RequestPriority) -> None:
+        await limiter.acquire(_OPENAI, user_id, priority, 10)
+        admitted.append(user_id)
+        limiter.release(_OPENAI, user_id)
+
+    tasks = [
+        asyncio.create_task(call("summary", RequestPriority.BACKGROUND)),
+        asyncio.create_task(call("busy", RequestPriority.INTERACTIVE)),
+        asyncio.create_task(call("quiet", RequestPriority.INTERACTIVE)),
+    ]
+    await asyncio.sleep(0.01)
+    limiter.release(_OPENAI, "busy")
+    await asyncio.gather(*tasks)
+
+    # "busy" was served a moment ago, so "quiet" goes first; background work waits for both.
+    assert admitted == ["quiet", "busy", "summary"]
+
+
+async def test_a_cancelled_waiter_leaves_the_queue(limiter):
+    await limiter.acquire(_OPENAI, "user-1", RequestPriority.INTERACTIVE, 10)
+    waiting = asyncio.create_task(limiter.acquire(_OPENAI, "user-2", RequestPriority.INTERACTIVE, 10))
+    await asyncio.sleep(0.01)
+
+    waiting.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiting
+    assert _stats(limiter).queued == 0
+
+
+async def test_a_429_pauses_admissions_for_retry_after(limiter):
+    request = httpx.Request("POST", f"https://{_HOST}/v1/chat/completions")
+    await limiter.observe_response(httpx.Response(429, headers={"retry-after": "0.2"}, request=request))
+
+    started = time.monotonic()
+    await limiter.acquire(_OPENAI, "user-1", RequestPriority.INTERACTIVE, 10)
+
+    assert time.monotonic() - started >= 0.15
+    assert _stats(limiter).throttled_by_server == 1
+
+
+async def test_the_tokens_per_minute_header_tightens_the_budget(limiter):
+    request = httpx.Request("POST", f"https://{_HOST}/v1/chat/completions")
+    await limiter.observe_response(httpx.Response(200, headers={"x-ratelimit-limit-tokens": "5000"}, request=request))
+
+    assert _stats(limiter).tokens_per_minute == 5000
+
+
+@pytest.mark.parametrize(("value", "seconds"), [("2", 2.0), ("1m2.5s", 62.5), ("250ms", 0.25), ("soon", None)])
+def test_reset_durations_are_parsed(limiter, value, seconds):
+    assert limiter._seconds(value) == seconds
+
+
+class _EchoAi:
+    async def stream_reply(self, messages):
+        yield "ok"
+
+
+async def test_calls_are_charged_with_the_models_token_count(settings, logger):
+    gemini = AIModel(provider=AiProvider.GEMINI, name="gemini-test")
+    limiter = ProviderRateLimiter(settings, logger, hosts={})
+    counter = TokenCounterService(logger)
+    adapter = RateLimitedAIAdapter(_EchoAi(), gemini, limiter, counter, completion_tokens=100)
+    # CJK text costs about a token per character, four times the chars/4 guess.
+    messages = (Message(role=MessageRole.USER, content="今天天氣很好，我們去公園散步吧" * 10),)
+
+    assert [delta async for delta in adapter.stream_reply(messages)] == ["ok"]
+
+    stats = next(s for s in limiter.stats() if s.provider == AiProvider.GEMINI)
+    assert stats.tokens_last_minute == counter.count_messages(messages, gemini) + 100
+    assert stats.tokens_last_minute > len(messages[0].content) + 100
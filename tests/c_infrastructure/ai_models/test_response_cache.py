@@ -0,0 +1,55 @@
+import pytest
+
+from src.a_domain.model.ai_provider import AIModel
+from src.a_domain.model.message import Message, MessageRole
+from src.a_domain.types.enums import AiProvider
+from src.c_infrastructure.ai_models.failover import FailoverAIAdapter
+from src.c_infrastructure.ai_models.response_cache import CachingAIAdapter, ResponseCache
+
+_PRIMARY = AIModel(provider=AiProvider.OPENAI, name="primary")
+_FALLBACK = AIModel(provider=AiProvider.GROQ, name="fallback")
+_PROMPT = (Message(role=MessageRole.USER, content="Tell me a joke"),)
+
+
+class _Provider:
+    def __init__(self, reply: str):
+        self.reply = reply
+        self.failing = False
+        self.calls = 0
+
+    async def stream_reply(self, messages):
+        self.calls += 1
+        if self.failing:
+            raise ConnectionError("provider down")
+        yield self.reply
+
+
+@pytest.fixture
+def providers():
+    return _Provider("from primary"), _Provider("from fallback")
+
+
+@pytest.fixture
+def adapter(providers, settings, logger):
+    primary, fallback = providers
+    chain = FailoverAIAdapter([(_PRIMARY, primary), (_FALLBACK, fallback)], logger, first_token_timeout=1.0)
+    cache = ResponseCache(ttl_seconds=60, max_entries=10)
+    return CachingAIAdapter(chain, cache, settings, logger)
+
+
+async def test_a_repeated_prompt_is_served_from_the_cache(adapter, providers):
+    primary, _ = providers
+
+    assert (await adapter.generate_reply(_PROMPT)).content == "from primary"
+    assert (await adapter.generate_reply(_PROMPT)).content == "from primary"
+    assert primary.calls == 1
+
+
+async def test_a_fallback_reply_is_not_cached_as_the_primary_models_answer(adapter, providers):
+    primary, fallback = providers
+    primary.failing = True
+    assert (await adapter.generate_reply(_PROMPT)).content == "from fallback"
+
+    primary.failing = False
+    assert (await adapter.generate_reply(_PROMPT)).content == "from primary"
+    assert (primary.calls, fallback.calls) == (2, 1)
@@ -0,0 +1,32 @@
+import pytest
+
+from src.c_infrastructure.persistence.event_dedup.inmemory_event_dedup import InMemoryEventDeduplicator
+from src.c_infrastructure.persistence.event_dedup.sqlite_event_dedup import SqliteEventDeduplicator
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def deduplicator(request, logger, tmp_path):
+    if request.param == "memory":
+        return InMemoryEventDeduplicator(logger=logger, ttl_seconds=60, max_entries=100)
+    return SqliteEventDeduplicator(logger=logger, ttl_seconds=60, path=str(tmp_path / "seen.sqlite3"))
+
+
+async def test_only_the_first_delivery_is_new(deduplicator):
+    assert await deduplicator.mark_seen("event-1")
+    assert not await deduplicator.mark_seen("event-1")
+    assert await deduplicator.mark_seen("event-2")
+    assert deduplicator.stats().duplicates == 1
+
+
+async def test_a_forgotten_event_is_new_again(deduplicator):
+    await deduplicator.mark_seen("event-1")
+    await deduplicator.forget("event-1")
+
+    assert await deduplicator.mark_seen("event-1")
+
+
+async def test_expired_events_are_new_again(logger):
+    deduplicator = InMemoryEventDeduplicator(logger=logger, ttl_seconds=0, max_entries=100)
+
+    assert await deduplicator.mark_seen("event-1")
+    assert await deduplicator.mark_seen("event-1")
@@ -0,0 +1,143 @@
+import asyncio
+import threading
+
+import pytest
+from fakeredis import TcpFakeServer
+
+from src.a_domain.model.conversation import Conversation
+from src.a_domain.model.message import Message, MessageRole
+from src.c_infrastructure.persistence.chroma.chroma_repository import ChromaRepositoryAdapter
+from src.c_infrastructure.persistence.redis.redis_repository import RedisRepositoryAdapter
+from src.c_infrastructure.persistence.sqlite.sqlite_repository import SqliteRepositoryAdapter
+
+# The three append-only stores share one contract: a save appends only what is not stored yet, reads
+# return the newest conversation_history_limit messages, and saves from stale copies are merged.
+_HISTORY_LIMIT = 10
+
+
+@pytest.fixture(scope="module")
+def redis_url():
+    server = TcpFakeServer(("127.0.0.1", 0), server_type="redis")
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    host, port = server.server_address
+    yield f"redis://{host}:{port}/0"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture(params=["sqlite", "redis", "chroma"])
+async def repository(request, settings, logger, redis_url, tmp_path):
+    config = settings.model_copy(
+        update={
+            "conversation_history_limit": _HISTORY_LIMIT,
+            "redis_url": redis_url,
+            # One server for the module; a prefix per test keeps their keys apart.
+            "redis_key_prefix": f"test:{tmp_path.name}",
+        }
+    )
+    adapters = {"sqlite": SqliteRepositoryAdapter, "redis": RedisRepositoryAdapter, "chroma": ChromaRepositoryAdapter}
+    adapter = adapters[request.param](config=config, logger=logger)
+    await adapter.warm_up()
+    yield adapter
+    await adapter.aclose()
+
+
+def _messages(*texts: str, role: MessageRole = MessageRole.USER) -> list[Message]:
+    return [Message(role=role, content=text) for text in texts]
+
+
+def _contents(conversation: Conversation | None) -> list[str]:
+    return [message.content for message in conversation.messages] if conversation else []
+
+
+async def test_an_unknown_user_has_no_conversation(repository):
+    assert await repository.get_conversation_by_user_id("nobody") is None
+
+
+async def test_a_saved_conversation_round_trips(repository):
+    conversation = Conversation(user_id="user-1", selected_model_name="model-a").add_messages(
+        _messages("persona", role=MessageRole.SYSTEM) + _messages("hi") + _messages("hello", role=MessageRole.ASSISTANT)
+    )
+    assert await repository.save(conversation)
+
+    loaded = await repository.get_conversation_by_user_id("user-1")
+
+    assert loaded.id == conversation.id
+    assert loaded.selected_model_name == "model-a"
+    assert [(m.id, m.role, m.content) for m in loaded.messages] == [
+        (m.id, m.role, m.content) for m in conversation.messages
+    ]
+
+
+async def test_turns_saved_one_after_another_are_appended(repository):
+    conversation = Conversation(user_id="user-1")
+    for turn in range(3):
+        conversation = (await repository.get_conversation_by_user_id("user-1")) or conversation
+        conversation = conversation.add_messages(
+            _messages(f"q{turn}") + _messages(f"a{turn}", role=MessageRole.ASSISTANT)
+        )
+        assert await repository.save(conversation)
+
+    assert _contents(await repository.get_conversation_by_user_id("user-1")) == ["q0", "a0", "q1", "a1", "q2", "a2"]
+
+
+async def test_reads_return_the_newest_messages_plus_older_system_messages(repository):
+    conversation = Conversation(user_id="user-1").add_messages(
+        _messages("persona", role=MessageRole.SYSTEM) + _messages(*(f"m{i}" for i in range(30)))
+    )
+    await repository.save(conversation)
+
+    loaded = await repository.get_conversation_by_user_id("user-1")
+
+    assert _contents(loaded) == ["persona", *(f"m{i}" for i in range(20, 30))]
+
+
+async def test_the_summary_boundary_stays_loaded_beyond_the_history_limit(repository):
+    conversation = Conversation(user_id="user-1").add_messages(_messages(*(f"m{i}" for i in range(30))))
+    conversation = conversation.with_summary("earlier turns", through=conversation.messages[14].id)
+    await repository.save(conversation)
+
+    loaded = await repository.get_conversation_by_user_id("user-1")
+
+    assert loaded.summary == "earlier turns"
+    assert loaded.summary_through == conversation.messages[14].id
+    assert _contents(loaded)[0] == "m14"
+    assert loaded.unsummarized_messages()[0].content == "m15"
+
+
+async def test_a_cleared_history_replaces_the_stored_messages(repository):
+    conversation = Conversation(user_id="user-1").add_messages(_messages("old1", "old2"))
+    await repository.save(conversation)
+
+    cleared = conversation.clear_history()
+    await repository.save(cleared)
+    assert _contents(await repository.get_conversation_by_user_id("user-1")) == []
+
+    await repository.save(cleared.add_messages(_messages("new1", "new2")))
+    assert _contents(await repository.get_conversation_by_user_id("user-1")) == ["new1", "new2"]
+
+
+async def test_saves_from_stale_copies_are_merged(repository):
+    await repository.save(Conversation(user_id="user-1").add_messages(_messages("first")))
+    stale = await repository.get_conversation_by_user_id("user-1")
+
+    await repository.save(stale.add_messages(_messages("from writer a")))
+    await repository.save(stale.add_messages(_messages("from writer b")))
+
+    assert _contents(await repository.get_conversation_by_user_id("user-1")) == [
+        "first",
+        "from writer a",
+        "from writer b",
+    ]
+
+
+async def test_concurrent_saves_keep_every_message(repository):
+    await repository.save(Conversation(user_id="user-1").add_messages(_messages("first")))
+    base = await repository.get_conversation_by_user_id("user-1")
+
+    results = await asyncio.gather(*(repository.save(base.add_messages(_messages(f"w{i}"))) for i in range(8)))
+
+    assert all(results)
+    loaded = _contents(await repository.get_conversation_by_user_id("user-1"))
+    assert loaded[0] == "first" and sorted(loaded[1:]) == [f"w{i}" for i in range(8)]
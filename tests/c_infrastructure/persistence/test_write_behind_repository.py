@@ -0,0 +1,104 @@
+import pytest
+
+from src.a_domain.model.conversation import Conversation
+from src.a_domain.model.message import Message, MessageRole
+from src.c_infrastructure.persistence.sqlite.sqlite_repository import SqliteRepositoryAdapter
+from src.c_infrastructure.persistence.write_behind_repository import WriteBehindRepositoryAdapter
+
+
+def _turn(conversation: Conversation, *texts: str) -> Conversation:
+    return conversation.add_messages([Message(role=MessageRole.USER, content=text) for text in texts])
+
+
+def _contents(conversation: Conversation | None) -> list[str]:
+    return [message.content for message in conversation.messages] if conversation else []
+
+
+@pytest.fixture
+def store(settings, logger):
+    return SqliteRepositoryAdapter(config=settings, logger=logger)
+
+
+@pytest.fixture
+def cache(store, logger):
+    # A long interval and a high dirty limit: nothing is written before flush() or aclose().
+    return WriteBehindRepositoryAdapter(
+        inner=store, logger=logger, max_entries=100, flush_interval_seconds=3600, max_dirty=100, history_limit=10
+    )
+
+
+async def test_saves_are_served_from_memory_and_written_on_flush(cache, store):
+    conversation = _turn(Conversation(user_id="user-1"), "hello")
+    await cache.save(conversation)
+
+    assert await store.get_conversation_by_user_id("user-1") is None
+    assert await cache.get_conversation_by_user_id("user-1") is conversation
+
+    await cache.flush()
+    assert _contents(await store.get_conversation_by_user_id("user-1")) == ["hello"]
+    await cache.aclose()
+
+
+async def test_a_reset_followed_by_a_turn_within_one_flush_interval_stays_cleared(cache, store, settings, logger):
+    await cache.save(_turn(Conversation(user_id="user-1"), "old1", "old2"))
+    await cache.flush()
+
+    cleared = (await cache.get_conversation_by_user_id("user-1")).clear_history()
+    await cache.save(cleared)
+    await cache.save(_turn(cleared, "new1", "new2"))
+    await cache.aclose()
+
+    reopened = SqliteRepositoryAdapter(config=settings, logger=logger)
+    assert _contents(await reopened.get_conversation_by_user_id("user-1")) == ["new1", "new2"]
+    await reopened.aclose()
+
+
+async def test_dirty_entries_are_never_evicted(store, logger):
+    cache = WriteBehindRepositoryAdapter(
+        inner=store, logger=logger, max_entries=1, flush_interval_seconds=3600, max_dirty=100, history_limit=10
+    )
+    await cache.save(_turn(Conversation(user_id="user-1"), "a"))
+    await cache.save(_turn(Conversation(user_id="user-2"), "b"))
+
+    assert cache.stats().entries == 2
+    await cache.flush()
+    assert cache.stats().entries == 1
+    await cache.aclose()
+
+
+async def test_written_entries_are_trimmed_to_the_history_limit(cache):
+    persona = Message(role=MessageRole.SYSTEM, content="persona")
+    conversation = _turn(Conversation(user_id="user-1", messages=(persona,)), *(f"m{i}" for i in range(30)))
+    await cache.save(conversation)
+    await cache.flush()
+
+    cached = await cache.get_conversation_by_user_id("user-1")
+    assert _contents(cached) == ["persona", *(f"m{i}" for i in range(20, 30))]
+    await cache.aclose()
+
+
+async def test_a_failed_write_stays_dirty_and_is_retried(logger):
+    class _FlakyStore:
+        def __init__(self):
+            self.fail = True
+            self.saved: list[Conversation] = []
+
+        async def save(self, conversation: Conversation) -> bool:
+            if self.fail:
+                return False
+            self.saved.append(conversation)
+            return True
+
+        async def aclose(self) -> None: ...
+
+    inner = _FlakyStore()
+    cache = WriteBehindRepositoryAdapter(
+        inner=inner, logger=logger, max_entries=10, flush_interval_seconds=3600, max_dirty=100, history_limit=10
+    )
+    await cache.save(_turn(Conversation(user_id="user-1"), "hello"))
+    await cache.flush()
+    assert cache.stats().dirty == 1
+
+    inner.fail = False
+    await cache.aclose()
+    assert _contents(inner.saved[-1]) == ["hello"]
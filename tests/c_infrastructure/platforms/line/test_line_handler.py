@@ -0,0 +1,76 @@
+import json
+
+import pytest
+from fastapi import HTTPException
+
+from src.c_infrastructure.persistence.event_dedup.inmemory_event_dedup import InMemoryEventDeduplicator
+from src.c_infrastructure.platforms.line.line_handler import LineWebhookHandler
+
+
+class _Security:
+    def verify_signature(self, body: bytes, signature: str | None) -> bool:
+        return True
+
+
+class _Pipeline:
+    def is_reset_command(self, text: str) -> bool:
+        return False
+
+
+class _Coalescer:
+    def __init__(self):
+        self.accepting = True
+        self.added: list[str] = []
+
+    def add(self, user_id, text, build_job, name, immediate) -> bool:
+        if self.accepting:
+            self.added.append(text)
+        return self.accepting
+
+
+class _Request:
+    def __init__(self, body: bytes):
+        self._body = body
+
+    async def body(self) -> bytes:
+        return self._body
+
+
+def _webhook(event_id: str, text: str) -> _Request:
+    event = {
+        "type": "message",
+        "message": {"type": "text", "id": f"message-{event_id}", "text": text},
+        "source": {"type": "user", "userId": "user-1"},
+        "webhookEventId": event_id,
+    }
+    return _Request(json.dumps({"destination": "bot", "events": [event]}).encode())
+
+
+@pytest.fixture
+def coalescer():
+    return _Coalescer()
+
+
+@pytest.fixture
+def handler(logger, coalescer):
+    deduplicator = InMemoryEventDeduplicator(logger=logger, ttl_seconds=60, max_entries=100)
+    return LineWebhookHandler(_Security(), _Pipeline(), coalescer, deduplicator)
+
+
+async def test_a_redelivered_event_is_dropped(handler, coalescer):
+    await handler.handle(_webhook("event-1", "hello"), signature="sig")
+    await handler.handle(_webhook("event-1", "hello"), signature="sig")
+
+    assert coalescer.added == ["hello"]
+
+
+async def test_an_event_rejected_with_503_is_processed_when_redelivered(handler, coalescer):
+    coalescer.accepting = False
+    with pytest.raises(HTTPException) as rejected:
+        await handler.handle(_webhook("event-1", "hello"), signature="sig")
+    assert rejected.value.status_code == 503
+
+    coalescer.accepting = True
+    await handler.handle(_webhook("event-1", "hello"), signature="sig")
+
+    assert coalescer.added == ["hello"]
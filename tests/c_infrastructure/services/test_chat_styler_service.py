@@ -0,0 +1,51 @@
+import random
+
+import pytest
+
+from src.a_domain.model.message import Message, MessageRole
+from src.c_infrastructure.services.chat_styler_service import ChatStylerService
+
+_CODE = "Here is code:\n\n```python\nx = 1\n\n\ny = 2\n```\n\nAfter the code."
+_LONG = " ".join(f"Sentence number {index} is here." for index in range(60))
+_TEXTS = [
+    "First paragraph.\n\nSecond paragraph.\n\n\nThird.",
+    _CODE,
+    _LONG,
+    f"{_LONG}\n\n{_CODE}\n\n**bold** end",
+    "Trailing ``\n\n`ticks` and ````four````\n\ndone",
+]
+
+
+async def _deltas(text: str, sizes: list[int]):
+    position = 0
+    for size in sizes:
+        yield text[position : position + size]
+        position += size
+    yield text[position:]
+
+
+async def _stream(styler: ChatStylerService, text: str, sizes: list[int]) -> list[str]:
+    return [message.content async for message in styler.format_stream(_deltas(text, sizes))]
+
+
+@pytest.mark.parametrize("text", _TEXTS)
+async def test_streaming_in_any_delta_sizes_matches_one_big_delta(text):
+    styler = ChatStylerService()
+    whole = await _stream(styler, text, [len(text)])
+
+    rng = random.Random(text)
+    for _ in range(20):
+        sizes = [rng.randint(1, 7) for _ in range(len(text))]
+        assert await _stream(styler, text, sizes) == whole
+
+
+async def test_streamed_paragraphs_are_separate_messages_and_code_blocks_are_dropped():
+    contents = await _stream(ChatStylerService(), _CODE, [1] * len(_CODE))
+
+    assert contents == ["Here is code:", "After the code."]
+
+
+def test_an_empty_reply_falls_back_to_a_prompt_to_ask_again():
+    replies = ChatStylerService().format_response(Message(role=MessageRole.ASSISTANT, content="```\ncode only\n```"))
+
+    assert len(replies) == 1 and replies[0].content
@@ -0,0 +1,79 @@
+import asyncio
+
+import httpx
+import pytest
+
+from src.c_infrastructure.services.http_client_pool_service import HttpClientPoolService
+
+_URL = "https://api.example.com/v1/items"
+
+
+def _pool(settings, logger) -> HttpClientPoolService:
+    return HttpClientPoolService(config=settings.model_copy(update={"http2_enabled": False}), logger=logger)
+
+
+async def test_a_closed_pool_hands_out_a_fresh_client_for_the_same_host(settings, logger):
+    pool = _pool(settings, logger)
+    first = pool.client_for(_URL)
+    assert pool.client_for("https://api.example.com/other") is first
+
+    await pool.aclose()
+    second = pool.client_for(_URL)
+
+    assert first.is_closed and not second.is_closed
+    await pool.aclose()
+
+
+async def test_stats_count_requests_until_their_response_is_closed(settings, logger):
+    pool = _pool(settings, logger)
+    pool._create_transport = lambda limits: httpx.MockTransport(lambda request: httpx.Response(200, content=b"ok"))
+    client = pool.client_for(_URL)
+
+    async with client.stream("GET", _URL) as response:
+        (stats,) = pool.stats()
+        assert (stats.in_flight, stats.waiting) == (1, 0)
+        await response.aread()
+
+    (stats,) = pool.stats()
+    assert (stats.host, stats.in_flight, stats.max_in_flight) == ("api.example.com", 0, 1)
+    await pool.aclose()
+
+
+async def test_requests_beyond_the_host_limit_are_reported_as_waiting(settings, logger):
+    config = settings.model_copy(update={"http2_enabled": False, "http_host_max_connections": {"api.example.com": 2}})
+    pool = HttpClientPoolService(config=config, logger=logger)
+    release = asyncio.Event()
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await release.wait()
+        return httpx.Response(200)
+
+    pool._create_transport = lambda limits: httpx.MockTransport(handler)
+    client = pool.client_for(_URL)
+    requests = [asyncio.create_task(client.get(_URL)) for _ in range(5)]
+    await asyncio.sleep(0)
+
+    (stats,) = pool.stats()
+    assert (stats.in_flight, stats.waiting) == (5, 3)
+
+    release.set()
+    await asyncio.gather(*requests)
+    (stats,) = pool.stats()
+    assert (stats.in_flight, stats.waiting, stats.max_in_flight) == (0, 0, 5)
+    await pool.aclose()
+
+
+async def test_failed_requests_are_not_left_in_flight(settings, logger):
+    pool = _pool(settings, logger)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("refused", request=request)
+
+    pool._create_transport = lambda limits: httpx.MockTransport(handler)
+    client = pool.client_for(_URL)
+    with pytest.raises(httpx.ConnectError):
+        await client.get(_URL)
+
+    (stats,) = pool.stats()
+    assert stats.in_flight == 0
+    await pool.aclose()
@@ -0,0 +1,97 @@
+import asyncio
+
+import pytest
+
+from src.c_infrastructure.services.job_queue_service import JobQueueService
+
+
+@pytest.fixture
+async def queue(logger):
+    service = JobQueueService(logger=logger, worker_count=4, max_size=100, shutdown_timeout=5)
+    await service.start()
+    yield service
+    await service.stop()
+
+
+async def test_jobs_with_the_same_key_run_one_at_a_time_in_submission_order(queue):
+    events: list[str] = []
+
+    def job(label: str, delay: float):
+        async def run():
+            events.append(f"start {label}")
+            await asyncio.sleep(delay)
+            events.append(f"end {label}")
+
+        return run
+
+    # The first job is the slowest; a concurrent runner would finish the later ones first.
+    for index, delay in enumerate((0.05, 0.01, 0.0)):
+        assert queue.submit(job(str(index), delay), key="user-1")
+    await queue.stop()
+
+    assert events == ["start 0", "end 0", "start 1", "end 1", "start 2", "end 2"]
+
+
+async def test_jobs_with_different_keys_run_concurrently(queue):
+    running = 0
+    peak = 0
+
+    async def job():
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.02)
+        running -= 1
+
+    for index in range(4):
+        queue.submit(job, key=f"user-{index}")
+    await queue.stop()
+
+    assert peak == 4
+
+
+async def test_a_failing_job_does_not_block_the_next_job_for_its_key(queue):
+    done = asyncio.Event()
+
+    async def failing():
+        raise RuntimeError("boom")
+
+    async def succeeding():
+        done.set()
+
+    queue.submit(failing, key="user-1")
+    queue.submit(succeeding, key="user-1")
+    await asyncio.wait_for(done.wait(), timeout=1)
+
+    stats = queue.stats()
+    assert stats.failed == 1
+
+
+async def test_submit_is_rejected_when_the_queue_is_full(logger):
+    service = JobQueueService(logger=logger, worker_count=1, max_size=2, shutdown_timeout=1)
+    await service.start()
+    gate = asyncio.Event()
+
+    async def blocked():
+        await gate.wait()
+
+    assert service.submit(blocked, key="a")
+    await asyncio.sleep(0)  # the worker takes the first job off the queue
+    assert service.submit(blocked, key="a")
+    assert service.submit(blocked, key="b")
+    assert not service.submit(blocked, key="c")
+    assert service.stats().rejected == 1
+
+    gate.set()
+    await service.stop()
+
+
+async def test_submit_is_rejected_before_start_and_after_stop(logger):
+    service = JobQueueService(logger=logger, worker_count=1, max_size=10, shutdown_timeout=1)
+
+    async def job(): ...
+
+    assert not service.submit(job)
+    await service.start()
+    await service.stop()
+    assert not service.submit(job)
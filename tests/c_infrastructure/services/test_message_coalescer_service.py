@@ -0,0 +1,76 @@
+import asyncio
+
+import pytest
+
+from src.c_infrastructure.services.message_coalescer_service import MessageCoalescerService
+
+
+class _Queue:
+    """Job queue stand-in whose capacity the test controls."""
+
+    def __init__(self, capacity: int = 10):
+        self.capacity = capacity
+        self.accepting = True
+        self.submitted: list[tuple[str, str]] = []
+
+    def free_slots(self) -> int:
+        return self.capacity - len(self.submitted) if self.accepting else 0
+
+    def submit(self, job, name: str = "job", key: str | None = None) -> bool:
+        if self.free_slots() <= 0:
+            return False
+        self.submitted.append((key, job))
+        return True
+
+
+def _build_job(text: str) -> str:
+    # The coalescer only passes the built job through to the queue.
+    return text
+
+
+@pytest.fixture
+def queue():
+    return _Queue()
+
+
+@pytest.fixture
+def coalescer(queue, logger):
+    return MessageCoalescerService(job_queue=queue, logger=logger, window_seconds=0.02, max_wait_seconds=1)
+
+
+async def test_rapid_texts_from_one_user_become_one_turn(coalescer, queue):
+    for text in ("a", "b", "c"):
+        assert coalescer.add("user-1", text, _build_job)
+    await asyncio.sleep(0.05)
+
+    assert queue.submitted == [("user-1", "a\nb\nc")]
+    assert coalescer.stats().merged_messages == 2
+
+
+async def test_an_immediate_text_flushes_the_open_burst_first(coalescer, queue):
+    coalescer.add("user-1", "hello", _build_job)
+    coalescer.add("user-1", "/reset", _build_job, immediate=True)
+
+    assert queue.submitted == [("user-1", "hello"), ("user-1", "/reset")]
+
+
+async def test_a_new_burst_is_refused_when_the_queue_has_no_slot_for_it(coalescer, queue):
+    queue.capacity = 1
+    assert coalescer.add("user-1", "a", _build_job)
+    assert not coalescer.add("user-2", "b", _build_job)
+    # The open burst can still grow: it already holds its slot.
+    assert coalescer.add("user-1", "c", _build_job)
+
+
+async def test_a_rejected_flush_keeps_the_burst_and_retries(coalescer, queue, monkeypatch):
+    monkeypatch.setattr(MessageCoalescerService, "_RETRY_BASE_SECONDS", 0.01)
+    coalescer.add("user-1", "hello", _build_job)
+    queue.capacity = 0
+    await asyncio.sleep(0.05)
+    assert queue.submitted == []
+    assert coalescer.stats().retried_flushes >= 1
+
+    queue.capacity = 10
+    await asyncio.sleep(0.1)
+    assert queue.submitted == [("user-1", "hello")]
+    assert coalescer.stats().pending_keys == 0
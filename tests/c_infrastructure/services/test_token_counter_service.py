@@ -0,0 +1,35 @@
+import tiktoken
+
+from src.a_domain.model.ai_provider import AIModel
+from src.a_domain.model.message import Message, MessageRole
+from src.a_domain.types.enums import AiProvider
+from src.c_infrastructure.services.token_counter_service import TokenCounterService
+
+_OPENAI = AIModel(provider=AiProvider.OPENAI, name="gpt-test")
+_GEMINI = AIModel(provider=AiProvider.GEMINI, name="gemini-test")
+
+
+def test_non_openai_models_use_the_heuristic(logger):
+    counter = TokenCounterService(logger)
+    message = Message(role=MessageRole.USER, content="你好" + "a" * 8)
+
+    # Two CJK characters, eight other characters at four per token, plus the per-message overhead.
+    assert counter.count_message(message, _GEMINI) == 2 + 2 + TokenCounterService._MESSAGE_OVERHEAD
+
+
+def test_an_encoding_that_cannot_be_loaded_falls_back_to_the_heuristic_once(logger, monkeypatch):
+    calls = 0
+
+    def unavailable(name):
+        nonlocal calls
+        calls += 1
+        raise ConnectionError("offline")
+
+    monkeypatch.setattr(tiktoken, "encoding_for_model", lambda name: unavailable(name))
+    monkeypatch.setattr(tiktoken, "get_encoding", unavailable)
+    counter = TokenCounterService(logger)
+
+    for content in ("a" * 8, "b" * 8):
+        message = Message(role=MessageRole.USER, content=content)
+        assert counter.count_message(message, _OPENAI) == 2 + TokenCounterService._MESSAGE_OVERHEAD
+    assert calls == 1
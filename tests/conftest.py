@@ -0,0 +1,39 @@
+import pytest
+
+from src.a_domain.ports.notification.logging_port import ILoggingPort
+from src.b_application.configuration.schemas import AppConfig
+from src.c_infrastructure.config.loader import load_settings
+
+
+class NullLogger(ILoggingPort):
+    def info(self, message: str): ...
+
+    def warning(self, message: str): ...
+
+    def debug(self, message: str): ...
+
+    def critical(self, message: str): ...
+
+    def error(self, message: str): ...
+
+    def success(self, message: str): ...
+
+    def trace(self, message: str): ...
+
+    def exception(self, message: str): ...
+
+
+@pytest.fixture
+def logger() -> ILoggingPort:
+    return NullLogger()
+
+
+@pytest.fixture
+def settings(tmp_path) -> AppConfig:
+    return load_settings().model_copy(
+        update={
+            "chroma_persist_path": str(tmp_path / "chroma"),
+            "sqlite_repository_path": str(tmp_path / "conversations.sqlite3"),
+            "conversation_history_limit": 10,
+        }
+    )